@@ -0,0 +1,83 @@
+"""
+Auth overhead per request: claims parsed per dependency vs `CurrentPrincipal`.
+
+A record-scoped route resolves `verify_jwt_token`, `get_account_id` and often
+`get_user_id`/`check_self`. Previously each parsed the token again; now they
+share the `Principal` verified once and cached on `request.state`.
+
+    python -m benchmarks.auth_overhead [-n 20000]
+
+Needs the token store (Redis) that the API uses; one token is created there.
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from jose import jwt
+from jose.constants import ALGORITHMS
+from starlette.requests import Request
+
+from medrekk.admin.db.token import token_store
+from medrekk.admin.schemas.accounts import UserRead
+from medrekk.common.utils.auth import (
+    check_self,
+    expire_token,
+    generate_access_token,
+    get_account_id,
+    get_current_principal,
+    get_user_id,
+    verify_jwt_token,
+)
+from medrekk.common.utils.constants import JWT_KEY
+
+
+async def per_dependency(token: str) -> None:
+    # What the four dependencies did before: each parsed the token itself.
+    unverified = jwt.get_unverified_claims(token)
+    aud = await token_store.get_token(jti=unverified["jti"])
+    jwt.decode(token, JWT_KEY, algorithms=ALGORITHMS.HS256, audience=aud)
+    jwt.get_unverified_claims(token)["sub"].split(",")[1]
+    jwt.get_unverified_claims(token)["sub"].split(",")[0]
+    jwt.get_unverified_claims(token).get("sub")
+
+
+async def current_principal(token: str) -> None:
+    request = Request({"type": "http", "headers": []})
+    principal = await get_current_principal(request, token)
+    verify_jwt_token(principal)
+    get_account_id(await get_current_principal(request, token))
+    user_id = get_user_id(await get_current_principal(request, token))
+    check_self(await get_current_principal(request, token), user_id)
+
+
+async def run(n: int) -> None:
+    await token_store.open()
+    user = UserRead.model_construct(id="benchmark", account_id="benchmark")
+    token = await generate_access_token(user)
+
+    try:
+        for name, func in (
+            ("per dependency", per_dependency),
+            ("principal", current_principal),
+        ):
+            start = perf_counter()
+            for _ in range(n):
+                await func(token)
+            seconds = perf_counter() - start
+            print(f"{name:>15}: {seconds / n * 1e6:8.1f} us/request")
+    finally:
+        await expire_token(token)
+        await token_store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=20000, help="simulated requests")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Readings per second: one create per reading vs `create_many`.
+
+Inserts blood pressure readings on a scratch record through
+`bloodpressure_repository.create` (one INSERT and COMMIT each) and through
+`bloodpressure_repository.create_many` (one multi-row INSERT and COMMIT per
+batch).
+
+    python -m benchmarks.batch_ingest [-n 5000] [--batch-size 500]
+
+Uses the database configured in `medrekk/common/database/db_const.py`. The
+scratch record and its rows are deleted afterwards.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import delete
+
+from medrekk.common.database.connection import SessionLocal
+from medrekk.common.models.patient import PatientBloodPressure, PatientRecord
+from medrekk.common.utils import shortid
+from medrekk.mrs.controllers.bloodpressure import bloodpressure_repository
+from medrekk.mrs.schemas.patients import PatientBloodPressureCreate
+
+
+def readings(start: datetime, n: int):
+    return [
+        PatientBloodPressureCreate(
+            dt_measured=start + timedelta(seconds=i),
+            systolic=120,
+            diastolic=80,
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=5000, help="readings per run")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    record_id = shortid()
+    with SessionLocal() as db:
+        db.add(PatientRecord(id=record_id, chief_complaint=["benchmark"]))
+        db.commit()
+
+    try:
+        with SessionLocal() as db:
+            data = readings(datetime(2000, 1, 1), args.n)
+            start = perf_counter()
+            for item in data:
+                bloodpressure_repository.create(record_id, item, db)
+            single = perf_counter() - start
+
+            data = readings(datetime(2001, 1, 1), args.n)
+            start = perf_counter()
+            for i in range(0, args.n, args.batch_size):
+                bloodpressure_repository.create_many(
+                    record_id, data[i : i + args.batch_size], db
+                )
+            batched = perf_counter() - start
+
+        print(f"  single: {args.n / single:10.0f} readings/s")
+        print(f" batched: {args.n / batched:10.0f} readings/s ({single / batched:.1f}x)")
+    finally:
+        with SessionLocal() as db:
+            db.execute(
+                delete(PatientBloodPressure).where(
+                    PatientBloodPressure.record_id == record_id
+                )
+            )
+            db.execute(delete(PatientRecord).where(PatientRecord.id == record_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Login throughput and event-loop latency under a login storm.
+
+Fires `--concurrency` password checks at a time for `--seconds` seconds:
+
+    inline: bcrypt on the event loop, as `add_user` used to hash.
+    pool:   `password_hasher.verify`, the bounded bcrypt pool (503 when full).
+
+Meanwhile a ticker stands in for clinical traffic: it wakes every 10 ms and
+records how late it was. Reports verifications/s, rejected calls and the
+ticker's p50/p99/max lag.
+
+    python -m benchmarks.login_throughput [--concurrency 64] [--seconds 5]
+
+Cost and pool size come from MEDREKK_BCRYPT_ROUNDS, MEDREKK_HASH_WORKERS and
+MEDREKK_HASH_MAX_PENDING. No database or Redis is needed.
+"""
+
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from fastapi import HTTPException
+
+from medrekk.common.utils.hashing import hash_password, password_hasher, verify_password
+
+TICK = 0.01
+
+
+async def ticker(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(perf_counter() - start - TICK)
+
+
+async def storm(check, hashed: str, concurrency: int, seconds: float) -> dict:
+    stop = asyncio.Event()
+    lags: list = []
+    counts = {"verified": 0, "rejected": 0}
+
+    async def client() -> None:
+        while not stop.is_set():
+            try:
+                await check(hashed, "password")
+                counts["verified"] += 1
+                # A request handler yields at least once per request.
+                await asyncio.sleep(0)
+            except HTTPException:
+                counts["rejected"] += 1
+                await asyncio.sleep(0.05)
+
+    tick = asyncio.create_task(ticker(stop, lags))
+    clients = [asyncio.create_task(client()) for _ in range(concurrency)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(tick, *clients)
+
+    lags.sort()
+    return {
+        "verified/s": counts["verified"] / seconds,
+        "rejected": counts["rejected"],
+        "lag p50 ms": statistics.median(lags) * 1000 if lags else float("nan"),
+        "lag p99 ms": lags[int(len(lags) * 0.99)] * 1000 if lags else float("nan"),
+        "lag max ms": lags[-1] * 1000 if lags else float("nan"),
+    }
+
+
+async def inline_verify(hashed: str, password: str) -> bool:
+    return verify_password(hashed, password)
+
+
+async def run(concurrency: int, seconds: float) -> None:
+    hashed = hash_password("password")
+    for name, check in (("inline", inline_verify), ("pool", password_hasher.verify)):
+        result = await storm(check, hashed, concurrency, seconds)
+        print(f"{name:>7}: " + ", ".join(f"{k} {v:.1f}" for k, v in result.items()))
+    password_hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.concurrency, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Latency of `GET /patients/search` at platform scale.
+
+Seeds `-n` synthetic profiles spread over `--accounts` scratch accounts, then
+times `search_patients` in one account for prefix, full-name, accented and
+misspelt queries, and prints p50/p99 per query plus the plan of the first
+one (it should be a bitmap scan on idx_patient_profile_search).
+
+    python -m benchmarks.patient_search [-n 1000000] [--accounts 10] [--repeat 50]
+
+Uses the database configured in `medrekk/common/database/db_const.py`. The
+scratch accounts and their profiles are deleted afterwards.
+"""
+
+import argparse
+import random
+import statistics
+from datetime import date
+from time import perf_counter
+
+from sqlalchemy import delete, insert, text
+
+from medrekk.common.database.connection import SessionLocal
+from medrekk.common.models.medrekk import MedRekkAccount
+from medrekk.common.models.patient import PatientProfile
+from medrekk.common.utils import shortid
+from medrekk.common.utils.text import normalize_name
+from medrekk.mrs.controllers.profile import SEARCH_LIMIT, search_patients
+
+LASTNAMES = [
+    "Dela Cruz", "Santos", "Reyes", "García", "Mendoza", "Bautista", "Villanueva",
+    "Ramos", "Castillo", "Peña", "Aquino", "Navarro", "Fernández", "Torres",
+    "Domingo", "Gonzales", "Lopez", "Ocampo", "Pascual", "Salazar",
+]
+FIRSTNAMES = [
+    "Juan", "José", "María", "Ana", "Mark", "Angelica", "John Paul", "Kristine",
+    "Ramon", "Lourdes", "Niño", "Rosario", "Carlo", "Jasmine", "Miguel", "Liza",
+]
+# Made-up surnames keep the name space wide, as in a real registry.
+SYLLABLES = ["ba", "ca", "da", "ga", "la", "ma", "na", "pa", "ra", "sa", "ta", "yo"]
+QUERIES = ["dela", "Santos Maria", "pena nino", "Villanuva", "fernandez jose"]
+
+BATCH = 5000
+
+
+def seed(account_ids: list[str], n: int) -> None:
+    rng = random.Random(0)
+    with SessionLocal() as db:
+        db.execute(
+            insert(MedRekkAccount),
+            [
+                {
+                    "id": account_id,
+                    "account_name": account_id,
+                    "account_subdomain": account_id,
+                }
+                for account_id in account_ids
+            ],
+        )
+        for start in range(0, n, BATCH):
+            rows = []
+            for _ in range(min(BATCH, n - start)):
+                if rng.random() < 0.3:
+                    lastname = rng.choice(LASTNAMES)
+                else:
+                    lastname = "".join(rng.choices(SYLLABLES, k=4)).title()
+                firstname = rng.choice(FIRSTNAMES)
+                middlename = rng.choice(LASTNAMES)
+                rows.append(
+                    {
+                        "id": shortid(),
+                        "account_id": rng.choice(account_ids),
+                        "lastname": lastname,
+                        "firstname": firstname,
+                        "middlename": middlename,
+                        "search_name": normalize_name(lastname, firstname, middlename),
+                        "birthdate": date(1980, 1, 1),
+                        "address_country": "Philippines",
+                        "address_province": "-",
+                        "address_city": "-",
+                        "address_barangay": "-",
+                        "address_line1": "-",
+                        "religion": "-",
+                    }
+                )
+            db.execute(insert(PatientProfile), rows)
+        db.commit()
+        db.execute(text("ANALYZE patient_profile"))
+        db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=1_000_000, help="profiles to seed")
+    parser.add_argument("--accounts", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    account_ids = [shortid() for _ in range(args.accounts)]
+    try:
+        start = perf_counter()
+        seed(account_ids, args.n)
+        print(f"seeded {args.n} profiles in {perf_counter() - start:.0f}s")
+
+        with SessionLocal() as db:
+            for q in QUERIES:
+                timings = []
+                for _ in range(args.repeat):
+                    start = perf_counter()
+                    found = search_patients(account_ids[0], q, SEARCH_LIMIT, db)
+                    timings.append(perf_counter() - start)
+                timings.sort()
+                print(
+                    f"{q!r:>18}: {len(found):2d} hits, "
+                    f"p50 {statistics.median(timings) * 1000:6.1f} ms, "
+                    f"p99 {timings[int(len(timings) * 0.99)] * 1000:6.1f} ms"
+                )
+
+            term = normalize_name(QUERIES[0])
+            plan = db.execute(
+                text(
+                    "EXPLAIN SELECT id FROM patient_profile "
+                    "WHERE account_id = :account_id "
+                    "AND (search_name LIKE :pattern OR :term <% search_name)"
+                ),
+                {"account_id": account_ids[0], "pattern": f"%{term}%", "term": term},
+            ).scalars()
+            print("\n".join(plan))
+    finally:
+        with SessionLocal() as db:
+            db.execute(
+                delete(PatientProfile).where(PatientProfile.account_id.in_(account_ids))
+            )
+            db.execute(delete(MedRekkAccount).where(MedRekkAccount.id.in_(account_ids)))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Chart load: one controller call per section vs `read_patient_summary`.
+
+Seeds a scratch patient with every chart section, then loads the chart
+`--repeat` times the way the front end does today (the profile, each history
+and each time series through its own controller, 13 calls) and through
+`read_patient_summary`, and reports statements and wall time per chart. Over
+HTTP, each call of the fan-out also pays its own request and JWT check.
+
+    python -m benchmarks.patient_summary [--repeat 200] [--series 50]
+
+Uses the database configured in `medrekk/common/database/db_const.py`. The
+scratch account, patient and rows are deleted afterwards.
+"""
+
+import argparse
+from datetime import date, timedelta
+from time import perf_counter
+
+from sqlalchemy import delete, insert
+
+from benchmarks.write_round_trips import StatementCounter
+from medrekk.common.database.connection import SessionLocal
+from medrekk.common.models.medrekk import MedRekkAccount
+from medrekk.common.models.patient import (
+    PatientAllergy,
+    PatientBodyMassIndex,
+    PatientBodyWeight,
+    PatientFamilyHistory,
+    PatientHeight,
+    PatientHospitalizationHistory,
+    PatientImmunization,
+    PatientMedicalHistory,
+    PatientMedication,
+    PatientOBHistory,
+    PatientProfile,
+    PatientRecord,
+    PatientSurgicalHistory,
+)
+from medrekk.common.utils import shortid
+from medrekk.common.utils.pagination import PageParams
+from medrekk.mrs.controllers.allergy import allergy_repository
+from medrekk.mrs.controllers.bmi import bmi_repository
+from medrekk.mrs.controllers.body_weight import bodyweight_repository
+from medrekk.mrs.controllers.family_history import family_history_repository
+from medrekk.mrs.controllers.height import height_repository
+from medrekk.mrs.controllers.hospitalization_history import (
+    hospitalization_history_repository,
+)
+from medrekk.mrs.controllers.immunization import immunization_repository
+from medrekk.mrs.controllers.medical_history import medical_history_repository
+from medrekk.mrs.controllers.medication import medication_repository
+from medrekk.mrs.controllers.ob_history import ob_history_repository
+from medrekk.mrs.controllers.profile import read_patient
+from medrekk.mrs.controllers.record import read_records
+from medrekk.mrs.controllers.summary import SUMMARY_LIMIT, read_patient_summary
+from medrekk.mrs.controllers.surgical_history import surgical_history_repository
+
+CHILD_MODELS = [
+    PatientFamilyHistory,
+    PatientMedicalHistory,
+    PatientOBHistory,
+    PatientHospitalizationHistory,
+    PatientSurgicalHistory,
+    PatientMedication,
+    PatientAllergy,
+    PatientImmunization,
+    PatientBodyWeight,
+    PatientHeight,
+    PatientBodyMassIndex,
+    PatientRecord,
+]
+
+
+def seed(account_id: str, patient_id: str, series: int) -> None:
+    day = date(2020, 1, 1)
+    with SessionLocal() as db:
+        db.execute(
+            insert(MedRekkAccount).values(
+                id=account_id, account_name=account_id, account_subdomain=account_id
+            )
+        )
+        db.execute(
+            insert(PatientProfile).values(
+                id=patient_id,
+                account_id=account_id,
+                lastname="benchmark",
+                firstname="patient",
+                birthdate=day,
+                address_country="Philippines",
+                address_province="-",
+                address_city="-",
+                address_barangay="-",
+                address_line1="-",
+                religion="-",
+            )
+        )
+        for model in (PatientFamilyHistory, PatientMedicalHistory):
+            db.execute(insert(model).values(patient_id=patient_id, hypertension=True))
+        db.execute(insert(PatientOBHistory).values(patient_id=patient_id, gravida=1))
+        for i in range(5):
+            when = day + timedelta(days=30 * i)
+            db.execute(
+                insert(PatientHospitalizationHistory).values(
+                    patient_id=patient_id, chief_complaint="fever", admission_date=when
+                )
+            )
+            db.execute(
+                insert(PatientSurgicalHistory).values(
+                    patient_id=patient_id, chief_complaint="appendix", surgery_date=when
+                )
+            )
+            db.execute(
+                insert(PatientMedication).values(
+                    patient_id=patient_id, medication="paracetamol", start_date=when
+                )
+            )
+            db.execute(
+                insert(PatientAllergy).values(patient_id=patient_id, allergen="dust")
+            )
+            db.execute(
+                insert(PatientImmunization).values(
+                    patient_id=patient_id, vaccine="bcg", date_administered=when
+                )
+            )
+        days = [day + timedelta(days=i) for i in range(series)]
+        for model, field, value in (
+            (PatientBodyWeight, "body_weight", 70),
+            (PatientHeight, "height", 170),
+            (PatientBodyMassIndex, "bmi", 24.2),
+        ):
+            rows = [
+                {"patient_id": patient_id, "date_measured": d, field: value} for d in days
+            ]
+            db.execute(insert(model), rows)
+        db.execute(
+            insert(PatientRecord),
+            [
+                {
+                    "account_id": account_id,
+                    "patient_id": patient_id,
+                    "chief_complaint": ["cough"],
+                }
+                for _ in range(series)
+            ],
+        )
+        db.commit()
+
+
+def fan_out(account_id: str, patient_id: str, db) -> None:
+    page = PageParams(limit=SUMMARY_LIMIT)
+    read_patient(account_id, patient_id, db)
+    for repository in (
+        family_history_repository,
+        medical_history_repository,
+        ob_history_repository,
+    ):
+        repository.read(patient_id, db)
+    for repository in (
+        hospitalization_history_repository,
+        surgical_history_repository,
+        medication_repository,
+        allergy_repository,
+        immunization_repository,
+        bodyweight_repository,
+        height_repository,
+        bmi_repository,
+    ):
+        repository.read_all(patient_id, page, db)
+    read_records(account_id, patient_id, page, db)
+
+
+def summary(account_id: str, patient_id: str, db) -> None:
+    read_patient_summary(account_id, patient_id, None, SUMMARY_LIMIT, db)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="charts per pattern")
+    parser.add_argument("--series", type=int, default=50, help="rows per time series")
+    args = parser.parse_args()
+
+    counter = StatementCounter()
+    account_id, patient_id = shortid(), shortid()
+    try:
+        seed(account_id, patient_id, args.series)
+
+        for name, load in (("fan-out", fan_out), ("summary", summary)):
+            with SessionLocal() as db:
+                load(account_id, patient_id, db)
+                counter.count = 0
+                start = perf_counter()
+                for _ in range(args.repeat):
+                    load(account_id, patient_id, db)
+                    db.rollback()
+                elapsed = perf_counter() - start
+            print(
+                f"{name:>8}: {counter.count / args.repeat:.1f} stmt, "
+                f"{elapsed / args.repeat * 1000:.2f} ms per chart"
+            )
+    finally:
+        with SessionLocal() as db:
+            for model in CHILD_MODELS:
+                db.execute(delete(model).where(model.patient_id == patient_id))
+            db.execute(delete(PatientProfile).where(PatientProfile.id == patient_id))
+            db.execute(delete(MedRekkAccount).where(MedRekkAccount.id == account_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Vitals inserts and range queries, without and with the optional BRIN index.
+
+The BRIN index is the one `alembic -x vitals_index=brin` adds (migration
+0004). Inserts synthetic heart rate readings, in about dt_measured order,
+into two scratch tables shaped like `patient_heart_rate`. Both have the
+primary key, the (record_id, dt_measured) unique constraint and the
+(record_id, dt_measured, id) B-tree; the second also has the BRIN
+(dt_measured, created) index. The tables are not partitioned, so the indexes are compared on a
+table the size of a busy month.
+
+Reports readings per second, index sizes, and p50/p99 latencies of:
+
+  - a page of one record's readings in a week (`read_range`);
+  - the readings of every record in an hour (exports, reports).
+
+    python -m benchmarks.vitals_index [-n 500000] [--records 2000]
+
+Uses the database configured in `medrekk/common/database/db_const.py`. The
+scratch tables are dropped afterwards.
+"""
+
+import argparse
+import random
+import statistics
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import (
+    SMALLINT,
+    Column,
+    DateTime,
+    Index,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    func,
+    insert,
+    text,
+)
+
+from medrekk.common.database.connection import SessionLocal, engine
+from medrekk.common.utils import shortid
+
+LAYOUTS = ("btree", "brin")
+# As migration 0004.
+BRIN_PAGES_PER_RANGE = 32
+START = datetime(2024, 1, 1)
+# Seconds between readings, and how late one may arrive.
+INTERVAL = 10
+JITTER = 600
+
+metadata = MetaData()
+
+
+def scratch_table(layout: str) -> Table:
+    name = f"bench_vitals_{layout}"
+    table = Table(
+        name,
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("record_id", String, nullable=False),
+        Column("dt_measured", DateTime, primary_key=True),
+        Column("heart_rate", SMALLINT),
+        Column("created", DateTime, server_default=func.now()),
+        UniqueConstraint("record_id", "dt_measured"),
+    )
+    Index(f"{name}_record_dt", table.c.record_id, table.c.dt_measured, table.c.id)
+    if layout == "brin":
+        Index(
+            f"{name}_dt",
+            table.c.dt_measured,
+            table.c.created,
+            postgresql_using="brin",
+            postgresql_with={
+                "pages_per_range": BRIN_PAGES_PER_RANGE,
+                "autosummarize": "on",
+            },
+        )
+    return table
+
+
+def readings(rng: random.Random, record_ids: list, start: int, n: int) -> list:
+    # The microseconds keep (record_id, dt_measured) unique despite the jitter.
+    return [
+        {
+            "id": shortid(),
+            "record_id": rng.choice(record_ids),
+            "dt_measured": START
+            + timedelta(
+                seconds=i * INTERVAL - rng.randint(0, JITTER),
+                microseconds=i % 1_000_000,
+            ),
+            "heart_rate": rng.randint(50, 120),
+        }
+        for i in range(start, start + n)
+    ]
+
+
+def seed(table: Table, record_ids: list, n: int, batch_size: int) -> float:
+    """
+    Inserts `n` readings, one commit per batch. Returns readings per second.
+    """
+    rng = random.Random(0)
+    elapsed = 0.0
+    with SessionLocal() as db:
+        for start in range(0, n, batch_size):
+            rows = readings(rng, record_ids, start, min(batch_size, n - start))
+            begin = perf_counter()
+            db.execute(insert(table), rows)
+            db.commit()
+            elapsed += perf_counter() - begin
+    # Summarises the BRIN ranges autosummarize has not reached yet, and
+    # gives both tables fresh statistics and visibility maps.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"VACUUM ANALYZE {table.name}"))
+    return n / elapsed
+
+
+def index_sizes(table: Table) -> dict:
+    with SessionLocal() as db:
+        return dict(
+            db.execute(
+                text(
+                    "SELECT indexrelid::regclass::text, pg_relation_size(indexrelid) "
+                    "FROM pg_index WHERE indrelid = to_regclass(:table) ORDER BY 1"
+                ),
+                {"table": table.name},
+            ).all()
+        )
+
+
+def time_query(query, params: list) -> list:
+    timings = []
+    with SessionLocal() as db:
+        for values in params:
+            start = perf_counter()
+            db.execute(query, values).all()
+            timings.append(perf_counter() - start)
+    timings.sort()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=500_000, help="readings per table")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    record_ids = [shortid() for _ in range(args.records)]
+    span = args.n * INTERVAL
+    rng = random.Random(1)
+    page_params = [
+        {
+            "record_id": rng.choice(record_ids),
+            "start": START + timedelta(seconds=rng.randint(0, span)),
+        }
+        for _ in range(args.repeat)
+    ]
+    hour_params = [
+        {"start": START + timedelta(seconds=rng.randint(0, span))}
+        for _ in range(args.repeat)
+    ]
+
+    tables = [scratch_table(layout) for layout in LAYOUTS]
+    try:
+        metadata.create_all(engine)
+        for table in tables:
+            rate = seed(table, record_ids, args.n, args.batch_size)
+            print(f"{table.name}: {rate:8.0f} readings/s")
+            for name, size in index_sizes(table).items():
+                print(f"  {name:>40}: {size / 2**20:8.2f} MiB")
+
+            queries = {
+                "record page": (
+                    text(
+                        f"SELECT * FROM {table.name} "
+                        "WHERE record_id = :record_id AND dt_measured >= :start "
+                        "AND dt_measured < CAST(:start AS timestamp) + interval '7 days' "
+                        "ORDER BY dt_measured DESC, id DESC LIMIT 10"
+                    ),
+                    page_params,
+                ),
+                "hour, all records": (
+                    text(
+                        f"SELECT * FROM {table.name} WHERE dt_measured >= :start "
+                        "AND dt_measured < CAST(:start AS timestamp) + interval '1 hour'"
+                    ),
+                    hour_params,
+                ),
+            }
+            for label, (query, params) in queries.items():
+                timings = time_query(query, params)
+                print(
+                    f"  {label:>40}: "
+                    f"p50 {statistics.median(timings) * 1000:6.2f} ms, "
+                    f"p99 {timings[int(len(timings) * 0.99)] * 1000:6.2f} ms"
+                )
+    finally:
+        metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Round trips per write: add/commit/refresh vs INSERT/UPDATE ... RETURNING.
+
+Creates and updates blood pressure rows on a scratch record, once the way the
+controllers used to (ORM add + commit + refresh, SELECT before UPDATE) and once
+through `CRUDRepository`, and reports statements and wall time per write.
+
+    python -m benchmarks.write_round_trips [-n 500]
+
+Uses the database configured in `medrekk/common/database/db_const.py`. The
+scratch record and its rows are deleted afterwards.
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from sqlalchemy import delete, event
+
+from medrekk.common.database.connection import SessionLocal, engine
+from medrekk.common.models.patient import PatientBloodPressure, PatientRecord
+from medrekk.common.utils import shortid
+from medrekk.mrs.controllers.bloodpressure import bloodpressure_repository
+from medrekk.mrs.schemas.patients import (
+    PatientBloodPressureCreate,
+    PatientBloodPressureUpdate,
+)
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def _on_commit(self, conn):
+        # COMMIT is a round trip of its own.
+        self.count += 1
+
+
+def legacy_create(record_id, data, db):
+    item = PatientBloodPressure(**data.model_dump())
+    item.record_id = record_id
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def legacy_update(record_id, item_id, data, db):
+    item = (
+        db.query(PatientBloodPressure)
+        .filter(PatientBloodPressure.record_id == record_id)
+        .filter(PatientBloodPressure.id == item_id)
+        .one_or_none()
+    )
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(item, field, value)
+    db.add(item)
+    db.commit()
+    db.refresh(item)
+    return item
+
+
+def run(name, create, update, record_id, n, counter):
+    start_dt = datetime(2000, 1, 1) + timedelta(days=365 * (name == "returning"))
+    with SessionLocal() as db:
+        counter.count = 0
+        start = perf_counter()
+        ids = []
+        for i in range(n):
+            data = PatientBloodPressureCreate(
+                dt_measured=start_dt + timedelta(minutes=i),
+                systolic=120,
+                diastolic=80,
+            )
+            ids.append(create(record_id, data, db).id)
+        create_time = perf_counter() - start
+        create_statements = counter.count
+
+        counter.count = 0
+        start = perf_counter()
+        for i, item_id in enumerate(ids):
+            data = PatientBloodPressureUpdate(
+                dt_measured=start_dt + timedelta(minutes=i),
+                systolic=130,
+                diastolic=85,
+            )
+            update(record_id, item_id, data, db)
+        update_time = perf_counter() - start
+        update_statements = counter.count
+
+    print(
+        f"{name:>10}  create: {create_statements / n:.1f} stmt, "
+        f"{create_time / n * 1000:.2f} ms  "
+        f"update: {update_statements / n:.1f} stmt, "
+        f"{update_time / n * 1000:.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", type=int, default=500, help="writes per pattern")
+    args = parser.parse_args()
+
+    counter = StatementCounter()
+    record_id = shortid()
+    with SessionLocal() as db:
+        db.add(PatientRecord(id=record_id, chief_complaint=["benchmark"]))
+        db.commit()
+
+    try:
+        run("legacy", legacy_create, legacy_update, record_id, args.n, counter)
+        run(
+            "returning",
+            bloodpressure_repository.create,
+            bloodpressure_repository.update,
+            record_id,
+            args.n,
+            counter,
+        )
+    finally:
+        with SessionLocal() as db:
+            db.execute(
+                delete(PatientBloodPressure).where(
+                    PatientBloodPressure.record_id == record_id
+                )
+            )
+            db.execute(delete(PatientRecord).where(PatientRecord.id == record_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
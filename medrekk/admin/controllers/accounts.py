@@ -1,16 +1,16 @@
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import Session
 
 from medrekk.admin.controllers.users import add_account_user
 from medrekk.admin.schemas.accounts import AccountCreate, AccountRead, UserCreate
 from medrekk.common.models import MedRekkAccount
-from medrekk.common.models.medrekk import MedRekkUser
-from medrekk.common.utils import shortid
+from medrekk.common.models.medrekk import MedRekkUser, medrekk_account_user_assoc
 
 
 def create_account(
     account: AccountCreate,
+    hashed_password: str,
     db: Session,
 ) -> AccountRead:
     # split() removes extra spaces in between words.
@@ -35,26 +35,33 @@ def create_account(
             },
         )
 
-    new_account = MedRekkAccount(
-        account_name=account_name,
-        account_subdomain="-".join(account_name.lower().split()),
-        id=shortid(),
+    account_id = db.scalar(
+        insert(MedRekkAccount)
+        .values(
+            account_name=account_name,
+            account_subdomain="-".join(account_name.lower().split()),
+        )
+        .returning(MedRekkAccount.id)
     )
 
-    db.add(new_account)
-    db.commit()
-    db.refresh(new_account)
-
     user_create = UserCreate(username=account.user_name, password=account.password)
 
-    new_user = add_account_user(new_account.id, user_create, db)
-
-    new_account.owner_id = new_user.id
-    new_account.users.append(new_user)
+    # Commits the account together with its first user.
+    new_user = add_account_user(account_id, user_create, hashed_password, db)
 
-    db.add(new_account)
+    db.execute(
+        insert(medrekk_account_user_assoc).values(
+            user_id=new_user.id,
+            account_id=account_id,
+        )
+    )
+    new_account = db.scalar(
+        update(MedRekkAccount)
+        .where(MedRekkAccount.id == account_id)
+        .values(owner_id=new_user.id)
+        .returning(MedRekkAccount)
+    )
     db.commit()
-    db.refresh(new_account)
 
     return new_account
 
@@ -81,4 +88,5 @@ def read_account_from_host(host: str, user_id, db: Session):
         db.query(MedRekkAccount)
         .filter(MedRekkAccount.account_subdomain == host.split(".")[0])
         .filter(MedRekkAccount.users.any(MedRekkUser.id == user_id))
+        .first()
     )
@@ -1,26 +1,74 @@
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from medrekk.admin.controllers.accounts import read_account, read_account_from_host
-from medrekk.admin.controllers.users import read_user_by_username
-from medrekk.admin.schemas.token import Token
-from medrekk.common.utils.auth import generate_access_token, verify_password
+from medrekk.admin.controllers.users import username_not_found
+from medrekk.admin.db.login import login_guard
+from medrekk.common.database.connection import run_controller
+from medrekk.common.models.medrekk import MedRekkAccount, MedRekkUser
+from medrekk.common.utils.auth import generate_access_token
+from medrekk.common.utils.hashing import password_hasher
 
 
-def authenticate_user(
+def read_login_user(
     host: str,
-    form_data: OAuth2PasswordRequestForm,
+    username: str,
     db: Session,
-) -> str:
-    user = read_user_by_username(form_data.username, db)
+) -> tuple[MedRekkUser, MedRekkAccount] | None:
+    """
+    Returns the user and the account to sign in to, or None if there is no
+    user with that username.
+    """
+    user = db.query(MedRekkUser).filter(MedRekkUser.username == username).one_or_none()
+    if not user:
+        return None
+
     if host.startswith("medrekk.com"):
         account = read_account(user.account_id, user.id, db)
     else:
         account = read_account_from_host(host, user.id, db)
-    access_token = generate_access_token(user, account)
 
-    if not verify_password(user.password, form_data.password):
+    return user, account
+
+
+async def authenticate_user(
+    host: str,
+    client_ip: str,
+    form_data: OAuth2PasswordRequestForm,
+    db: Session | AsyncSession,
+) -> str:
+    """
+    Returns a new access token if the credentials are valid.
+
+    Cheapest checks first:
+
+        1. token buckets per username and per client IP (429),
+        2. usernames recently found not to exist (404, no database query),
+        3. the database lookup,
+        4. bcrypt on `password_hasher`'s bounded pool (503 when saturated).
+
+    The token is only minted and stored once the password has been verified.
+    """
+    await login_guard.take(form_data.username, client_ip)
+
+    if await login_guard.is_unknown(form_data.username):
+        raise username_not_found(form_data.username)
+
+    login = await run_controller(
+        read_login_user,
+        host,
+        form_data.username,
+        db=db,
+    )
+    if login is None:
+        await login_guard.remember_unknown(form_data.username)
+        raise username_not_found(form_data.username)
+
+    user, account = login
+
+    if not await password_hasher.verify(user.password, form_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -32,4 +80,5 @@ def authenticate_user(
             },
             headers={"WWW-Authenticate": "Basic"},
         )
-    return access_token
+
+    return await generate_access_token(user, account)
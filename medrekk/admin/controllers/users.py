@@ -1,19 +1,18 @@
-from typing import List
-
 from fastapi import HTTPException, status
 from psycopg.errors import UniqueViolation
+from sqlalchemy import delete, insert, update
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from medrekk.common.models.medrekk import MedRekkUser
 from medrekk.admin.schemas.accounts import UserCreate, UserUpdate
-from medrekk.common.utils import shortid
-from medrekk.common.utils.auth import hash_password
+from medrekk.common.utils.pagination import PageParams, keyset_paginate
 
 
 def add_account_user(
     account_id: str,
     user_form_data: UserCreate,
+    hashed_password: str,
     db: Session,
 ) -> MedRekkUser:
     """
@@ -23,6 +22,8 @@ def add_account_user(
 
         user_create: UserCreate
             object for the request.
+        hashed_password: str
+            bcrypt hash of the password, from `password_hasher.hash`.
         db: Session
             Database session
     """
@@ -30,20 +31,20 @@ def add_account_user(
     try:
         # Test if username provided is an email.
         # User pydantic's EmailStr data-type for validation.
-        hashed_password = hash_password(user_form_data.password.get_secret_value())
-        user = MedRekkUser(
-            id=shortid(),
-            username=user_form_data.username,
-            password=hashed_password,
-            account_id=account_id,
+        user = db.scalar(
+            insert(MedRekkUser)
+            .values(
+                username=user_form_data.username,
+                password=hashed_password,
+                account_id=account_id,
+            )
+            .returning(MedRekkUser)
         )
-
-        db.add(user)
         db.commit()
-        db.refresh(user)
 
         return user
     except DBAPIError as e:
+        db.rollback()
         # sqlstate = e.orig.sqlstate
         # if sqlstate == "23505":
         if isinstance(e.orig, UniqueViolation):
@@ -52,7 +53,7 @@ def add_account_user(
                 detail={
                     "status_code": status.HTTP_409_CONFLICT,
                     "content": {
-                        "msg": f"Username {user.username} is already used.",
+                        "msg": f"Username {user_form_data.username} is already used.",
                         "loc": "username",
                     },
                 },
@@ -96,7 +97,11 @@ def read_user_by_username(
     if user:
         return user
 
-    raise HTTPException(
+    raise username_not_found(username)
+
+
+def username_not_found(username: str) -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
         detail={
             "status_code": status.HTTP_404_NOT_FOUND,
@@ -108,30 +113,48 @@ def read_user_by_username(
     )
 
 
-def read_users(account_id: str, db: Session) -> List[MedRekkUser]:
-    # select_stmt = select(MedRekkUser)
-    # users = db.scalars(select_stmt).all()
-    users = db.query(MedRekkUser).filter(MedRekkUser.account_id == account_id).all()
-    return users
+def read_users(account_id: str, page: PageParams, db: Session) -> dict:
+    return keyset_paginate(
+        db.query(MedRekkUser).filter(MedRekkUser.account_id == account_id),
+        MedRekkUser,
+        page,
+    )
 
 
 def update_user(account_id: str, user_id: str, user: UserUpdate, db: Session):
-    db_user = read_user(account_id, user_id, db)
+    values = user.model_dump(exclude_unset=True)
+    if not values:
+        # An UPDATE with an empty SET clause can't be built.
+        return read_user(account_id, user_id, db)
+
+    db_user = db.scalar(
+        update(MedRekkUser)
+        .where(MedRekkUser.account_id == account_id)
+        .where(MedRekkUser.id == user_id)
+        .values(**values)
+        .returning(MedRekkUser)
+    )
+    db.commit()
 
-    for field, value in user.model_dump(exclude_unset=True).items():
-        setattr(db_user, field, value)
+    if not db_user:
+        return read_user(account_id, user_id, db)
 
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
     return db_user
 
 
 def delete_user(account_id: str, user_id: str, db: Session):
-    db_user = read_user(account_id, user_id, db)
-    db.delete(db_user)
+    deleted_id = db.scalar(
+        delete(MedRekkUser)
+        .where(MedRekkUser.account_id == account_id)
+        .where(MedRekkUser.id == user_id)
+        .returning(MedRekkUser.id)
+    )
     db.commit()
 
+    if not deleted_id:
+        # Raises the usual 404.
+        read_user(account_id, user_id, db)
+
 
 __all__ = [
     "add_account_user",
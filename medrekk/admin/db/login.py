@@ -0,0 +1,120 @@
+import os
+from time import time
+
+from fastapi import HTTPException, status
+
+from medrekk.admin.db.token import TokenStorage, token_store
+
+# Token buckets: `burst` attempts at once, refilled at `per_minute`.
+LOGIN_USER_BURST = int(os.getenv("MEDREKK_LOGIN_USER_BURST", "5"))
+LOGIN_USER_PER_MINUTE = float(os.getenv("MEDREKK_LOGIN_USER_PER_MINUTE", "5"))
+LOGIN_IP_BURST = int(os.getenv("MEDREKK_LOGIN_IP_BURST", "20"))
+LOGIN_IP_PER_MINUTE = float(os.getenv("MEDREKK_LOGIN_IP_PER_MINUTE", "60"))
+# Seconds an unknown username is remembered, skipping the database lookup.
+LOGIN_UNKNOWN_USER_TTL = int(os.getenv("MEDREKK_LOGIN_UNKNOWN_USER_TTL", "60"))
+
+# Takes one token from each bucket, or none if either one is empty, so a
+# rejected attempt does not drain the other bucket.
+#   KEYS: bucket keys
+#   ARGV: now, then (capacity, refill per second) for each key
+# Returns {allowed, seconds until the emptiest bucket has a token}.
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < 1 then
+        wait = math.max(wait, (1 - tokens) / rate)
+    end
+end
+if wait > 0 then
+    return {0, tostring(wait)}
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', levels[i] - 1, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return {1, '0'}
+"""
+
+
+class LoginGuard:
+    """
+    Cheap checks in front of the password check of `POST /auth`: a token
+    bucket per username and per client IP, and a short-lived record of
+    usernames that do not exist.
+    """
+
+    def __init__(self, store: TokenStorage) -> None:
+        self.store = store
+        self._script = None
+
+    @property
+    def script(self):
+        # Re-registered if the store was reopened with another client.
+        if self._script is None or self._script.registered_client is not self.store.db:
+            self._script = self.store.db.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def take(self, username: str, ip: str) -> None:
+        """
+        Raises HTTPException 429 if the username or the IP is out of attempts.
+        """
+        allowed, wait = await self.script(
+            keys=[
+                f"medrekk:login:bucket:user:{username.lower()}",
+                f"medrekk:login:bucket:ip:{ip}",
+            ],
+            args=[
+                time(),
+                LOGIN_USER_BURST,
+                LOGIN_USER_PER_MINUTE / 60,
+                LOGIN_IP_BURST,
+                LOGIN_IP_PER_MINUTE / 60,
+            ],
+        )
+
+        if not int(allowed):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={
+                    "status_code": status.HTTP_429_TOO_MANY_REQUESTS,
+                    "content": {
+                        "msg": "Too many sign-in attempts. Please try again later.",
+                        "loc": "username",
+                    },
+                },
+                headers={"Retry-After": str(max(1, round(float(wait))))},
+            )
+
+    def _unknown_key(self, username: str) -> str:
+        # Exact case, as the database lookup: "ALICE@a.com" not existing says
+        # nothing about "Alice@a.com". (The buckets above are shared by every
+        # spelling, so changing the case buys no extra attempts.)
+        return f"medrekk:login:unknown:{username}"
+
+    async def is_unknown(self, username: str) -> bool:
+        return bool(await self.store.db.exists(self._unknown_key(username)))
+
+    async def remember_unknown(self, username: str) -> None:
+        await self.store.db.set(
+            self._unknown_key(username), 1, ex=LOGIN_UNKNOWN_USER_TTL
+        )
+
+    async def forget_unknown(self, username: str) -> None:
+        """
+        Called when a user is created, so the username can sign in right away.
+        """
+        await self.store.db.delete(self._unknown_key(username))
+
+
+login_guard = LoginGuard(token_store)
@@ -1,22 +1,171 @@
+import asyncio
+import os
 from datetime import timedelta
-from redis import Redis
+from typing import Callable, Dict, Hashable, Tuple
 
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from medrekk.common.utils.cache import TTLCache
 from medrekk.common.utils.constants import TOKEN_EXPIRE_MINUTES
 
-token_db = Redis(host='10.76.6.73', port=6379, decode_responses=True, db=0)
+# The default is for development only; deployments must set MEDREKK_REDIS_URL.
+REDIS_URL = os.getenv("MEDREKK_REDIS_URL", "redis://localhost:6379/0")
+# Connections per worker. Callers wait up to MEDREKK_REDIS_POOL_TIMEOUT
+# seconds for a free one instead of opening more.
+REDIS_MAX_CONNECTIONS = int(os.getenv("MEDREKK_REDIS_MAX_CONNECTIONS", "20"))
+REDIS_POOL_TIMEOUT = float(os.getenv("MEDREKK_REDIS_POOL_TIMEOUT", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("MEDREKK_REDIS_SOCKET_TIMEOUT", "1"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("MEDREKK_REDIS_CONNECT_TIMEOUT", "1"))
+# Idle connections are PINGed before reuse after this many seconds.
+REDIS_HEALTH_CHECK_INTERVAL = int(
+    os.getenv("MEDREKK_REDIS_HEALTH_CHECK_INTERVAL", "30")
+)
+
+# Local `jti -> aud` cache of each worker. Entries live at most
+# MEDREKK_TOKEN_CACHE_TTL seconds, which bounds how long a revoked token can
+# still be accepted by a worker that missed the revocation message.
+TOKEN_CACHE_SIZE = int(os.getenv("MEDREKK_TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("MEDREKK_TOKEN_CACHE_TTL", "30"))
+
+# Pub/sub channel on which revoked jtis are announced to every worker.
+REVOKED_CHANNEL = "medrekk:tokens:revoked"
+
+
+def create_redis() -> Redis:
+    return Redis(
+        connection_pool=BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            decode_responses=True,
+        )
+    )
+
 
 class TokenStorage:
-    def __init__(self, db: Redis) -> None:
-        self.db: Redis = db
+    """
+    `jti -> aud` of the issued access tokens, in Redis.
+
+    The client is created by `open()` in the app lifespan (or on first use)
+    and does not connect until a command is sent, so the app starts while
+    Redis is unavailable; token operations fail until it is back.
+    """
+
+    def __init__(self, cache: TTLCache | None = None) -> None:
+        self._db: Redis | None = None
+        self.cache = cache
+        self._listener: asyncio.Task | None = None
+        # channel -> (cache, key of a message) kept in line across workers.
+        self._subscriptions: Dict[str, Tuple[TTLCache, Callable[[str], Hashable]]] = {}
+        if cache is not None:
+            self.subscribe(REVOKED_CHANNEL, cache)
+
+    def subscribe(
+        self,
+        channel: str,
+        cache: TTLCache,
+        key: Callable[[str], Hashable] = str,
+    ) -> None:
+        """
+        Evicts `key(message)` from `cache` for every message published on
+        `channel`, by any worker. Call before `open()`.
+        """
+        self._subscriptions[channel] = (cache, key)
+
+    @property
+    def db(self) -> Redis:
+        if self._db is None:
+            self._db = create_redis()
+        return self._db
+
+    async def open(self, db: Redis | None = None) -> None:
+        if db is not None:
+            self._db = db
+        if self._subscriptions and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._db is not None:
+            await self._db.aclose()
+            self._db = None
+
+    async def set_token(self, jti: str, aud: str) -> None:
+        await self.db.set(jti, aud, ex=timedelta(minutes=TOKEN_EXPIRE_MINUTES + 1))
+        if self.cache is not None:
+            self.cache.set(jti, aud)
+
+    async def get_token(self, jti: str) -> str | None:
+        if self.cache is not None:
+            aud = self.cache.get(jti)
+            if aud is not None:
+                return aud
+
+        aud = await self.db.get(jti)
+        # Unknown jtis are not cached: they are rare and not worth an entry.
+        if aud is not None and self.cache is not None:
+            self.cache.set(jti, aud)
+        return aud
+
+    async def remove_token(self, jti: str) -> None:
+        await self.db.delete(jti)
+        if self.cache is not None:
+            self.cache.invalidate(jti)
+        # Every worker, including this one, drops the jti from its cache.
+        await self.db.publish(REVOKED_CHANNEL, jti)
+
+    async def _listen(self) -> None:
+        """
+        Evicts the keys published by the other workers (revoked jtis, and
+        whatever else was subscribed) until cancelled. Without it, entries
+        expire from the caches after their `TTLCache.ttl` seconds.
+        """
+        while True:
+            try:
+                async with self.db.pubsub() as pubsub:
+                    await pubsub.subscribe(*self._subscriptions)
+                    while True:
+                        # Waits up to 1s; `listen()` would hit socket_timeout
+                        # whenever nobody logs out for a while.
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1
+                        )
+                        if message is not None:
+                            cache, key = self._subscriptions[message["channel"]]
+                            cache.invalidate(key(message["data"]))
+            except (RedisError, OSError):
+                # Messages sent while disconnected are missed, so forget
+                # everything and subscribe again.
+                for cache, _ in self._subscriptions.values():
+                    cache.clear()
+                await asyncio.sleep(1)
+
+    async def ping(self) -> bool:
+        try:
+            return await self.db.ping()
+        except (RedisError, OSError):
+            return False
 
-    def set_token(self, jti: str, aud: str) -> None:
-        self.db.set(jti, aud, ex=timedelta(minutes=TOKEN_EXPIRE_MINUTES + 1))
+    async def metrics(self) -> dict:
+        return {
+            "redis": await self.ping(),
+            "cache": self.cache.snapshot() if self.cache is not None else None,
+            "listening": self._listener is not None and not self._listener.done(),
+        }
 
-    def get_token(self, jti: str) -> str | None:
-        return self.db.get(jti)
-    
-    def remove_token(self, jti: str) -> None:
-        self.db.delete(jti)
-    
 
-token_store = TokenStorage(db=token_db)
\ No newline at end of file
+token_store = TokenStorage(
+    cache=TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_TTL)
+    if TOKEN_CACHE_SIZE
+    else None,
+)
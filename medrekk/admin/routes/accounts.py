@@ -5,10 +5,12 @@ from sqlalchemy.orm import Session
 
 from medrekk.admin.controllers.accounts import create_account, read_account
 from medrekk.admin.schemas.accounts import AccountCreate, AccountRead
-from medrekk.common.database.connection import get_session
+from medrekk.admin.db.login import login_guard
+from medrekk.common.database.connection import get_db, run_controller
 from medrekk.schemas.responses import HTTP_EXCEPTION
 from medrekk.common.utils import routes
 from medrekk.common.utils.auth import get_account_id, get_user_id, verify_jwt_token
+from medrekk.common.utils.hashing import password_hasher
 
 account_routes = APIRouter(
     prefix=f"/{routes.ACCOUNTS}",
@@ -36,9 +38,16 @@ account_routes = APIRouter(
 )
 async def new_account(
     account: AccountCreate,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    new_account = create_account(account, db_session)
+    hashed_password = await password_hasher.hash(account.password.get_secret_value())
+    new_account = await run_controller(
+        create_account,
+        account,
+        hashed_password,
+        db=db_session,
+    )
+    await login_guard.forget_unknown(account.user_name)
     return new_account
 
 
@@ -62,9 +71,9 @@ account_routes_verified = APIRouter(
 async def get_account(
     account_id: Annotated[str, Depends(get_account_id)],
     user_id: Annotated[str, Depends(get_user_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    account = read_account(account_id, user_id, db_session)
+    account = await run_controller(read_account, account_id, user_id, db=db_session)
     return account
 
 
@@ -1,13 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from medrekk.admin.controllers.auth import authenticate_user
 from medrekk.admin.schemas.token import Token
-from medrekk.common.database.connection import get_session
+from medrekk.common.database.connection import get_db
 from medrekk.common.dependencies import oauth2_scheme
 from medrekk.common.utils.auth import expire_token, get_host
 from medrekk.schemas.responses import HTTP_EXCEPTION
@@ -21,6 +21,14 @@ auth_routes = APIRouter(tags=["Authentication"])
     status_code=200,
     description="Successful username and password authentication.",
     responses={
+        429: {
+            "description": "HTTP_429_TOO_MANY_REQUESTS. Too many sign-in attempts for the username or from the client. Retry after the `Retry-After` seconds.",
+            "model": HTTP_EXCEPTION,
+        },
+        503: {
+            "description": "HTTP_503_SERVICE_UNAVAILABLE. Too many sign-in requests are being processed. Retry after the `Retry-After` seconds.",
+            "model": HTTP_EXCEPTION,
+        },
         401: {
             "description": "This message indicates that you tried to access a resource that requires authorization, but your credentials (username and password) were not recognized by the server.",
             "model": HTTP_EXCEPTION,
@@ -31,12 +39,14 @@ auth_routes = APIRouter(tags=["Authentication"])
         },
     },
 )
-def auth(
+async def auth(
+    request: Request,
     host: Annotated[str, Depends(get_host)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ) -> Token:
-    access_token = authenticate_user(host, form_data, db_session)
+    client_ip = request.client.host if request.client else "unknown"
+    access_token = await authenticate_user(host, client_ip, form_data, db_session)
 
     return JSONResponse(
         headers={"WWW-Authenticate": f"Bearer {access_token}"},
@@ -46,4 +56,4 @@ def auth(
 
 @auth_routes.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(token: Annotated[str, Depends(oauth2_scheme)]) -> None:
-    return expire_token(token)
+    return await expire_token(token)
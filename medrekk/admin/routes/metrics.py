@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends
+
+from medrekk.admin.db.token import token_store
+from medrekk.common.database.pool import async_pool_metrics, sync_pool_metrics
+from medrekk.common.database.settings import DB_MODE
+from medrekk.common.utils.auth import record_ownership, verify_jwt_token
+from medrekk.common.utils.hashing import password_hasher
+
+# Pool sizes and cache counters are operational detail, not for anonymous callers.
+metrics_routes = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    dependencies=[Depends(verify_jwt_token)],
+)
+
+
+@metrics_routes.get(
+    "/db",
+    name="Database connection pool metrics",
+)
+async def get_db_metrics():
+    """
+    Connection pool usage of this worker. `checked_out_peak` and `wait_*` are the
+    numbers to watch when sizing `MEDREKK_DB_POOL_SIZE` per worker.
+    """
+    return {
+        "mode": DB_MODE,
+        "sync": sync_pool_metrics.snapshot(),
+        "async": async_pool_metrics.snapshot(),
+    }
+
+
+@metrics_routes.get(
+    "/tokens",
+    name="Token cache metrics",
+)
+async def get_token_metrics():
+    """
+    Hit/miss counters of this worker's local `jti -> aud` cache.
+    """
+    return await token_store.metrics()
+
+
+@metrics_routes.get(
+    "/passwords",
+    name="Password hashing pool metrics",
+)
+async def get_password_metrics():
+    """
+    Usage of this worker's bcrypt pool. `rejected` counts the 503s returned
+    because `max_pending` hashes were already queued or running.
+    """
+    return password_hasher.metrics()
+
+
+@metrics_routes.get(
+    "/ownership",
+    name="Record ownership cache metrics",
+)
+async def get_ownership_metrics():
+    """
+    Hit/miss counters of this worker's `(account_id, record_id)` ownership cache
+    used by the record-scoped routes.
+    """
+    return record_ownership.snapshot()
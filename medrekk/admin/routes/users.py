@@ -1,16 +1,24 @@
-from typing import Annotated, List
+from typing import Annotated
 
 from fastapi import Depends, status
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRouter
 from sqlalchemy.orm import Session
 
-from medrekk.admin.controllers.users import add_account_user, read_user, read_users
-from medrekk.common.database.connection import get_session
+from medrekk.admin.controllers.users import (
+    add_account_user,
+    delete_user as delete_account_user,
+    read_user,
+    read_users,
+)
+from medrekk.admin.db.login import login_guard
+from medrekk.common.database.connection import get_db, run_controller
 from medrekk.admin.schemas.accounts import UserCreate, UserListItem, UserRead
-from medrekk.schemas.responses import HTTP_EXCEPTION
+from medrekk.schemas.responses import HTTP_EXCEPTION, Page
 from medrekk.common.utils import routes
 from medrekk.common.utils.auth import check_self, get_account_id, verify_jwt_token
+from medrekk.common.utils.hashing import password_hasher
+from medrekk.common.utils.pagination import PageParams, page_params
 
 user_routes = APIRouter(
     prefix=f"/{routes.MEMBERS}",
@@ -39,18 +47,26 @@ user_routes = APIRouter(
 async def add_user(
     account_id: Annotated[str, Depends(get_account_id)],
     user_data: UserCreate,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
     """
     Create a new user. Requires `email` and `password`
 
     """
-    user = add_account_user(account_id, user_data, db_session)
+    hashed_password = await password_hasher.hash(user_data.password.get_secret_value())
+    user = await run_controller(
+        add_account_user,
+        account_id,
+        user_data,
+        hashed_password,
+        db=db_session,
+    )
     if user is None:
         raise JSONResponse(
             content="HTTP_500_INTERNAL_SERVER_ERROR. The server encountered an unexpected condition that prevented it from fulfilling the request. If the error occurs after several retries, please contact the administrator at: ...",
             status_code=500,
         )
+    await login_guard.forget_unknown(user.username)
     return user
 
 
@@ -61,7 +77,7 @@ Routes that requires a valid jwt_token
 
 @user_routes.get(
     "/",
-    response_model=List[UserListItem],
+    response_model=Page[UserListItem],
     status_code=status.HTTP_200_OK,
     responses={
         500: {
@@ -72,14 +88,13 @@ Routes that requires a valid jwt_token
 )
 async def get_users(
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    page: Annotated[PageParams, Depends(page_params)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
     """
-    Get all users.
+    Get the users of the account, newest first, `limit` at a time.
     """
-    users = read_users(account_id, db_session)
-
-    return [UserListItem.model_validate(user) for user in users]
+    return await run_controller(read_users, account_id, page, db=db_session)
 
 
 # Get a specific user by user ID
@@ -90,9 +105,9 @@ async def get_users(
 async def get_user(
     account_id: Annotated[str, Depends(get_account_id)],
     user_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    user = read_user(account_id, user_id, db_session)
+    user = await run_controller(read_user, account_id, user_id, db=db_session)
 
     return UserRead.model_validate(user)
 
@@ -108,11 +123,6 @@ async def get_user(
 async def delete_user(
     account_id: Annotated[str, Depends(get_account_id)],
     user_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    user = read_user(account_id, user_id, db_session)
-
-    # Delete the user and return the deleted user
-    db_session.delete(user)
-    db_session.commit()
-    return None
+    return await run_controller(delete_account_user, account_id, user_id, db=db_session)
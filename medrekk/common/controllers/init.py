@@ -117,7 +117,7 @@ def init_db(db: Session):
     account = AccountCreate(
         account_name="awesome account", user_name="test@a.com", password="aaaa"
     )
-    init_create_account(account, db)
+    new_account = init_create_account(account, db)
 
     patient = PatientProfileCreate(
         lastname="endres",
@@ -129,12 +129,12 @@ def init_db(db: Session):
         mobile="string",
         email="string",
         address_country="Philippines",
-        address_province="string",
-        address_city="string",
-        address_barangay="string",
+        address_province="Cebu",
+        address_city="Cebu City",
+        address_barangay="Apas",
         address_line1="string",
         address_line2="",
         religion="Roman Catholic",
     )
 
-    create_patient(patient, db)
+    create_patient(new_account.id, patient, db)
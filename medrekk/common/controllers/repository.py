@@ -0,0 +1,446 @@
+from datetime import datetime
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+from fastapi import HTTPException, status
+from psycopg.errors import UniqueViolation
+from pydantic import BaseModel
+from sqlalchemy import DateTime, delete, func, insert, literal_column, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from medrekk.common.database import partitions
+from medrekk.common.database.connection import Base
+from medrekk.common.utils import shortid
+from medrekk.common.utils.pagination import PageParams, TimeRange, keyset_paginate
+
+ModelT = TypeVar("ModelT", bound=Base)
+CreateT = TypeVar("CreateT", bound=BaseModel)
+UpdateT = TypeVar("UpdateT", bound=BaseModel)
+T = TypeVar("T")
+
+
+class CRUDRepository(Generic[ModelT, CreateT, UpdateT]):
+    """
+    Create/read/list/update/delete controllers for a model that belongs to a
+    parent row, e.g. `PatientBodyMassIndex` rows of a patient (`patient_id`) or
+    `PatientBloodPressure` rows of a record (`record_id`).
+
+    Parameters:
+
+        model: the SQLAlchemy model.
+        create_schema: pydantic model of the create request body.
+        update_schema: pydantic model of the update request body.
+        parent_key: name of the column that references the parent.
+        item_loc: `loc` reported when an item is not found, e.g. "bp_id".
+        not_found_msg: `msg` reported when an item is not found.
+        unique_constraint: name of the unique constraint that maps to 409.
+        conflict_msg: `msg` reported on conflict. Formatted with the fields of
+            the submitted data, e.g. "... Date/Time: {dt_measured}".
+        conflict_loc: `loc` reported on conflict.
+    """
+
+    def __init__(
+        self,
+        model: Type[ModelT],
+        *,
+        create_schema: Type[CreateT],
+        update_schema: Type[UpdateT],
+        parent_key: str,
+        item_loc: str,
+        not_found_msg: str,
+        unique_constraint: Optional[str] = None,
+        conflict_msg: str = "",
+        conflict_loc: str = "",
+    ) -> None:
+        self.model = model
+        self.create_schema = create_schema
+        self.update_schema = update_schema
+        self.parent_key = parent_key
+        self.parent_column = getattr(model, parent_key)
+        self.item_loc = item_loc
+        self.not_found_msg = not_found_msg
+        self.unique_constraint = unique_constraint
+        self.conflict_msg = conflict_msg
+        self.conflict_loc = conflict_loc
+
+    @property
+    def index_key(self) -> Sequence[str]:
+        """
+        Columns of the index `read_all` needs: the parent, then the keyset
+        order. Checked against the models by `database/index_audit.py`.
+        """
+        return (self.parent_key, "created", "id")
+
+    def conflict_detail(self, data: dict) -> dict:
+        return {
+            "msg": self.conflict_msg.format(**data),
+            "loc": self.conflict_loc,
+        }
+
+    def raise_conflict(self, e: DBAPIError, data: dict) -> None:
+        """
+        Raises HTTPException 409 if `e` is a violation of `unique_constraint`.
+        """
+        constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+
+        if (
+            isinstance(e.orig, UniqueViolation)
+            and self.unique_constraint
+            and constraint == self.unique_constraint
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "status_code": status.HTTP_409_CONFLICT,
+                    "content": self.conflict_detail(data),
+                },
+            )
+
+    def raise_not_found(self) -> None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "content": {
+                    "msg": self.not_found_msg,
+                    "loc": self.item_loc,
+                },
+            },
+        )
+
+    def create(self, parent_id: str, data: CreateT, db: Session) -> ModelT:
+        values = data.model_dump()
+        try:
+            # INSERT ... RETURNING: one statement, no refresh SELECT after commit.
+            new_item = db.scalar(
+                insert(self.model)
+                .values(**{self.parent_key: parent_id}, **values)
+                .returning(self.model)
+            )
+            db.commit()
+
+            return new_item
+        except DBAPIError as e:
+            db.rollback()
+            self.raise_conflict(e, values)
+            raise e
+
+    def create_many(self, parent_id: str, data: List[CreateT], db: Session) -> dict:
+        """
+        Inserts `data` with one multi-row INSERT ... ON CONFLICT DO NOTHING
+        RETURNING and commits once.
+
+        Items that violate `unique_constraint`, including duplicates within
+        `data`, are skipped and reported in `conflicts` by their index.
+        """
+        rows = [
+            {"id": shortid(), self.parent_key: parent_id, **item.model_dump()}
+            for item in data
+        ]
+        if not rows:
+            return {"created": [], "conflicts": []}
+
+        stmt = postgresql.insert(self.model).values(rows)
+        if self.unique_constraint:
+            stmt = stmt.on_conflict_do_nothing(constraint=self.unique_constraint)
+
+        created = {
+            item.id: item for item in db.scalars(stmt.returning(self.model)).all()
+        }
+        db.commit()
+
+        # The ids are generated here, so rows missing from RETURNING are
+        # exactly the ones that were skipped.
+        return {
+            "created": [created[row["id"]] for row in rows if row["id"] in created],
+            "conflicts": [
+                {"index": index, **self.conflict_detail(item.model_dump())}
+                for index, (row, item) in enumerate(zip(rows, data))
+                if row["id"] not in created
+            ],
+        }
+
+    def read(self, parent_id: str, item_id: str, db: Session) -> ModelT:
+        item = (
+            db.query(self.model)
+            .filter(self.parent_column == parent_id)
+            .filter(self.model.id == item_id)
+            .one_or_none()
+        )
+
+        if not item:
+            self.raise_not_found()
+
+        return item
+
+    def read_all(self, parent_id: str, page: PageParams, db: Session) -> dict:
+        return keyset_paginate(
+            db.query(self.model).filter(self.parent_column == parent_id),
+            self.model,
+            page,
+        )
+
+    def update(
+        self,
+        parent_id: str,
+        item_id: str,
+        data: UpdateT,
+        db: Session,
+    ) -> ModelT:
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            return self.read(parent_id, item_id, db)
+
+        try:
+            # UPDATE ... RETURNING replaces the SELECT, UPDATE and refresh SELECT.
+            item = db.scalar(
+                update(self.model)
+                .where(self.parent_column == parent_id)
+                .where(self.model.id == item_id)
+                .values(**values)
+                .returning(self.model)
+            )
+            db.commit()
+        except DBAPIError as e:
+            db.rollback()
+            self.raise_conflict(e, values)
+            raise e
+
+        if not item:
+            self.raise_not_found()
+
+        return item
+
+    def delete(self, parent_id: str, item_id: str, db: Session) -> None:
+        deleted_id = db.scalar(
+            delete(self.model)
+            .where(self.parent_column == parent_id)
+            .where(self.model.id == item_id)
+            .returning(self.model.id)
+        )
+        db.commit()
+
+        if not deleted_id:
+            self.raise_not_found()
+
+        return None
+
+
+Bucket = Literal["1h", "1d"]
+# Inlined rather than bound, so GROUP BY repeats the exact SELECT expression.
+# Buckets start on whole hours and days.
+BUCKETS: Dict[str, str] = {
+    "1h": "date_bin(interval '1 hour', {column}, timestamp '2000-01-01')",
+    "1d": "date_bin(interval '1 day', {column}, timestamp '2000-01-01')",
+}
+
+
+class VitalsRepository(CRUDRepository[ModelT, CreateT, UpdateT]):
+    """
+    Controllers for readings of a record taken at `dt_measured`, e.g.
+    `PatientBloodPressure`. Adds time range filters, served by the
+    `(record_id, dt_measured, id)` index of each table, and bucketed aggregates.
+
+    Parameters, besides those of `CRUDRepository`:
+
+        value_keys: numeric columns aggregated by `read_trend`.
+    """
+
+    def __init__(self, model: Type[ModelT], *, value_keys: Sequence[str], **kwargs):
+        super().__init__(model, **kwargs)
+        self.value_keys = list(value_keys)
+        self.time_column = model.dt_measured
+
+    def with_partitions(
+        self, values: List[Optional[datetime]], write: Callable[..., T], *args
+    ) -> T:
+        """
+        Runs `write(*args)`, whose last argument is the session, once the
+        partitions of the months of `values` exist. Readings of months
+        without a partition yet (backdated entries) would fail the write.
+
+        A month detached since it was cached fails it all the same: the
+        months are then read from the catalog again and the write retried
+        once.
+        """
+        db = args[-1]
+        partitions.ensure(db, self.model.__table__, values)
+        try:
+            return write(*args)
+        except DBAPIError as e:
+            if not partitions.is_missing_partition(e):
+                raise
+            db.rollback()
+            partitions.forget(self.model.__table__.name)
+            partitions.ensure(db, self.model.__table__, values)
+            return write(*args)
+
+    def create(self, parent_id: str, data: CreateT, db: Session) -> ModelT:
+        return self.with_partitions(
+            [data.dt_measured], super().create, parent_id, data, db
+        )
+
+    def create_many(self, parent_id: str, data: List[CreateT], db: Session) -> dict:
+        return self.with_partitions(
+            [item.dt_measured for item in data],
+            super().create_many,
+            parent_id,
+            data,
+            db,
+        )
+
+    def update(
+        self,
+        parent_id: str,
+        item_id: str,
+        data: UpdateT,
+        db: Session,
+    ) -> ModelT:
+        return self.with_partitions(
+            [data.dt_measured], super().update, parent_id, item_id, data, db
+        )
+
+    @property
+    def index_key(self) -> Sequence[str]:
+        return (self.parent_key, "dt_measured", "id")
+
+    def in_range(self, parent_id: str, time_range: TimeRange) -> list:
+        conditions = [self.parent_column == parent_id]
+        if time_range.start:
+            conditions.append(self.time_column >= time_range.start)
+        if time_range.end:
+            conditions.append(self.time_column < time_range.end)
+        return conditions
+
+    def read_all(self, parent_id: str, page: PageParams, db: Session) -> dict:
+        """
+        Readings of the record, latest measurement first: the order of the
+        `(record_id, dt_measured, id)` index, which no (created, id) order is.
+        """
+        return self.read_range(parent_id, TimeRange(), page, db)
+
+    def read_range(
+        self,
+        parent_id: str,
+        time_range: TimeRange,
+        page: PageParams,
+        db: Session,
+    ) -> dict:
+        """
+        Readings of `time_range`, latest measurement first.
+        """
+        return keyset_paginate(
+            db.query(self.model).filter(*self.in_range(parent_id, time_range)),
+            self.model,
+            page,
+            key="dt_measured",
+        )
+
+    def read_trend(
+        self,
+        parent_id: str,
+        time_range: TimeRange,
+        bucket: Bucket,
+        db: Session,
+    ) -> List[dict]:
+        """
+        Count, min, max and avg of every value per `bucket`, oldest first,
+        computed by Postgres with date_bin, so only one row per bucket is sent.
+        """
+        start = literal_column(
+            BUCKETS[bucket].format(column=self.time_column.name), DateTime
+        ).label("start")
+        aggregates = []
+        for key in self.value_keys:
+            column = getattr(self.model, key)
+            aggregates += [
+                func.min(column).label(f"{key}_min"),
+                func.max(column).label(f"{key}_max"),
+                func.avg(column).label(f"{key}_avg"),
+            ]
+
+        rows = db.execute(
+            select(start, func.count().label("count"), *aggregates)
+            .where(*self.in_range(parent_id, time_range))
+            .group_by(start)
+            .order_by(start)
+        ).mappings()
+
+        return [
+            {
+                "start": row["start"],
+                "count": row["count"],
+                "values": {
+                    key: {
+                        "min": row[f"{key}_min"],
+                        "max": row[f"{key}_max"],
+                        "avg": row[f"{key}_avg"],
+                    }
+                    for key in self.value_keys
+                },
+            }
+            for row in rows
+        ]
+
+
+class SingletonRepository(CRUDRepository[ModelT, CreateT, UpdateT]):
+    """
+    Controllers for a model with at most one row per parent, e.g.
+    `PatientFamilyHistory`. Items are addressed by the parent id alone.
+    """
+
+    @property
+    def index_key(self) -> Sequence[str]:
+        return (self.parent_key,)
+
+    def read(self, parent_id: str, db: Session) -> ModelT:
+        item = (
+            db.query(self.model).filter(self.parent_column == parent_id).one_or_none()
+        )
+
+        if not item:
+            self.raise_not_found()
+
+        return item
+
+    def update(self, parent_id: str, data: UpdateT, db: Session) -> ModelT:
+        values = data.model_dump(exclude_unset=True)
+        if not values:
+            return self.read(parent_id, db)
+
+        item = db.scalar(
+            update(self.model)
+            .where(self.parent_column == parent_id)
+            .values(**values)
+            .returning(self.model)
+        )
+        db.commit()
+
+        if not item:
+            self.raise_not_found()
+
+        return item
+
+    def delete(self, parent_id: str, db: Session) -> None:
+        deleted_id = db.scalar(
+            delete(self.model)
+            .where(self.parent_column == parent_id)
+            .returning(self.model.id)
+        )
+        db.commit()
+
+        if not deleted_id:
+            self.raise_not_found()
+
+        return None
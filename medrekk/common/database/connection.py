@@ -1,24 +1,58 @@
+from typing import Callable, TypeVar
+
 from fastapi import HTTPException, status
-from sqlalchemy import create_engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import String, create_engine
 from sqlalchemy.exc import DBAPIError
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from .db_const import DB_USER, DB_PASS, DB_NAME, DB_HOST, DB_PORT
+from .pool import (
+    async_pool_metrics,
+    async_pool_options,
+    sync_pool_metrics,
+    sync_pool_options,
+)
+from .settings import DB_ASYNC, DB_ECHO
+
+T = TypeVar("T")
 
+conninfo = f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 conn_url = f"postgresql+psycopg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-engine = create_engine(conn_url, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(conn_url, echo=DB_ECHO, **sync_pool_options(conninfo))
+sync_pool_metrics.attach(engine)
+# expire_on_commit=False: rows written with RETURNING are already current, so
+# reading them after commit must not cost another SELECT.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
+
+# psycopg 3 speaks asyncio natively, so the same URL works for the async engine.
+async_engine = create_async_engine(
+    conn_url, echo=DB_ECHO, **async_pool_options(conninfo)
+)
+async_pool_metrics.attach(async_engine.sync_engine)
+# expire_on_commit=False, as above. Here it is also required, since an expired
+# attribute would be lazy loaded outside of the session's greenlet.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def create_db_and_tables():
-    try:
-        Base.metadata.drop_all(engine)
-        Base.metadata.create_all(engine)
-    except Exception as e:
-        print("Error creating tables. \n", e)
+# Column type of the IDs from `shortid`. The "C" collation compares them byte
+# by byte, so they sort in the order they were generated and keyset pages on
+# (created, id) agree with the primary key index. Foreign keys take the type,
+# collation included, of the column they reference.
+ShortIDType = String(collation="C")
 
 
 # def get_db():
@@ -69,3 +103,48 @@ def get_session():
         )
     finally:
         db.close()
+
+
+async def get_async_session():
+    try:
+        db = AsyncSessionLocal()
+
+        yield db
+    except HTTPException as http_error:
+        raise http_error
+    except (DBAPIError, Exception):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "content": {
+                    "msg": "The server encountered an unexpected condition that prevented it from fulfilling the request. If the error occurs after several retries, please contact the administrator at: ...",
+                },
+            },
+        )
+    finally:
+        await db.close()
+
+
+# Session dependency used by the API routes. Selected once per deployment
+# through `MEDREKK_DB_MODE` (see settings.py).
+get_db = get_async_session if DB_ASYNC else get_session
+
+
+async def run_controller(
+    controller: Callable[..., T],
+    *args,
+    db: Session | AsyncSession,
+) -> T:
+    """
+    Runs a controller with the session provided by `get_db`.
+
+    Controllers are written against the synchronous `Session` API and take the
+    session as their last argument. With an `AsyncSession` the controller runs
+    through `AsyncSession.run_sync`, so every round trip is awaited on the event
+    loop. With a `Session` the controller runs in Starlette's threadpool.
+    Either way the event loop is never blocked on Postgres.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(lambda session: controller(*args, session))
+    return await run_in_threadpool(controller, *args, db)
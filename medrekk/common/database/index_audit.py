@@ -0,0 +1,236 @@
+"""
+Index audit of `Base.metadata` against the queries the controllers run.
+
+Reports:
+
+  - foreign keys no index starts with. Every list by parent, and every
+    delete of a parent row (Postgres checks the referencing table), is then
+    a sequential scan;
+  - repositories whose `index_key` (parent, then keyset order) no index
+    starts with, so `read_all` sorts the parent's rows on every page. A
+    unique key the `index_key` starts with serves it as well;
+  - indexes whose columns start another index or unique constraint of the
+    same table, which cost every write and serve no query the other can't.
+
+and prints the statements that fix them. They use CONCURRENTLY, so they can
+be run on a live database (outside of a transaction block). With --alembic,
+prints them as the `upgrade()` of a migration instead (see online.py).
+
+    python -m medrekk.common.database.index_audit [--alembic]
+
+Exits with status 1 when anything is found.
+"""
+
+import argparse
+import importlib
+import pkgutil
+import sys
+from typing import Iterable, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, UniqueConstraint
+
+from medrekk.common.controllers.repository import CRUDRepository
+
+# Tenant columns are filtered together with a more selective key, and accounts
+# are never deleted, so foreign keys to these tables need no index of their own.
+EXEMPT_REFERENCES = ("medrekk_accounts",)
+
+# Packages whose modules define the repositories to check.
+CONTROLLER_PACKAGES = ("medrekk.mrs.controllers",)
+
+
+class Finding(NamedTuple):
+    kind: Literal["foreign_key", "access_path", "redundant"]
+    table: str
+    columns: Tuple[str, ...]
+    # Name of the redundant index, or of the one to create.
+    name: str
+
+    @property
+    def statement(self) -> str:
+        if self.kind == "redundant":
+            return f"DROP INDEX CONCURRENTLY IF EXISTS {self.name};"
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.name} "
+            f"ON {self.table} ({', '.join(self.columns)});"
+        )
+
+    @property
+    def operation(self) -> str:
+        if self.kind == "redundant":
+            return f"drop_index_concurrently({self.name!r}, {self.table!r})"
+        return (
+            f"create_index_concurrently({self.name!r}, {self.table!r}, "
+            f"{list(self.columns)!r})"
+        )
+
+    def __str__(self) -> str:
+        columns = ", ".join(self.columns)
+        if self.kind == "foreign_key":
+            return f"{self.table}: foreign key ({columns}) is not indexed"
+        if self.kind == "access_path":
+            return f"{self.table}: no index on ({columns})"
+        return f"{self.table}: {self.name} ({columns}) is redundant"
+
+
+class _Key(NamedTuple):
+    name: Optional[str]
+    columns: Tuple[str, ...]
+    unique: bool
+
+
+def _keys(table: Table) -> List[_Key]:
+    """
+    B-tree indexes of `table`, including those behind its primary key and
+    unique constraints. GIN and other index types serve neither foreign key
+    lookups by range nor keyset order, so they are left out.
+    """
+    keys = []
+    for constraint in table.constraints:
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)):
+            columns = tuple(column.name for column in constraint.columns)
+            keys.append(_Key(constraint.name, columns, True))
+    for index in table.indexes:
+        using = index.dialect_options["postgresql"]["using"]
+        if using and using != "btree":
+            continue
+        keys.append(
+            _Key(index.name, tuple(column.name for column in index.columns), False)
+        )
+    return keys
+
+
+def _serves(key: _Key, columns: Sequence[str]) -> bool:
+    """
+    Whether `key` serves lookups on, and the order of, `columns`: it starts
+    with them, or it is unique and they start with it. Past a unique key the
+    remaining columns order groups of one row, which the planner's
+    Incremental Sort passes on as they come.
+    """
+    columns = tuple(columns)
+    if key.columns[: len(columns)] == columns:
+        return True
+    return key.unique and columns[: len(key.columns)] == key.columns
+
+
+def _starts_with(keys: Iterable[_Key], columns: Sequence[str]) -> bool:
+    return any(_serves(key, columns) for key in keys)
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    return f"idx_{table}_{'_'.join(columns)}"
+
+
+def unindexed_foreign_keys(metadata: MetaData) -> List[Finding]:
+    findings = []
+    for table in metadata.tables.values():
+        keys = _keys(table)
+        for foreign_key in table.foreign_key_constraints:
+            if foreign_key.referred_table.name in EXEMPT_REFERENCES:
+                continue
+            columns = tuple(foreign_key.column_keys)
+            if not any(set(key.columns[: len(columns)]) == set(columns) for key in keys):
+                findings.append(
+                    Finding(
+                        "foreign_key",
+                        table.name,
+                        columns,
+                        index_name(table.name, columns),
+                    )
+                )
+    return findings
+
+
+def unserved_access_paths(repositories: Iterable[CRUDRepository]) -> List[Finding]:
+    findings = []
+    for repository in repositories:
+        table = repository.model.__table__
+        columns = tuple(repository.index_key)
+        if not _starts_with(_keys(table), columns):
+            finding = Finding(
+                "access_path", table.name, columns, index_name(table.name, columns)
+            )
+            if finding not in findings:
+                findings.append(finding)
+    return findings
+
+
+def redundant_indexes(metadata: MetaData) -> List[Finding]:
+    findings = []
+    for table in metadata.tables.values():
+        keys = _keys(table)
+        for index in keys:
+            if index.unique:
+                continue
+            for other in keys:
+                if other is index:
+                    continue
+                # Of two identical indexes, keep the first by name.
+                if other.columns == index.columns and not other.unique:
+                    covers = other.name < index.name
+                else:
+                    covers = other.columns[: len(index.columns)] == index.columns
+                if covers:
+                    findings.append(
+                        Finding("redundant", table.name, index.columns, index.name)
+                    )
+                    break
+    return findings
+
+
+def repositories(packages: Sequence[str] = CONTROLLER_PACKAGES) -> List[CRUDRepository]:
+    """
+    Every `CRUDRepository` defined at the top level of a module of `packages`.
+    """
+    found = []
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package_name}.{module_info.name}")
+            for value in vars(module).values():
+                if isinstance(value, CRUDRepository) and value not in found:
+                    found.append(value)
+    return found
+
+
+def audit(
+    metadata: MetaData, repositories: Iterable[CRUDRepository] = ()
+) -> List[Finding]:
+    return [
+        *unindexed_foreign_keys(metadata),
+        *unserved_access_paths(repositories),
+        *redundant_indexes(metadata),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--alembic", action="store_true", help="print a migration's upgrade()"
+    )
+    args = parser.parse_args()
+
+    from medrekk.common.database.connection import Base
+
+    # The app imports every model and controller, in an order that resolves
+    # their circular imports.
+    importlib.import_module("medrekk.main")
+    findings = audit(Base.metadata, repositories())
+    if not findings:
+        print("No missing or redundant indexes.")
+        return
+
+    if args.alembic:
+        print("def upgrade() -> None:")
+        for finding in findings:
+            print(f"    # {finding}")
+            print(f"    {finding.operation}")
+    else:
+        for finding in findings:
+            print(f"-- {finding}")
+            print(finding.statement)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
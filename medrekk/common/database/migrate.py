@@ -0,0 +1,57 @@
+"""
+Versioned schema migrations, with Alembic. Revisions live in `migrations/versions`.
+
+    alembic upgrade head                      # from the repository root
+    alembic revision --autogenerate -m "..."  # new revision from the models
+
+Index and other changes to large tables should use the helpers of
+`online.py`, so they can be applied while the API is serving. A revision
+that can't be applied online refuses to run unless opted in with an `-x`
+argument, e.g. `-x rebuild_id_indexes=yes` for 0005.
+
+A database created with `create_all` before there were migrations has the
+schema of revision 0000: `alembic stamp 0000`, then `alembic upgrade head`.
+"""
+
+import argparse
+import os
+from typing import Sequence
+
+from alembic import command
+from alembic.config import Config
+
+from medrekk.common.database.partitions import is_partition
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+
+
+def alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    return config
+
+
+# Prefix of the indexes migration 0004 adds with `-x vitals_index=brin`.
+OPTIONAL_INDEX_PREFIX = "brin_"
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """
+    Leaves out of --autogenerate partitions, which are created by
+    partitions.py as the months go by, not by revisions, and the optional
+    indexes of migration 0004, which the models don't describe.
+    """
+    if type_ == "table":
+        return not is_partition(name)
+    if type_ == "index":
+        return not name.startswith(OPTIONAL_INDEX_PREFIX)
+    return True
+
+
+def upgrade(revision: str = "head", x: Sequence[str] = ()) -> None:
+    """
+    `alembic [-x KEY=VALUE ...] upgrade <revision>`.
+    """
+    config = alembic_config()
+    config.cmd_opts = argparse.Namespace(x=list(x))
+    command.upgrade(config, revision)
@@ -0,0 +1,52 @@
+import os
+
+from alembic import context
+from sqlalchemy import create_engine, pool, text
+
+from medrekk.common.database.connection import Base, conn_url
+from medrekk.common.database.migrate import include_name
+
+# Registers every table with Base.metadata, for --autogenerate.
+import medrekk.common.models.medrekk  # noqa: F401
+import medrekk.common.models.patient  # noqa: F401
+
+# DDL that has to wait for a lock gives up after this long instead of queueing
+# every query on the table behind it. Retry the migration when traffic is lower.
+LOCK_TIMEOUT = os.getenv("MEDREKK_MIGRATION_LOCK_TIMEOUT", "5s")
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=conn_url,
+        target_metadata=Base.metadata,
+        literal_binds=True,
+        include_name=include_name,
+        transaction_per_migration=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # A connection of its own: session settings must not reach the app's pool.
+    engine = create_engine(conn_url, poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        connection.execute(text(f"SET lock_timeout = '{LOCK_TIMEOUT}'"))
+        connection.commit()
+        context.configure(
+            connection=connection,
+            target_metadata=Base.metadata,
+            include_name=include_name,
+            # One transaction per revision, so the CONCURRENTLY operations of
+            # online.py can step out of it.
+            transaction_per_migration=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
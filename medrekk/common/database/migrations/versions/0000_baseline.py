@@ -0,0 +1,505 @@
+"""Baseline: the schema create_all built before migrations
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+The tables, constraints and indexes `Base.metadata.create_all` built from
+the models of the last release without migrations. A database created that
+way (by the old `create_db_and_tables`) is at this revision: mark it with
+
+    alembic stamp 0000
+
+and upgrade it from there (`alembic upgrade head`). A new database is built
+by running every revision from this one.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0000"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "medrekk_accounts",
+        sa.Column("account_name", sa.String(), nullable=False),
+        sa.Column("account_subdomain", sa.String(), nullable=False),
+        sa.Column("owner_id", sa.String(), nullable=True),
+        sa.Column("status", sa.SmallInteger(), nullable=True),
+        sa.Column("trial_ends_at", sa.DateTime(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "medrekk_users",
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("password", sa.String(), nullable=False),
+        sa.Column("active", sa.Boolean(), nullable=True),
+        sa.Column("account_id", sa.String(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_id"], ["medrekk_accounts.id"], name="user_account"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("username"),
+    )
+    op.create_foreign_key(
+        "account_owner", "medrekk_accounts", "medrekk_users", ["owner_id"], ["id"]
+    )
+    op.create_table(
+        "medrekk_account_user_assoc",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("account_id", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["medrekk_accounts.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["medrekk_users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "account_id"),
+    )
+    op.create_table(
+        "medrekk_user_profiles",
+        sa.Column("user_id", sa.String(), nullable=True),
+        sa.Column("lastname", sa.String(), nullable=False),
+        sa.Column("middlename", sa.String(), nullable=True),
+        sa.Column("firstname", sa.String(), nullable=False),
+        sa.Column("suffix", sa.String(), nullable=True),
+        sa.Column("birthdate", sa.Date(), nullable=True),
+        sa.Column("gender", sa.String(), nullable=True),
+        sa.Column("mobile", sa.String(), nullable=True),
+        sa.Column("address_country", sa.String(), nullable=False),
+        sa.Column("address_province", sa.String(), nullable=False),
+        sa.Column("address_city", sa.String(), nullable=False),
+        sa.Column("address_barangay", sa.String(), nullable=False),
+        sa.Column("address_line1", sa.String(), nullable=False),
+        sa.Column("address_line2", sa.String(), nullable=True),
+        sa.Column("religion", sa.String(), nullable=False),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["medrekk_users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id"),
+    )
+    op.create_table(
+        "patient_profile",
+        sa.Column("lastname", sa.String(), nullable=False),
+        sa.Column("middlename", sa.String(), nullable=True),
+        sa.Column("firstname", sa.String(), nullable=False),
+        sa.Column("suffix", sa.String(), nullable=True),
+        sa.Column("birthdate", sa.Date(), nullable=True),
+        sa.Column("gender", sa.String(), nullable=True),
+        sa.Column("mobile", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("address_country", sa.String(), nullable=False),
+        sa.Column("address_province", sa.String(), nullable=False),
+        sa.Column("address_city", sa.String(), nullable=False),
+        sa.Column("address_barangay", sa.String(), nullable=False),
+        sa.Column("address_line1", sa.String(), nullable=False),
+        sa.Column("address_line2", sa.String(), nullable=True),
+        sa.Column("religion", sa.String(), nullable=False),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_allergy",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("allergen", sa.String(), nullable=True),
+        sa.Column("reaction_description", sa.String(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_appointments",
+        sa.Column("account_id", sa.String(), nullable=True),
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("appointment_date", sa.Date(), nullable=False),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["medrekk_accounts.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_bmi",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("date_measured", sa.Date(), nullable=True),
+        sa.Column("bmi", sa.Float(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("patient_id", "date_measured", name="uc_bmi_patient_date"),
+    )
+    op.create_table(
+        "patient_body_weight",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("date_measured", sa.Date(), nullable=True),
+        sa.Column("body_weight", sa.Float(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "patient_id", "date_measured", name="uc_bodyweight_patient_date"
+        ),
+    )
+    op.create_table(
+        "patient_family_history",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("hypertension", sa.Boolean(), nullable=True),
+        sa.Column("t2dm", sa.Boolean(), nullable=True),
+        sa.Column("asthma", sa.Boolean(), nullable=True),
+        sa.Column("cancer", sa.Boolean(), nullable=True),
+        sa.Column("others", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("patient_id"),
+    )
+    op.create_table(
+        "patient_height",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("date_measured", sa.Date(), nullable=True),
+        sa.Column("height", sa.Float(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "patient_id", "date_measured", name="uc_height_patient_date"
+        ),
+    )
+    op.create_table(
+        "patient_hospitalization_history",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("chief_complaint", sa.String(), nullable=True),
+        sa.Column("admission_date", sa.Date(), nullable=True),
+        sa.Column("discharge_date", sa.Date(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_immunization",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("vaccine", sa.String(), nullable=True),
+        sa.Column("date_administered", sa.Date(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_medical_history",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("hypertension", sa.Boolean(), nullable=True),
+        sa.Column("t2dm", sa.Boolean(), nullable=True),
+        sa.Column("asthma", sa.Boolean(), nullable=True),
+        sa.Column("cancer", sa.Boolean(), nullable=True),
+        sa.Column("others", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("patient_id"),
+    )
+    op.create_table(
+        "patient_medication",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("medication", sa.String(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_ob_history",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("gravida", sa.SMALLINT(), nullable=True),
+        sa.Column("para", sa.SMALLINT(), nullable=True),
+        sa.Column("term", sa.SMALLINT(), nullable=True),
+        sa.Column("abortion", sa.SMALLINT(), nullable=True),
+        sa.Column("living", sa.SMALLINT(), nullable=True),
+        sa.Column("lmp", sa.Date(), nullable=True),
+        sa.Column("others", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("patient_id"),
+    )
+    op.create_table(
+        "patient_records",
+        sa.Column("account_id", sa.String(), nullable=True),
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("chief_complaint", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["medrekk_accounts.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_surgical_history",
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("chief_complaint", sa.String(), nullable=True),
+        sa.Column("surgery_date", sa.Date(), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "patient_blood_pressure",
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("dt_measured", sa.DateTime(), nullable=True),
+        sa.Column("systolic", sa.SMALLINT(), nullable=True),
+        sa.Column("diastolic", sa.SMALLINT(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["patient_records.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "record_id", "dt_measured", name="uc_bloodpressure_patient_dt"
+        ),
+    )
+    op.create_index(
+        "idx_bloodpressure_patient_dt",
+        "patient_blood_pressure",
+        ["record_id", "dt_measured"],
+        unique=False,
+    )
+    op.create_table(
+        "patient_body_temperature",
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("dt_measured", sa.DateTime(), nullable=True),
+        sa.Column("body_temperature", sa.Float(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["patient_records.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "record_id", "dt_measured", name="uc_bodytemperature_patient_dt"
+        ),
+    )
+    op.create_table(
+        "patient_diagnosis",
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("diagnosis_code", sa.String(), nullable=True),
+        sa.Column("diagnosis_description", sa.String(), nullable=True),
+        sa.Column("treatment_plans", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("notes", sa.ARRAY(sa.String()), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["patient_records.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("record_id", "diagnosis_code", name="uc_record_diagnosis"),
+    )
+    op.create_table(
+        "patient_heart_rate",
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("dt_measured", sa.DateTime(), nullable=True),
+        sa.Column("heart_rate", sa.SMALLINT(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["patient_records.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("record_id", "dt_measured", name="uc_heartrate_patient_dt"),
+    )
+    op.create_index(
+        "idx_heartrate_patient_dt",
+        "patient_heart_rate",
+        ["record_id", "dt_measured"],
+        unique=False,
+    )
+    op.create_table(
+        "patient_respiratory_rate",
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("dt_measured", sa.DateTime(), nullable=True),
+        sa.Column("respiratory_rate", sa.SMALLINT(), nullable=True),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["record_id"],
+            ["patient_records.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "record_id", "dt_measured", name="uc_respiratoryrate_patient_dt"
+        ),
+    )
+    op.create_index(
+        "idx_respiratoryrate_patient_dt",
+        "patient_respiratory_rate",
+        ["record_id", "dt_measured"],
+        unique=False,
+    )
+    op.create_table(
+        "patient_visits",
+        sa.Column("account_id", sa.String(), nullable=True),
+        sa.Column("patient_id", sa.String(), nullable=True),
+        sa.Column("appointment_id", sa.String(), nullable=True),
+        sa.Column("visit_date", sa.Date(), nullable=False),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("created", sa.DateTime(), nullable=True),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["medrekk_accounts.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["appointment_id"],
+            ["patient_appointments.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["patient_id"],
+            ["patient_profile.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("patient_id", "visit_date", name="uc_patient_visit"),
+    )
+    op.create_index(
+        "idx_patient_visit",
+        "patient_visits",
+        ["patient_id", "visit_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("account_owner", "medrekk_accounts", type_="foreignkey")
+    op.drop_table("patient_visits")
+    op.drop_table("patient_respiratory_rate")
+    op.drop_table("patient_heart_rate")
+    op.drop_table("patient_diagnosis")
+    op.drop_table("patient_body_temperature")
+    op.drop_table("patient_blood_pressure")
+    op.drop_table("patient_surgical_history")
+    op.drop_table("patient_records")
+    op.drop_table("patient_ob_history")
+    op.drop_table("patient_medication")
+    op.drop_table("patient_medical_history")
+    op.drop_table("patient_immunization")
+    op.drop_table("patient_hospitalization_history")
+    op.drop_table("patient_height")
+    op.drop_table("patient_family_history")
+    op.drop_table("patient_body_weight")
+    op.drop_table("patient_bmi")
+    op.drop_table("patient_appointments")
+    op.drop_table("patient_allergy")
+    op.drop_table("patient_profile")
+    op.drop_table("medrekk_user_profiles")
+    op.drop_table("medrekk_account_user_assoc")
+    op.drop_table("medrekk_users")
+    op.drop_table("medrekk_accounts")
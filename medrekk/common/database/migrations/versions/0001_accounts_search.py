@@ -0,0 +1,288 @@
+"""Patients owned by an account, searchable by name
+
+Revision ID: 0001
+Revises: 0000
+Create Date: 2026-10-18 00:00:00
+
+From the schema of 0000:
+
+  - `created`, `updated` and `trial_ends_at` get their defaults in the
+    database, so they are set on rows inserted in bulk too;
+  - patient_profile gets the PSGC codes of the address (all null, the
+    addresses entered so far are kept as they are), `search_name`, and
+    `account_id`, backfilled from the account of the patient's records,
+    appointments or visits, then made NOT NULL;
+  - the indexes of the keyset lists and of the patient search.
+
+The backfills and the index builds run batch by batch and CONCURRENTLY (see
+online.py), so it can run while the API is serving. Patients with none of
+these rows can't be given an account that way: the upgrade stops with their
+count, and is run again with the account to give them,
+
+    alembic -x orphan_patients_account=<account id> upgrade head
+"""
+
+from typing import Sequence, Union
+import unicodedata
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from medrekk.common.database.online import (
+    backfill,
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = "0000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = [
+    "medrekk_accounts",
+    "medrekk_users",
+    "medrekk_user_profiles",
+    "patient_profile",
+    "patient_allergy",
+    "patient_appointments",
+    "patient_bmi",
+    "patient_body_weight",
+    "patient_family_history",
+    "patient_height",
+    "patient_hospitalization_history",
+    "patient_immunization",
+    "patient_medical_history",
+    "patient_medication",
+    "patient_ob_history",
+    "patient_records",
+    "patient_surgical_history",
+    "patient_blood_pressure",
+    "patient_body_temperature",
+    "patient_diagnosis",
+    "patient_heart_rate",
+    "patient_respiratory_rate",
+    "patient_visits",
+]
+
+ADDRESS_CODES = [
+    "address_region_code",
+    "address_province_code",
+    "address_city_code",
+    "address_barangay_code",
+]
+
+# (name, table, columns, options)
+INDEXES = [
+    ("idx_users_account_created", "medrekk_users", ["account_id", "created", "id"], {}),
+    (
+        "idx_patient_profile_account_created",
+        "patient_profile",
+        ["account_id", "created", "id"],
+        {},
+    ),
+    (
+        "idx_patient_profile_account_city",
+        "patient_profile",
+        ["account_id", "address_city_code"],
+        {},
+    ),
+    (
+        "idx_patient_profile_search",
+        "patient_profile",
+        ["account_id", "search_name"],
+        {
+            "postgresql_using": "gin",
+            "postgresql_ops": {"search_name": "gin_trgm_ops"},
+        },
+    ),
+    ("idx_bmi_patient_created", "patient_bmi", ["patient_id", "created", "id"], {}),
+    (
+        "idx_records_patient_created",
+        "patient_records",
+        ["account_id", "patient_id", "created", "id"],
+        {},
+    ),
+    (
+        "idx_bloodpressure_record_created",
+        "patient_blood_pressure",
+        ["record_id", "created", "id"],
+        {},
+    ),
+]
+
+# The account of a patient's earliest record, appointment or visit.
+OWNER = "COALESCE({})".format(
+    ", ".join(
+        f"(SELECT account_id FROM {table} WHERE {table}.patient_id = "
+        f"patient_profile.id AND {table}.account_id IS NOT NULL "
+        f"ORDER BY {table}.created LIMIT 1)"
+        for table in ("patient_records", "patient_appointments", "patient_visits")
+    )
+)
+
+ORPHANS_OPTION = "orphan_patients_account"
+ACCOUNT_NOT_NULL = "patient_profile_account_id_not_null"
+
+
+def _unaccent_map() -> tuple[str, str]:
+    """
+    Latin letters with diacritics, and their base letters, for translate().
+    """
+    accented, plain = "", ""
+    for code in range(0xC0, 0x180):
+        char = chr(code)
+        base = "".join(
+            c
+            for c in unicodedata.normalize("NFKD", char)
+            if not unicodedata.combining(c)
+        )
+        if len(base) == 1 and base != char:
+            accented += char
+            plain += base
+    return accented, plain
+
+
+# normalize_name(lastname, firstname, middlename) in SQL, for the rows written
+# before search_name was. Letters outside of Latin-1 and Latin Extended-A keep
+# their accents; they are still found by the trigrams of the other letters.
+SEARCH_NAME = (
+    "trim(regexp_replace(regexp_replace(lower(translate("
+    "concat_ws(' ', lastname, firstname, middlename), '{}', '{}')), "
+    "'[^[:alnum:]_[:space:]]', ' ', 'g'), '\\s+', ' ', 'g'))"
+).format(*_unaccent_map())
+
+
+def backfill_accounts() -> None:
+    backfill(
+        "patient_profile",
+        f"account_id = {OWNER}",
+        f"account_id IS NULL AND {OWNER} IS NOT NULL",
+    )
+
+    account = context.get_x_argument(as_dictionary=True).get(ORPHANS_OPTION)
+    if op.get_context().as_sql:
+        if account is not None:
+            op.execute(
+                sa.text(
+                    "UPDATE patient_profile SET account_id = :account "
+                    "WHERE account_id IS NULL"
+                ).bindparams(account=account)
+            )
+        return
+
+    bind = op.get_bind()
+    if account is not None:
+        if not bind.execute(
+            sa.text("SELECT 1 FROM medrekk_accounts WHERE id = :account"),
+            {"account": account},
+        ).first():
+            raise ValueError(f"-x {ORPHANS_OPTION}: no account '{account}'.")
+        # An account ID, so it needs no quoting.
+        backfill("patient_profile", f"account_id = '{account}'", "account_id IS NULL")
+
+    orphans = bind.execute(
+        sa.text("SELECT count(*) FROM patient_profile WHERE account_id IS NULL")
+    ).scalar()
+    if orphans:
+        raise RuntimeError(
+            f"{orphans} patients have no record, appointment or visit to take "
+            f"their account from. Run again with -x {ORPHANS_OPTION}=<account id>."
+        )
+
+
+def require_account() -> None:
+    """
+    SET NOT NULL without a scan of the table under its ACCESS EXCLUSIVE lock:
+    a CHECK is validated first, under a lock that lets rows be written, and
+    SET NOT NULL relies on it.
+    """
+    op.execute(
+        f"ALTER TABLE patient_profile DROP CONSTRAINT IF EXISTS {ACCOUNT_NOT_NULL}"
+    )
+    op.execute(
+        f"ALTER TABLE patient_profile ADD CONSTRAINT {ACCOUNT_NOT_NULL} "
+        "CHECK (account_id IS NOT NULL) NOT VALID"
+    )
+    op.execute(f"ALTER TABLE patient_profile VALIDATE CONSTRAINT {ACCOUNT_NOT_NULL}")
+    op.alter_column(
+        "patient_profile", "account_id", existing_type=sa.String(), nullable=False
+    )
+    op.execute(f"ALTER TABLE patient_profile DROP CONSTRAINT {ACCOUNT_NOT_NULL}")
+
+
+def upgrade() -> None:
+    # Trigram search of patient names (idx_patient_profile_search).
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    for table in TIMESTAMPED_TABLES:
+        for column in ("created", "updated"):
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.DateTime(),
+                server_default=sa.text("now()"),
+            )
+    op.alter_column(
+        "medrekk_accounts",
+        "trial_ends_at",
+        existing_type=sa.DateTime(),
+        server_default=sa.text("now() + interval '14 days'"),
+    )
+
+    # Nullable, or with a constant default: the rows are not rewritten.
+    op.add_column(
+        "patient_profile",
+        sa.Column(
+            "account_id",
+            sa.String(),
+            sa.ForeignKey("medrekk_accounts.id"),
+            nullable=True,
+        ),
+    )
+    for column in ADDRESS_CODES:
+        op.add_column(
+            "patient_profile", sa.Column(column, sa.String(length=9), nullable=True)
+        )
+    op.add_column(
+        "patient_profile",
+        sa.Column("search_name", sa.String(), server_default="", nullable=False),
+    )
+
+    backfill_accounts()
+    require_account()
+    backfill(
+        "patient_profile",
+        f"search_name = {SEARCH_NAME}",
+        f"search_name = '' AND {SEARCH_NAME} <> ''",
+    )
+
+    for name, table, columns, options in INDEXES:
+        create_index_concurrently(name, table, columns, **options)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        drop_index_concurrently(name, table)
+
+    op.drop_column("patient_profile", "search_name")
+    for column in reversed(ADDRESS_CODES):
+        op.drop_column("patient_profile", column)
+    op.drop_column("patient_profile", "account_id")
+
+    op.alter_column(
+        "medrekk_accounts",
+        "trial_ends_at",
+        existing_type=sa.DateTime(),
+        server_default=None,
+    )
+    for table in reversed(TIMESTAMPED_TABLES):
+        for column in ("updated", "created"):
+            op.alter_column(
+                table, column, existing_type=sa.DateTime(), server_default=None
+            )
+
+    op.execute("DROP EXTENSION IF EXISTS btree_gin")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
@@ -0,0 +1,124 @@
+"""Index every parent lookup (index audit)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+Built with CONCURRENTLY, so it can run while the API is serving.
+"""
+
+from typing import Sequence, Union
+
+from medrekk.common.database.online import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    replace_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lists of a parent's rows in keyset order.
+NEW_INDEXES = [
+    ("idx_accounts_owner", "medrekk_accounts", ["owner_id"]),
+    (
+        "idx_appointment_patient_date",
+        "patient_appointments",
+        ["patient_id", "appointment_date"],
+    ),
+    ("idx_visit_appointment", "patient_visits", ["appointment_id"]),
+    (
+        "idx_diagnosis_record_created",
+        "patient_diagnosis",
+        ["record_id", "created", "id"],
+    ),
+    (
+        "idx_bodytemperature_patient_dt",
+        "patient_body_temperature",
+        ["record_id", "dt_measured", "id"],
+    ),
+    (
+        "idx_bodyweight_patient_created",
+        "patient_body_weight",
+        ["patient_id", "created", "id"],
+    ),
+    ("idx_height_patient_created", "patient_height", ["patient_id", "created", "id"]),
+    (
+        "idx_hospitalization_patient_created",
+        "patient_hospitalization_history",
+        ["patient_id", "created", "id"],
+    ),
+    (
+        "idx_surgical_patient_created",
+        "patient_surgical_history",
+        ["patient_id", "created", "id"],
+    ),
+    (
+        "idx_medication_patient_created",
+        "patient_medication",
+        ["patient_id", "created", "id"],
+    ),
+    ("idx_allergy_patient_created", "patient_allergy", ["patient_id", "created", "id"]),
+    (
+        "idx_immunization_patient_created",
+        "patient_immunization",
+        ["patient_id", "created", "id"],
+    ),
+]
+# Same name, new columns: (name, table, columns after, columns before).
+CHANGED_INDEXES = [
+    (
+        "idx_records_patient_created",
+        "patient_records",
+        ["patient_id", "created", "id"],
+        ["account_id", "patient_id", "created", "id"],
+    ),
+    (
+        "idx_bloodpressure_patient_dt",
+        "patient_blood_pressure",
+        ["record_id", "dt_measured", "id"],
+        ["record_id", "dt_measured"],
+    ),
+    (
+        "idx_heartrate_patient_dt",
+        "patient_heart_rate",
+        ["record_id", "dt_measured", "id"],
+        ["record_id", "dt_measured"],
+    ),
+    (
+        "idx_respiratoryrate_patient_dt",
+        "patient_respiratory_rate",
+        ["record_id", "dt_measured", "id"],
+        ["record_id", "dt_measured"],
+    ),
+]
+# Unused, or duplicates of a unique constraint.
+DROPPED_INDEXES = [
+    (
+        "idx_bloodpressure_record_created",
+        "patient_blood_pressure",
+        ["record_id", "created", "id"],
+    ),
+    ("idx_patient_visit", "patient_visits", ["patient_id", "visit_date"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in NEW_INDEXES:
+        create_index_concurrently(name, table, columns)
+    for name, table, columns, _ in CHANGED_INDEXES:
+        replace_index_concurrently(name, table, columns)
+    for name, table, _ in DROPPED_INDEXES:
+        drop_index_concurrently(name, table)
+
+
+def downgrade() -> None:
+    for name, table, columns in DROPPED_INDEXES:
+        create_index_concurrently(name, table, columns)
+    for name, table, _, columns in CHANGED_INDEXES:
+        replace_index_concurrently(name, table, columns)
+    for name, table, _ in NEW_INDEXES:
+        drop_index_concurrently(name, table)
@@ -0,0 +1,197 @@
+"""Partition the vitals tables by month of dt_measured
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+Postgres can't partition a table in place. For each vitals table, the
+upgrade:
+
+  1. renames the table, and its indexes, to <table>_unpartitioned;
+  2. creates the partitioned table under the old name, with a partition for
+     every month that has readings and for the months ahead;
+  3. copies the readings one month per transaction, newest first. New
+     readings go to the partitioned table from step 2 on, and recent months
+     are readable again first;
+  4. drops <table>_unpartitioned once every row is copied. Rows without a
+     dt_measured can't be; the table is then kept for a look.
+
+Steps 1 and 2 change the catalog only and commit before the copy starts.
+With --sql, only the months ahead are created: run it online on a database
+that has readings.
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from medrekk.common.database.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    add_months,
+    create_partition,
+    month_start,
+    partition_name,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (name in constraints and indexes, value columns)
+VITALS = {
+    "patient_blood_pressure": (
+        "bloodpressure",
+        [("systolic", sa.SMALLINT), ("diastolic", sa.SMALLINT)],
+    ),
+    "patient_heart_rate": ("heartrate", [("heart_rate", sa.SMALLINT)]),
+    "patient_respiratory_rate": (
+        "respiratoryrate",
+        [("respiratory_rate", sa.SMALLINT)],
+    ),
+    "patient_body_temperature": (
+        "bodytemperature",
+        [("body_temperature", sa.Float)],
+    ),
+}
+
+SUFFIX = "_unpartitioned"
+
+
+def column_names(table: str) -> str:
+    _, values = VITALS[table]
+    names = ["record_id", "dt_measured", *(name for name, _ in values)]
+    return ", ".join([*names, "id", "created", "updated"])
+
+
+def create_vitals_table(table: str, partitioned: bool) -> None:
+    short, values = VITALS[table]
+    options = {"postgresql_partition_by": "RANGE (dt_measured)"} if partitioned else {}
+    op.create_table(
+        table,
+        sa.Column("record_id", sa.String(), nullable=True),
+        sa.Column("dt_measured", sa.DateTime(), nullable=not partitioned),
+        *(sa.Column(name, type_(), nullable=True) for name, type_ in values),
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column(
+            "created", sa.DateTime(), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.Column(
+            "updated", sa.DateTime(), server_default=sa.text("now()"), nullable=True
+        ),
+        sa.ForeignKeyConstraint(["record_id"], ["patient_records.id"]),
+        sa.PrimaryKeyConstraint(*(["id", "dt_measured"] if partitioned else ["id"])),
+        sa.UniqueConstraint(
+            "record_id", "dt_measured", name=f"uc_{short}_patient_dt"
+        ),
+        **options,
+    )
+    op.create_index(
+        f"idx_{short}_patient_dt", table, ["record_id", "dt_measured", "id"]
+    )
+
+
+def rename_vitals_table(table: str, new_name: str) -> None:
+    """
+    Renames `table` and the indexes whose names must be free for the table
+    that takes its place.
+    """
+    short, _ = VITALS[table]
+    suffix = new_name[len(table) :]
+    op.rename_table(table, new_name)
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {new_name}_pkey")
+    op.execute(
+        f"ALTER TABLE {new_name} RENAME CONSTRAINT uc_{short}_patient_dt "
+        f"TO uc_{short}_patient_dt{suffix}"
+    )
+    op.execute(
+        f"ALTER INDEX idx_{short}_patient_dt RENAME TO idx_{short}_patient_dt{suffix}"
+    )
+
+
+def copy_readings(source: str, table: str, months: Sequence[date]) -> None:
+    columns = column_names(table)
+    statement = (
+        f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {source} "
+        "WHERE dt_measured >= :start AND dt_measured < :end ON CONFLICT DO NOTHING"
+    )
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        for month in months:
+            bind.execute(
+                sa.text(statement), {"start": month, "end": add_months(month, 1)}
+            )
+
+
+def all_copied(source: str, table: str) -> bool:
+    return op.get_bind().scalar(
+        sa.text(
+            f"SELECT NOT EXISTS (SELECT 1 FROM {source} old WHERE NOT EXISTS ("
+            f"SELECT 1 FROM {table} new "
+            "WHERE new.id = old.id AND new.dt_measured = old.dt_measured))"
+        )
+    )
+
+
+def upgrade() -> None:
+    this_month = month_start(date.today())
+    ahead = {add_months(this_month, i) for i in range(PARTITION_MONTHS_AHEAD + 1)}
+
+    if op.get_context().as_sql:
+        for table in VITALS:
+            rename_vitals_table(table, table + SUFFIX)
+            create_vitals_table(table, partitioned=True)
+            for month in sorted(ahead):
+                op.execute(
+                    f"CREATE TABLE {partition_name(table, month)} PARTITION OF "
+                    f"{table} FOR VALUES FROM ('{month}') "
+                    f"TO ('{add_months(month, 1)}')"
+                )
+        return
+
+    bind = op.get_bind()
+    months = {}
+    for table in VITALS:
+        source = table + SUFFIX
+        rename_vitals_table(table, source)
+        create_vitals_table(table, partitioned=True)
+        months[table] = sorted(
+            {
+                month_start(month)
+                for month in bind.scalars(
+                    sa.text(
+                        f"SELECT DISTINCT date_trunc('month', dt_measured) "
+                        f"FROM {source} WHERE dt_measured IS NOT NULL"
+                    )
+                )
+            },
+            reverse=True,
+        )
+        for month in sorted(ahead.union(months[table])):
+            create_partition(bind, table, month)
+
+    for table in VITALS:
+        source = table + SUFFIX
+        copy_readings(source, table, months[table])
+        if all_copied(source, table):
+            op.drop_table(source)
+
+
+def downgrade() -> None:
+    for table in VITALS:
+        source = table + "_partitioned"
+        rename_vitals_table(table, source)
+        create_vitals_table(table, partitioned=False)
+        columns = column_names(table)
+        op.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {source}")
+        # Readings the upgrade could not move, if it kept them.
+        op.execute(
+            f"DO $$ BEGIN IF to_regclass('{table}{SUFFIX}') IS NOT NULL THEN "
+            f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}{SUFFIX} "
+            f"ON CONFLICT DO NOTHING; DROP TABLE {table}{SUFFIX}; END IF; END $$"
+        )
+        # Drops the partitions with it.
+        op.drop_table(source)
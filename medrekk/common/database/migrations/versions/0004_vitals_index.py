@@ -0,0 +1,79 @@
+"""Optional BRIN index on the vitals tables
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+An option of the migration, not of the models or the environment of the
+app:
+
+    alembic -x vitals_index=brin upgrade head
+
+adds a BRIN index on (dt_measured, created) to each vitals table. Readings
+arrive in about dt_measured order, so a few pages serve the reads of a time
+range across records (exports, reports), at next to no cost per insert.
+The (record_id, dt_measured, id) B-tree of a record's keyset pages stays
+either way. Without the option ("btree", the default) the upgrade changes
+nothing.
+
+The index is built, partition by partition and CONCURRENTLY, by online.py.
+The downgrade drops it, so the option of a database past 0004 is changed
+with
+
+    alembic downgrade 0003 && alembic -x vitals_index=brin upgrade head
+"""
+
+from typing import Sequence, Union
+
+from alembic import context
+
+from medrekk.common.database.online import (
+    create_partitioned_index_concurrently,
+    drop_partitioned_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VITALS = {
+    "patient_blood_pressure": "bloodpressure",
+    "patient_heart_rate": "heartrate",
+    "patient_respiratory_rate": "respiratoryrate",
+    "patient_body_temperature": "bodytemperature",
+}
+
+LAYOUTS = ("btree", "brin")
+
+BRIN_COLUMNS = ["dt_measured", "created"]
+# Heap pages summarised by one BRIN entry: smaller ranges skip more of the
+# pages next to the window. autosummarize summarises each range once it is
+# full, instead of at the next vacuum; until then it is read on every query.
+BRIN_WITH = {"pages_per_range": 32, "autosummarize": "on"}
+
+
+def brin_index(short: str) -> str:
+    return f"brin_{short}_dt"
+
+
+def layout() -> str:
+    value = context.get_x_argument(as_dictionary=True).get("vitals_index", "btree")
+    if value not in LAYOUTS:
+        raise ValueError(f"-x vitals_index must be 'btree' or 'brin', not '{value}'.")
+    return value
+
+
+def upgrade() -> None:
+    if layout() != "brin":
+        return
+    for table, short in VITALS.items():
+        create_partitioned_index_concurrently(
+            brin_index(short), table, BRIN_COLUMNS, using="brin", with_=BRIN_WITH
+        )
+
+
+def downgrade() -> None:
+    for short in VITALS.values():
+        drop_partitioned_index(brin_index(short))
@@ -0,0 +1,98 @@
+"""Compare IDs in the "C" collation
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+IDs from `shortid` sort in the order they were generated byte by byte (see
+ShortIDType), which the database's default collation does not compare by.
+Moves every ID column, and every foreign key to one, to the "C" collation.
+
+The column type stays varchar, so the rows are not rewritten, but every
+index, primary key and foreign key on these columns is rebuilt under an
+ACCESS EXCLUSIVE lock of its table. Unlike the other revisions, it can't
+run while the API is serving, so both directions refuse to run unless
+opted in, in a maintenance window:
+
+    alembic -x rebuild_id_indexes=yes upgrade head
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (columns, nullable)
+ID_COLUMNS = {
+    "medrekk_accounts": [("id", False), ("owner_id", True)],
+    "medrekk_users": [("id", False), ("account_id", True)],
+    "medrekk_account_user_assoc": [("user_id", False), ("account_id", False)],
+    "medrekk_user_profiles": [("id", False), ("user_id", True)],
+    "patient_profile": [("id", False), ("account_id", False)],
+    "patient_allergy": [("id", False), ("patient_id", True)],
+    "patient_appointments": [
+        ("id", False),
+        ("account_id", True),
+        ("patient_id", True),
+    ],
+    "patient_bmi": [("id", False), ("patient_id", True)],
+    "patient_body_weight": [("id", False), ("patient_id", True)],
+    "patient_family_history": [("id", False), ("patient_id", True)],
+    "patient_height": [("id", False), ("patient_id", True)],
+    "patient_hospitalization_history": [("id", False), ("patient_id", True)],
+    "patient_immunization": [("id", False), ("patient_id", True)],
+    "patient_medical_history": [("id", False), ("patient_id", True)],
+    "patient_medication": [("id", False), ("patient_id", True)],
+    "patient_ob_history": [("id", False), ("patient_id", True)],
+    "patient_records": [("id", False), ("account_id", True), ("patient_id", True)],
+    "patient_surgical_history": [("id", False), ("patient_id", True)],
+    "patient_blood_pressure": [("id", False), ("record_id", True)],
+    "patient_body_temperature": [("id", False), ("record_id", True)],
+    "patient_diagnosis": [("id", False), ("record_id", True)],
+    "patient_heart_rate": [("id", False), ("record_id", True)],
+    "patient_respiratory_rate": [("id", False), ("record_id", True)],
+    "patient_visits": [
+        ("id", False),
+        ("account_id", True),
+        ("patient_id", True),
+        ("appointment_id", True),
+    ],
+}
+
+
+OPT_IN = "rebuild_id_indexes"
+
+
+def require_opt_in() -> None:
+    if context.get_x_argument(as_dictionary=True).get(OPT_IN) != "yes":
+        raise RuntimeError(
+            f"Revision {revision} locks every table while it rebuilds their ID "
+            f"indexes. Run it in a maintenance window, with -x {OPT_IN}=yes."
+        )
+
+
+def collate(collation: Union[str, None]) -> None:
+    require_opt_in()
+    for table, columns in ID_COLUMNS.items():
+        for column, nullable in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(collation=collation),
+                existing_type=sa.String(),
+                existing_nullable=nullable,
+            )
+
+
+def upgrade() -> None:
+    collate("C")
+
+
+def downgrade() -> None:
+    collate(None)
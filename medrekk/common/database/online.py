@@ -0,0 +1,181 @@
+"""
+Operations for migrations that run against a live database.
+
+A plain CREATE INDEX blocks writes to the table until the build is done, and
+one UPDATE over a whole table holds every row lock it takes until it commits.
+These helpers do the same work without stalling the API. They run outside of
+the migration's transaction, so a migration using them should do nothing else
+that has to be rolled back with it.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+BACKFILL_BATCH = int(os.getenv("MEDREKK_BACKFILL_BATCH", "5000"))
+
+
+def _invalid_index(name: str) -> bool:
+    """
+    Whether a failed CONCURRENTLY build left index `name` behind as INVALID.
+    Such an index is updated on every write but never used.
+    """
+    if op.get_context().as_sql:
+        return False
+    return bool(
+        op.get_bind()
+        .execute(
+            text(
+                "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = indexrelid "
+                "WHERE relname = :name AND NOT indisvalid"
+            ),
+            {"name": name},
+        )
+        .first()
+    )
+
+
+def create_index_concurrently(
+    name: str, table: str, columns: Sequence[str], **kwargs
+) -> None:
+    """
+    CREATE INDEX CONCURRENTLY. Rebuilds the index if an earlier attempt left
+    it INVALID, so a failed migration can simply be run again.
+    """
+    with op.get_context().autocommit_block():
+        if _invalid_index(name):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
+        op.create_index(
+            name,
+            table,
+            list(columns),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            name, table_name=table, postgresql_concurrently=True, if_exists=True
+        )
+
+
+def replace_index_concurrently(
+    name: str, table: str, columns: Sequence[str], **kwargs
+) -> None:
+    """
+    Rebuilds index `name` on new `columns`. The new index is built next to
+    the old one and renamed once the old one is dropped, so queries always
+    have one of the two.
+    """
+    create_index_concurrently(f"{name}_new", table, columns, **kwargs)
+    drop_index_concurrently(name, table)
+    op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def _unindexed_partitions(name: str, table: str) -> List[str]:
+    """
+    Partitions of `table` with no index attached to the partitioned index
+    `name` yet.
+    """
+    return (
+        op.get_bind()
+        .execute(
+            text(
+                "SELECT partition.inhrelid::regclass::text FROM pg_inherits partition "
+                "WHERE partition.inhparent = to_regclass(:table) AND NOT EXISTS ("
+                "SELECT 1 FROM pg_inherits child "
+                "JOIN pg_index ON pg_index.indexrelid = child.inhrelid "
+                "WHERE child.inhparent = to_regclass(:name) "
+                "AND pg_index.indrelid = partition.inhrelid) "
+                "ORDER BY 1"
+            ),
+            {"name": name, "table": table},
+        )
+        .scalars()
+        .all()
+    )
+
+
+def create_partitioned_index_concurrently(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    using: str = "btree",
+    with_: Optional[Dict[str, object]] = None,
+) -> None:
+    """
+    CREATE INDEX CONCURRENTLY on a partitioned table, which Postgres doesn't
+    support as such. The index is created on the parent alone (ON ONLY, and
+    INVALID until every partition has its part), built concurrently on each
+    partition and attached. Partitions created meanwhile get their part from
+    the parent. Run again after a failure, it picks up where it stopped.
+
+    With --sql, a plain CREATE INDEX, which blocks writes while it builds.
+    """
+    definition = f"USING {using} ({', '.join(columns)})"
+    if with_:
+        storage = ", ".join(f"{key} = {value}" for key, value in with_.items())
+        definition += f" WITH ({storage})"
+
+    if op.get_context().as_sql:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} {definition}")
+        return
+
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY {table} {definition}")
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for partition in _unindexed_partitions(name, table):
+            # e.g. brin_heartrate_dt_p202403 for patient_heart_rate_p202403.
+            part = name + partition[len(table) :]
+            if _invalid_index(part):
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {part}")
+            bind.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {part} "
+                    f"ON {partition} {definition}"
+                )
+            )
+            bind.execute(text(f"ALTER INDEX {name} ATTACH PARTITION {part}"))
+
+
+def drop_partitioned_index(name: str) -> None:
+    """
+    DROP INDEX on a partitioned table, which can't be done CONCURRENTLY. It
+    locks the table and its partitions for the catalog change only, and
+    gives up after the migration's lock_timeout rather than queue queries
+    behind it.
+    """
+    op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def backfill(
+    table: str, assignments: str, where: str, batch_size: int = BACKFILL_BATCH
+) -> None:
+    """
+    UPDATE `table` SET `assignments` WHERE `where`, `batch_size` rows at a
+    time, each batch committed on its own. Locks are held for one batch, and
+    autovacuum can reclaim the old row versions while the backfill runs.
+
+    `where` must stop matching a row once it is updated, e.g.
+    `backfill("patient_profile", "search_name = ...", "search_name = ''")`.
+    """
+    if op.get_context().as_sql:
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {where}")
+        return
+
+    batch = text(
+        f"UPDATE {table} SET {assignments} WHERE id IN ("
+        f"SELECT id FROM {table} WHERE {where} "
+        "LIMIT :batch_size FOR UPDATE SKIP LOCKED)"
+    )
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while bind.execute(batch, {"batch_size": batch_size}).rowcount:
+            pass
@@ -0,0 +1,251 @@
+"""
+Monthly range partitions on `dt_measured`, for the vitals tables.
+
+A table is partitioned when its model sets
+`"postgresql_partition_by": "RANGE (dt_measured)"`. Each month is a partition
+named `<table>_pYYYYMM`, for [first of the month, first of the next month).
+
+Partitions are created:
+
+  - ahead of time, from the current month to PARTITION_MONTHS_AHEAD months
+    later, by `maintain()`. The app runs it at startup and then every
+    PARTITION_CHECK_INTERVAL seconds;
+  - on demand by `ensure()`, for readings of months not created yet, e.g.
+    backdated entries from paper charts. A write that still finds no
+    partition, because the month was detached since it was cached, is
+    retried once after the catalog is read again (see VitalsRepository).
+
+There is no default partition. It would be scanned whenever a month is
+added, and it keeps the planner from reading the months newest first and
+stopping at the LIMIT of a keyset page.
+
+Old months are never dropped automatically. `detach()` turns them into plain
+tables, to be archived (pg_dump -t) and dropped by hand:
+
+    python -m medrekk.common.database.partitions [--detach-before 2021-01]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import re
+from datetime import date, datetime
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set
+
+from fastapi.concurrency import run_in_threadpool
+from psycopg.errors import CheckViolation
+from sqlalchemy import Connection, Engine, MetaData, Table, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from medrekk.common.database.connection import Base, engine
+
+PARTITION_MONTHS_AHEAD = int(os.getenv("MEDREKK_PARTITION_MONTHS_AHEAD", "3"))
+PARTITION_CHECK_INTERVAL = int(os.getenv("MEDREKK_PARTITION_CHECK_INTERVAL", "86400"))
+
+PARTITION_NAME = re.compile(r"^(?P<table>\w+)_p(?P<month>\d{6})$")
+
+logger = logging.getLogger(__name__)
+
+# Months known to have a partition, per table. Filled from the catalog on
+# first use, so `ensure()` costs no query for months created before.
+_known: Dict[str, Set[date]] = {}
+_known_lock = Lock()
+
+
+def is_partitioned(table: Table) -> bool:
+    return bool(table.dialect_options["postgresql"]["partition_by"])
+
+
+def partitioned_tables(metadata: MetaData = Base.metadata) -> List[Table]:
+    return [table for table in metadata.tables.values() if is_partitioned(table)]
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def is_partition(name: str) -> bool:
+    return PARTITION_NAME.match(name) is not None
+
+
+def existing_months(connection: Connection, table: str) -> Set[date]:
+    names = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = inhrelid "
+            "WHERE inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    ).scalars()
+    months = set()
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match and match["table"] == table:
+            months.add(datetime.strptime(match["month"], "%Y%m").date())
+    return months
+
+
+def create_partition(connection: Connection, table: str, month: date) -> bool:
+    """
+    Creates the partition of `month` unless it exists, and returns whether it
+    did. The partition is created as a table of its own and then attached,
+    which locks the parent with SHARE UPDATE EXCLUSIVE only: reads and
+    writes of the other months go on. Callers racing on the same month are
+    serialised by an advisory lock, held until `connection` commits.
+    """
+    name = partition_name(table, month)
+    connection.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": name}
+    )
+    if connection.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        return False
+
+    # ATTACH creates the indexes, unique and foreign key constraints of the
+    # parent on the new partition.
+    connection.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+    connection.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+        )
+    )
+    return True
+
+
+def ensure(db: Session, table: Table, values: Iterable[Optional[datetime]]) -> None:
+    """
+    Creates the missing partitions of `table` for the months of `values`.
+
+    They are created on the session's own connection, and `db` is committed
+    before the rows that need them are written: a partition must outlive a
+    failed insert, or the cache would claim a month that doesn't exist.
+    """
+    if not is_partitioned(table):
+        return
+
+    months = {month_start(value) for value in values if value is not None}
+    if not months:
+        return
+    with _known_lock:
+        known = _known.get(table.name)
+    if known is not None and months <= known:
+        return
+
+    connection = db.connection()
+    if known is None:
+        known = existing_months(connection, table.name)
+    missing = sorted(months - known)
+    for month in missing:
+        create_partition(connection, table.name, month)
+    if missing:
+        db.commit()
+    with _known_lock:
+        _known[table.name] = known | months
+
+
+def forget(table: str) -> None:
+    """
+    Drops the cached months of `table`, so the next `ensure()` reads them
+    from the catalog again.
+    """
+    with _known_lock:
+        _known.pop(table, None)
+
+
+def is_missing_partition(e: DBAPIError) -> bool:
+    """
+    Whether `e` is an insert or update of a row whose month has no partition,
+    e.g. one detached by another worker or the CLI since it was cached.
+    """
+    diag = getattr(e.orig, "diag", None)
+    return isinstance(e.orig, CheckViolation) and (
+        diag.message_primary or ""
+    ).startswith("no partition of relation")
+
+
+def maintain(bind: Engine = engine, today: Optional[date] = None) -> List[str]:
+    """
+    Creates the partitions from the current month to PARTITION_MONTHS_AHEAD
+    months later, for every partitioned table. Returns the names created.
+    """
+    this_month = month_start(today or date.today())
+    months = [add_months(this_month, i) for i in range(PARTITION_MONTHS_AHEAD + 1)]
+    created = []
+    for table in partitioned_tables():
+        with bind.begin() as connection:
+            for month in months:
+                if create_partition(connection, table.name, month):
+                    created.append(partition_name(table.name, month))
+        forget(table.name)
+    return created
+
+
+def detach(table: str, before: date, bind: Engine = engine) -> List[str]:
+    """
+    Detaches the partitions of `table` for the months before `before`. Uses
+    DETACH ... CONCURRENTLY, so queries of the other months are not blocked.
+    Returns the names of the detached tables.
+    """
+    detached = []
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for month in sorted(existing_months(connection, table)):
+            if month >= month_start(before):
+                continue
+            name = partition_name(table, month)
+            connection.execute(
+                text(f"ALTER TABLE {table} DETACH PARTITION {name} CONCURRENTLY")
+            )
+            detached.append(name)
+    forget(table)
+    return detached
+
+
+async def run_maintenance(interval: int = PARTITION_CHECK_INTERVAL) -> None:
+    """
+    Runs `maintain()` every `interval` seconds until cancelled. Every worker
+    runs it; the advisory lock of `create_partition` keeps them in line.
+    """
+    while True:
+        try:
+            await run_in_threadpool(maintain)
+        except Exception:
+            # The months ahead cover several missed runs; ensure() covers
+            # the rest.
+            logger.exception("Partition maintenance failed.")
+        await asyncio.sleep(interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--detach-before",
+        type=lambda value: datetime.strptime(value, "%Y-%m").date(),
+        help="detach the months before YYYY-MM",
+    )
+    args = parser.parse_args()
+
+    # Registers the models with Base.metadata.
+    import medrekk.main  # noqa: F401
+
+    for name in maintain():
+        print(f"created {name}")
+    if args.detach_before:
+        for table in partitioned_tables():
+            for name in detach(table.name, args.detach_before):
+                print(f"detached {name}")
+
+
+if __name__ == "__main__":
+    main()
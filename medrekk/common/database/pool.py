@@ -0,0 +1,214 @@
+from threading import Lock
+from time import perf_counter
+
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+from .settings import (
+    DB_MAX_OVERFLOW,
+    DB_POOL,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+
+class PoolMetrics:
+    """
+    Checkout counters and wait times for one engine's connection pool.
+
+    `wait` is the time spent getting a connection out of the pool, i.e. the
+    queueing a request sees when every connection is checked out.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.engine: Engine | None = None
+        self._lock = Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.checked_out_peak = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        self.engine = engine
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.checked_out_peak = max(self.checked_out_peak, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out -= 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = {
+                "pool": DB_POOL,
+                "pool_size": DB_POOL_SIZE,
+                "max_overflow": DB_MAX_OVERFLOW,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "checked_out": self.checked_out,
+                "checked_out_peak": self.checked_out_peak,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": (
+                    self.wait_total / self.wait_count * 1000 if self.wait_count else 0.0
+                ),
+                "wait_max_ms": self.wait_max * 1000,
+            }
+        if self.engine is not None and isinstance(self.engine.pool, QueuePool):
+            data["status"] = self.engine.pool.status()
+        if self.name in psycopg_pools:
+            # psycopg_pool keeps its own wait statistics (requests_wait_ms, ...).
+            data["psycopg"] = psycopg_pools[self.name].get_stats()
+        return data
+
+
+class _TimedCheckout:
+    """
+    Mixin for SQLAlchemy queue pools that reports the time spent in `_do_get`
+    (waiting for a free connection, or opening a new one) to `metrics`.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.observe_wait(perf_counter() - start)
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+psycopg_pools: dict[str, ConnectionPool | AsyncConnectionPool] = {}
+
+
+def sync_pool_options(conninfo: str) -> dict:
+    """
+    Keyword arguments for `create_engine` according to the pool settings.
+    """
+    if DB_POOL == "psycopg":
+        pool = ConnectionPool(
+            conninfo,
+            min_size=DB_POOL_SIZE,
+            max_size=DB_POOL_SIZE + DB_MAX_OVERFLOW,
+            timeout=DB_POOL_TIMEOUT,
+            max_lifetime=DB_POOL_RECYCLE,
+            check=ConnectionPool.check_connection if DB_POOL_PRE_PING else None,
+            # close() hands the connection back to the pool, which lets
+            # SQLAlchemy's NullPool "close" connections it is done with.
+            close_returns=True,
+            open=False,
+            name="medrekk-sync",
+        )
+        psycopg_pools["sync"] = pool
+
+        def getconn():
+            # Opened on first use so that importing the app does not connect.
+            pool.open()
+            start = perf_counter()
+            try:
+                return pool.getconn()
+            finally:
+                sync_pool_metrics.observe_wait(perf_counter() - start)
+
+        return {"creator": getconn, "poolclass": NullPool}
+
+    return {
+        "poolclass": type(
+            "TimedQueuePool",
+            (_TimedCheckout, QueuePool),
+            {"metrics": sync_pool_metrics},
+        ),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+def async_pool_options(conninfo: str) -> dict:
+    """
+    Keyword arguments for `create_async_engine` according to the pool settings.
+    """
+    if DB_POOL == "psycopg":
+        pool = AsyncConnectionPool(
+            conninfo,
+            min_size=DB_POOL_SIZE,
+            max_size=DB_POOL_SIZE + DB_MAX_OVERFLOW,
+            timeout=DB_POOL_TIMEOUT,
+            max_lifetime=DB_POOL_RECYCLE,
+            check=AsyncConnectionPool.check_connection if DB_POOL_PRE_PING else None,
+            close_returns=True,
+            open=False,
+            name="medrekk-async",
+        )
+        psycopg_pools["async"] = pool
+
+        async def getconn():
+            # AsyncConnectionPool must be opened from inside the running loop.
+            await pool.open()
+            start = perf_counter()
+            try:
+                return await pool.getconn()
+            finally:
+                async_pool_metrics.observe_wait(perf_counter() - start)
+
+        return {"async_creator": getconn, "poolclass": NullPool}
+
+    return {
+        "poolclass": type(
+            "TimedAsyncAdaptedQueuePool",
+            (_TimedCheckout, AsyncAdaptedQueuePool),
+            {"metrics": async_pool_metrics},
+        ),
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+async def close_psycopg_pools() -> None:
+    for pool in psycopg_pools.values():
+        if isinstance(pool, AsyncConnectionPool):
+            await pool.close()
+        else:
+            pool.close()
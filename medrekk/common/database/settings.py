@@ -0,0 +1,50 @@
+import os
+
+# Database access mode for the API routes.
+#   "sync":  controllers run on a regular `Session` in Starlette's threadpool.
+#   "async": controllers run on an `AsyncSession` (psycopg async) on the event loop.
+# Switch per deployment with `MEDREKK_DB_MODE` to compare the two under load.
+DB_MODE = os.getenv("MEDREKK_DB_MODE", "sync").lower()
+
+if DB_MODE not in ("sync", "async"):
+    raise ValueError(f"MEDREKK_DB_MODE must be 'sync' or 'async', not '{DB_MODE}'.")
+
+DB_ASYNC = DB_MODE == "async"
+
+DB_ECHO = os.getenv("MEDREKK_DB_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Connection pool. All values are per engine, i.e. per uvicorn worker.
+#   "queue":   SQLAlchemy's QueuePool (default).
+#   "psycopg": psycopg_pool.ConnectionPool / AsyncConnectionPool.
+DB_POOL = os.getenv("MEDREKK_DB_POOL", "queue").lower()
+
+if DB_POOL not in ("queue", "psycopg"):
+    raise ValueError(f"MEDREKK_DB_POOL must be 'queue' or 'psycopg', not '{DB_POOL}'.")
+
+# Optional budget for the whole deployment. When set, it is split evenly across
+# the uvicorn workers (`WEB_CONCURRENCY`) and overflow is disabled, so the
+# workers together never open more than MEDREKK_DB_MAX_CONNECTIONS connections.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+DB_MAX_CONNECTIONS = int(os.getenv("MEDREKK_DB_MAX_CONNECTIONS", "0"))
+
+if DB_MAX_CONNECTIONS:
+    _pool_size_default = max(DB_MAX_CONNECTIONS // max(WEB_CONCURRENCY, 1), 1)
+    _max_overflow_default = 0
+else:
+    _pool_size_default = 5
+    _max_overflow_default = 10
+
+DB_POOL_SIZE = int(os.getenv("MEDREKK_DB_POOL_SIZE", _pool_size_default))
+DB_MAX_OVERFLOW = int(os.getenv("MEDREKK_DB_MAX_OVERFLOW", _max_overflow_default))
+# Seconds to wait for a free connection before failing the request.
+DB_POOL_TIMEOUT = float(os.getenv("MEDREKK_DB_POOL_TIMEOUT", "30"))
+# Seconds after which a connection is replaced. Keeps connections from
+# outliving a Postgres failover or an idle timeout on a proxy.
+DB_POOL_RECYCLE = int(os.getenv("MEDREKK_DB_POOL_RECYCLE", "1800"))
+# Test connections on checkout so stale ones are replaced instead of failing
+# the first request after a failover.
+DB_POOL_PRE_PING = os.getenv("MEDREKK_DB_POOL_PRE_PING", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
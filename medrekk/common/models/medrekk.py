@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 from typing import List
 from sqlalchemy import (
     Boolean,
@@ -6,20 +5,25 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     SmallInteger,
     String,
     Table,
+    func,
+    text,
 )
 from sqlalchemy.orm import Mapped, relationship
 
-from medrekk.common.database.connection import Base
+from medrekk.common.database.connection import Base, ShortIDType
 from medrekk.common.utils import shortid
 
 
 class MedRekkBase:
-    id = Column(String, default=shortid(), primary_key=True)
-    created = Column(DateTime, default=datetime.now())
-    updated = Column(DateTime, default=datetime.now())
+    # Callables and SQL defaults run per row; `shortid()` or `datetime.now()`
+    # here would be evaluated once, at import.
+    id = Column(ShortIDType, default=shortid, primary_key=True)
+    created = Column(DateTime, server_default=func.now())
+    updated = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 medrekk_account_user_assoc = Table(
     "medrekk_account_user_assoc",
@@ -36,6 +40,10 @@ class MedRekkUser(Base, MedRekkBase):
     active: bool = Column(Boolean, default=True)
     account_id = Column(ForeignKey("medrekk_accounts.id", name="user_account"))
 
+    __table_args__ = (
+        Index("idx_users_account_created", "account_id", "created", "id"),
+    )
+
 class MedRekkAccount(Base, MedRekkBase):
     __tablename__ = "medrekk_accounts"
 
@@ -43,7 +51,14 @@ class MedRekkAccount(Base, MedRekkBase):
     account_subdomain = Column(String, nullable=False)
     owner_id = Column(ForeignKey("medrekk_users.id", name="account_owner"))
     status = Column(SmallInteger, default=1)
-    trial_ends_at = Column(DateTime, default=datetime.now() + timedelta(days=14))
+    trial_ends_at = Column(
+        DateTime, server_default=text("now() + interval '14 days'")
+    )
+
+    __table_args__ = (
+        # Deleting a user checks the accounts they own.
+        Index("idx_accounts_owner", "owner_id"),
+    )
 
     users: Mapped[List["MedRekkUser"]] = relationship("MedRekkUser", secondary=medrekk_account_user_assoc)
 
@@ -51,7 +66,7 @@ class MedRekkAccount(Base, MedRekkBase):
 class MedRekkUserProfile(Base, MedRekkBase):
     __tablename__ = "medrekk_user_profiles"
 
-    user_id = Column(String, ForeignKey("medrekk_users.id"), unique=True)
+    user_id = Column(ShortIDType, ForeignKey("medrekk_users.id"), unique=True)
     lastname = Column(String, nullable=False)
     middlename = Column(String, nullable=True)
     firstname = Column(String, nullable=False)
@@ -1,7 +1,7 @@
-from datetime import datetime
 from typing import List
 
 from sqlalchemy import (
+    DDL,
     ARRAY,
     SMALLINT,
     Boolean,
@@ -11,24 +11,30 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    PrimaryKeyConstraint,
     String,
     UniqueConstraint,
+    event,
+    func,
 )
 from sqlalchemy.orm import Mapped, relationship
 
-from medrekk.common.database.connection import Base
+from medrekk.common.database.connection import Base, ShortIDType
 from medrekk.common.utils import shortid
 
 
 class PatientBase:
-    id = Column(String, default=shortid(), primary_key=True)
-    created = Column(DateTime, default=datetime.now())
-    updated = Column(DateTime, default=datetime.now())
+    # Callables and SQL defaults run per row; `shortid()` or `datetime.now()`
+    # here would be evaluated once, at import.
+    id = Column(ShortIDType, default=shortid, primary_key=True)
+    created = Column(DateTime, server_default=func.now())
+    updated = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class PatientProfile(Base, PatientBase):
     __tablename__ = "patient_profile"
 
+    account_id = Column(ForeignKey("medrekk_accounts.id"), nullable=False)
     lastname = Column(String, nullable=False)
     middlename = Column(String, nullable=True)
     firstname = Column(String, nullable=False)
@@ -43,7 +49,42 @@ class PatientProfile(Base, PatientBase):
     address_barangay = Column(String, nullable=False)
     address_line1 = Column(String, nullable=False)
     address_line2 = Column(String, nullable=True)
+    # PSGC-style codes of the address (see common/utils/gazetteer.py); null for
+    # addresses outside the Philippines.
+    address_region_code = Column(String(9), nullable=True)
+    address_province_code = Column(String(9), nullable=True)
+    address_city_code = Column(String(9), nullable=True)
+    address_barangay_code = Column(String(9), nullable=True)
     religion = Column(String, nullable=False)
+    # normalize_name(lastname, firstname, middlename), set on write. Searched
+    # by GET /patients/search.
+    search_name = Column(String, nullable=False, server_default="")
+
+    __table_args__ = (
+        # Keyset pagination of an account's patients: newest first on (created, id).
+        Index("idx_patient_profile_account_created", "account_id", "created", "id"),
+        # Patient counts per city within an account, from the index alone.
+        Index("idx_patient_profile_account_city", "account_id", "address_city_code"),
+        # Trigram search within an account. btree_gin lets account_id share the
+        # GIN index with the trigrams.
+        Index(
+            "idx_patient_profile_search",
+            "account_id",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+    )
+
+
+event.listen(
+    PatientProfile.__table__,
+    "before_create",
+    DDL(
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+        "CREATE EXTENSION IF NOT EXISTS btree_gin"
+    ).execute_if(dialect="postgresql"),
+)
 
 
 class PatientAppointments(Base, PatientBase):
@@ -53,6 +94,10 @@ class PatientAppointments(Base, PatientBase):
     patient_id = Column(ForeignKey("patient_profile.id"))
     appointment_date = Column(Date, nullable=False)
 
+    __table_args__ = (
+        Index("idx_appointment_patient_date", "patient_id", "appointment_date"),
+    )
+
 
 class PatientVisit(Base, PatientBase):
     __tablename__ = "patient_visits"
@@ -63,8 +108,9 @@ class PatientVisit(Base, PatientBase):
     visit_date = Column(Date, nullable=False)
 
     __table_args__ = (
-        Index("idx_patient_visit", "patient_id", "visit_date"),
+        # Also serves lookups by patient_id alone.
         UniqueConstraint("patient_id", "visit_date", name="uc_patient_visit"),
+        Index("idx_visit_appointment", "appointment_id"),
     )
 
 
@@ -75,6 +121,12 @@ class PatientRecord(Base, PatientBase):
     patient_id = Column(ForeignKey("patient_profile.id"))
     chief_complaint = Column(ARRAY(String))
 
+    __table_args__ = (
+        # account_id is checked on the patient's rows; leading with it would
+        # leave the patient-only lookups (chart summary, FK checks) unindexed.
+        Index("idx_records_patient_created", "patient_id", "created", "id"),
+    )
+
     diagnosis: Mapped[List["PatientDiagnosis"]] = relationship(backref="record")
     body_temperatures: Mapped[List["PatientBodyTemperature"]] = relationship(
         backref="record"
@@ -93,6 +145,7 @@ class PatientDiagnosis(Base, PatientBase):
 
     __table_args__ = (
         UniqueConstraint("record_id", "diagnosis_code", name="uc_record_diagnosis"),
+        Index("idx_diagnosis_record_created", "record_id", "created", "id"),
     )
 
 # Patient Vitals:
@@ -100,61 +153,87 @@ class PatientDiagnosis(Base, PatientBase):
 #   PatientHeartRate,
 #   PatientRespiratoryRate,
 #   PatientBodyTemperature
-class PatientBloodPressure(Base, PatientBase):
+#
+# Range partitioned by month of dt_measured (see common/database/partitions.py).
+PARTITION_BY_MONTH = {"postgresql_partition_by": "RANGE (dt_measured)"}
+# Migration 0004 can add a BRIN index on (dt_measured, created) next to the
+# indexes below, for reads of a time range across records. It is a per
+# deployment option (`alembic -x vitals_index=brin upgrade head`), so it is
+# not part of the models.
+
+
+class PatientVitalsBase(PatientBase):
+    # Postgres requires the partition key in every unique constraint, so the
+    # primary key is PrimaryKeyConstraint("id", "dt_measured") of each table.
+    id = Column(ShortIDType, default=shortid, nullable=False)
+
+
+class PatientBloodPressure(Base, PatientVitalsBase):
     __tablename__ = "patient_blood_pressure"
 
     record_id = Column(ForeignKey("patient_records.id"))
-    dt_measured = Column(DateTime)
+    dt_measured = Column(DateTime, nullable=False)
     systolic = Column(SMALLINT)
     diastolic = Column(SMALLINT)
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "dt_measured"),
         UniqueConstraint(
             "record_id", "dt_measured", name="uc_bloodpressure_patient_dt"
         ),
-        Index("idx_bloodpressure_patient_dt", "record_id", "dt_measured"),
+        # Keyset order of the readings; the unique constraint alone can't
+        # break ties on id.
+        Index("idx_bloodpressure_patient_dt", "record_id", "dt_measured", "id"),
+        PARTITION_BY_MONTH,
     )
 
 
-class PatientHeartRate(Base, PatientBase):
+class PatientHeartRate(Base, PatientVitalsBase):
     __tablename__ = "patient_heart_rate"
 
     record_id = Column(ForeignKey("patient_records.id"))
-    dt_measured = Column(DateTime)
+    dt_measured = Column(DateTime, nullable=False)
     heart_rate = Column(SMALLINT)
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "dt_measured"),
         UniqueConstraint("record_id", "dt_measured", name="uc_heartrate_patient_dt"),
-        Index("idx_heartrate_patient_dt", "record_id", "dt_measured"),
+        Index("idx_heartrate_patient_dt", "record_id", "dt_measured", "id"),
+        PARTITION_BY_MONTH,
     )
 
 
-class PatientRespiratoryRate(Base, PatientBase):
+class PatientRespiratoryRate(Base, PatientVitalsBase):
     __tablename__ = "patient_respiratory_rate"
 
     record_id = Column(ForeignKey("patient_records.id"))
-    dt_measured = Column(DateTime)
+    dt_measured = Column(DateTime, nullable=False)
     respiratory_rate = Column(SMALLINT)
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "dt_measured"),
         UniqueConstraint(
             "record_id", "dt_measured", name="uc_respiratoryrate_patient_dt"
         ),
-        Index("idx_respiratoryrate_patient_dt", "record_id", "dt_measured"),
+        Index("idx_respiratoryrate_patient_dt", "record_id", "dt_measured", "id"),
+        PARTITION_BY_MONTH,
     )
 
 
-class PatientBodyTemperature(Base, PatientBase):
+class PatientBodyTemperature(Base, PatientVitalsBase):
     __tablename__ = "patient_body_temperature"
 
     record_id = Column(ForeignKey("patient_records.id"))
-    dt_measured = Column(DateTime)
+    dt_measured = Column(DateTime, nullable=False)
     body_temperature = Column(Float)
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "dt_measured"),
         UniqueConstraint(
             "record_id", "dt_measured", name="uc_bodytemperature_patient_dt"
         ),
+        Index("idx_bodytemperature_patient_dt", "record_id", "dt_measured", "id"),
+        PARTITION_BY_MONTH,
     )
 
 
@@ -173,6 +252,7 @@ class PatientBodyWeight(Base, PatientBase):
         UniqueConstraint(
             "patient_id", "date_measured", name="uc_bodyweight_patient_date"
         ),
+        Index("idx_bodyweight_patient_created", "patient_id", "created", "id"),
     )
 
 
@@ -185,6 +265,7 @@ class PatientHeight(Base, PatientBase):
 
     __table_args__ = (
         UniqueConstraint("patient_id", "date_measured", name="uc_height_patient_date"),
+        Index("idx_height_patient_created", "patient_id", "created", "id"),
     )
 
 
@@ -198,6 +279,7 @@ class PatientBodyMassIndex(Base, PatientBase):
 
     __table_args__ = (
         UniqueConstraint("patient_id", "date_measured", name="uc_bmi_patient_date"),
+        Index("idx_bmi_patient_created", "patient_id", "created", "id"),
     )
 
 
@@ -258,6 +340,10 @@ class PatientHospitalizationHistory(Base, PatientBase):
     discharge_date = Column(Date)
     notes = Column(ARRAY(String))
 
+    __table_args__ = (
+        Index("idx_hospitalization_patient_created", "patient_id", "created", "id"),
+    )
+
 
 class PatientSurgicalHistory(Base, PatientBase):
     __tablename__ = "patient_surgical_history"
@@ -267,6 +353,10 @@ class PatientSurgicalHistory(Base, PatientBase):
     surgery_date = Column(Date)
     notes = Column(ARRAY(String))
 
+    __table_args__ = (
+        Index("idx_surgical_patient_created", "patient_id", "created", "id"),
+    )
+
 
 # Patient Medication Records
 #   PatientMedication
@@ -279,6 +369,10 @@ class PatientMedication(Base, PatientBase):
     end_date = Column(Date, nullable=True)
     notes = Column(ARRAY(String), nullable=True)
 
+    __table_args__ = (
+        Index("idx_medication_patient_created", "patient_id", "created", "id"),
+    )
+
 
 class PatientAllergy(Base, PatientBase):
     __tablename__ = "patient_allergy"
@@ -288,6 +382,10 @@ class PatientAllergy(Base, PatientBase):
     reaction_description = Column(String)
     notes = Column(ARRAY(String), nullable=True)
 
+    __table_args__ = (
+        Index("idx_allergy_patient_created", "patient_id", "created", "id"),
+    )
+
 
 class PatientImmunization(Base, PatientBase):
     __tablename__ = "patient_immunization"
@@ -295,4 +393,8 @@ class PatientImmunization(Base, PatientBase):
     patient_id = Column(ForeignKey("patient_profile.id"))
     vaccine = Column(String)
     date_administered = Column(Date)
-    notes = Column(ARRAY(String), nullable=True)
\ No newline at end of file
+    notes = Column(ARRAY(String), nullable=True)
+
+    __table_args__ = (
+        Index("idx_immunization_patient_created", "patient_id", "created", "id"),
+    )
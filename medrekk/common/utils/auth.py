@@ -1,26 +1,31 @@
 import hmac
+import logging
+import os
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Annotated, Optional
 
-import bcrypt
 import shortuuid
 from fastapi import Depends, HTTPException, Request, status
 from jose import JWTError, jwt
 from jose.constants import ALGORITHMS
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from medrekk.admin.schemas.accounts import UserRead
 from medrekk.admin.db.token import token_store
-from medrekk.common.database.connection import get_session
+from medrekk.common.database.connection import get_db, run_controller
 from medrekk.common.dependencies import oauth2_scheme
 from medrekk.common.models.medrekk import MedRekkAccount
-from medrekk.common.models.patient import PatientRecord
+from medrekk.common.models.patient import PatientProfile, PatientRecord
 
+from .cache import TTLCache
 from .constants import HMAC_KEY, JWT_KEY, TOKEN_EXPIRE_MINUTES
+from .hashing import hash_password, verify_password
 
 
-def generate_access_token(
+async def generate_access_token(
     user: UserRead, account: Optional[MedRekkAccount] = None
 ) -> str:
 
@@ -39,21 +44,43 @@ def generate_access_token(
 
     claims["aud"] = aud
 
-    token_store.set_token(jti=jti, aud=aud)
+    await token_store.set_token(jti=jti, aud=aud)
 
     token = jwt.encode(claims, JWT_KEY, algorithm=ALGORITHMS.HS256)
 
     return token
 
 
-def verify_jwt_token(token: Annotated[str, Depends(oauth2_scheme)]) -> bool:
+@dataclass(frozen=True)
+class Principal:
+    """
+    The verified caller of a request.
+    """
+
+    user_id: str
+    account_id: str
+    claims: dict
+
+
+async def get_current_principal(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> Principal:
+    """
+    Verifies the bearer token once per request and caches the result on
+    `request.state.principal`. `verify_jwt_token`, `get_user_id`,
+    `get_account_id` and `check_self` all read from it.
+    """
+    principal: Principal | None = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
 
     try:
         unverified = jwt.get_unverified_claims(token)
-        jti = unverified["jti"]
-        aud = token_store.get_token(jti=jti)
-        return jwt.decode(token, JWT_KEY, algorithms=ALGORITHMS.HS256, audience=aud)
-    except JWTError:
+        aud = await token_store.get_token(jti=unverified["jti"])
+        claims = jwt.decode(token, JWT_KEY, algorithms=ALGORITHMS.HS256, audience=aud)
+        user_id, account_id = claims["sub"].split(",")
+    except (JWTError, KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -65,30 +92,33 @@ def verify_jwt_token(token: Annotated[str, Depends(oauth2_scheme)]) -> bool:
             },
         )
 
-def expire_token(token: str):
+    principal = Principal(user_id=user_id, account_id=account_id, claims=claims)
+    request.state.principal = principal
+    return principal
+
+
+CurrentPrincipal = Annotated[Principal, Depends(get_current_principal)]
+
+
+def verify_jwt_token(principal: CurrentPrincipal) -> dict:
+    return principal.claims
+
+async def expire_token(token: str):
     unverified = jwt.get_unverified_claims(token)
     jti = unverified["jti"]
-    return token_store.remove_token(jti=jti)
+    return await token_store.remove_token(jti=jti)
 
 
-def get_user_id(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
-    unverified = jwt.get_unverified_claims(token)
-    sub: str = unverified["sub"]
-    user_id = sub.split(",")[0]
-    return user_id
+def get_user_id(principal: CurrentPrincipal) -> str:
+    return principal.user_id
 
 
-def get_account_id(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
-    unverified = jwt.get_unverified_claims(token)
-    sub: str = unverified["sub"]
-    account_id = sub.split(",")[1]
-    return account_id
+def get_account_id(principal: CurrentPrincipal) -> str:
+    return principal.account_id
 
 
-def check_self(token: Annotated[str, Depends(oauth2_scheme)], user_id: str):
-    unverified = jwt.get_unverified_claims(token)
-    sub = unverified.get("sub")
-    if sub != user_id:
+def check_self(principal: CurrentPrincipal, user_id: str):
+    if principal.user_id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -129,36 +159,87 @@ def validate_password_strength(password):
     return True
 
 
-# Add checking of password strength
-def hash_password(password: str):
-    # Generate a salt and hash the password
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt).decode()
-    return hashed
+logger = logging.getLogger(__name__)
+
+# (account_id, record_id) -> owned. A record never changes accounts, so owned
+# pairs are kept longer; misses are kept briefly in case the record is being
+# created. Creating or deleting a record evicts the pair on every worker
+# through OWNERSHIP_CHANNEL (see `announce_ownership_change`). A worker that
+# misses the message, e.g. while Redis is down, forgets the pair within
+# MEDREKK_OWNERSHIP_CACHE_TTL seconds.
+OWNERSHIP_CACHE_SIZE = int(os.getenv("MEDREKK_OWNERSHIP_CACHE_SIZE", "10000"))
+OWNERSHIP_CACHE_TTL = float(os.getenv("MEDREKK_OWNERSHIP_CACHE_TTL", "60"))
+OWNERSHIP_CACHE_NEGATIVE_TTL = float(
+    os.getenv("MEDREKK_OWNERSHIP_CACHE_NEGATIVE_TTL", "5")
+)
+
+record_ownership = TTLCache(maxsize=OWNERSHIP_CACHE_SIZE, ttl=OWNERSHIP_CACHE_TTL)
 
+# Pub/sub channel on which "account_id,record_id" pairs are evicted from the
+# ownership cache of every worker.
+OWNERSHIP_CHANNEL = "medrekk:records:ownership"
 
-def verify_password(hashed: str, input: str):
-    # Check if the input password matches the hashed password
-    return bcrypt.checkpw(input.encode("utf-8"), hashed.encode())
+token_store.subscribe(
+    OWNERSHIP_CHANNEL, record_ownership, key=lambda data: tuple(data.split(","))
+)
 
 
-def account_record_id_validate(
+async def announce_ownership_change(account_id: str, record_id: str) -> None:
+    """
+    Evicts `(account_id, record_id)` from the ownership cache of every
+    worker. Called once the record is created or deleted.
+    """
+    record_ownership.invalidate((account_id, record_id))
+    try:
+        await token_store.db.publish(OWNERSHIP_CHANNEL, f"{account_id},{record_id}")
+    except (RedisError, OSError):
+        # The change is committed; the other workers catch up within the TTL.
+        logger.warning("Could not announce the ownership change of %s.", record_id)
+
+
+def read_account_record_id(
+    account_id: str,
+    record_id: str,
+    db: Session,
+) -> str | None:
+    return (
+        db.query(PatientRecord.id)
+        .filter(PatientRecord.id == record_id)
+        .filter(PatientRecord.account_id == account_id)
+        .scalar()
+    )
+
+
+async def account_record_id_validate(
     record_id: str,
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ) -> str:
     """
     Validates record_id if it belongs to the account. Returns the record_id if `True`,
     otherwise, it raises HTTPException of status 403 (Forbidden).
+
+    The answer is cached in `record_ownership`, so repeated requests on the same
+    record skip the ownership query.
     """
-    record = (
-        db_session.query(PatientRecord)
-        .filter(PatientRecord.id == record_id)
-        .filter(PatientRecord.account_id == account_id)
-        .one_or_none()
-    )
+    owned = record_ownership.get((account_id, record_id))
+
+    if owned is None:
+        owned = bool(
+            await run_controller(
+                read_account_record_id,
+                account_id,
+                record_id,
+                db=db_session,
+            )
+        )
+        record_ownership.set(
+            (account_id, record_id),
+            owned,
+            ttl=None if owned else OWNERSHIP_CACHE_NEGATIVE_TTL,
+        )
 
-    if not record:
+    if not owned:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
@@ -167,7 +248,52 @@ def account_record_id_validate(
             },
         )
 
-    return record.id
+    return record_id
+
+
+def read_account_patient_id(
+    account_id: str,
+    patient_id: str,
+    db: Session,
+) -> str | None:
+    return (
+        db.query(PatientProfile.id)
+        .filter(PatientProfile.id == patient_id)
+        .filter(PatientProfile.account_id == account_id)
+        .scalar()
+    )
+
+
+async def account_patient_id_validate(
+    patient_id: str,
+    account_id: Annotated[str, Depends(get_account_id)],
+    db_session: Annotated[Session, Depends(get_db)],
+) -> str:
+    """
+    Validates patient_id if it belongs to the account. Returns the patient_id,
+    otherwise raises HTTPException 404, as for any patient that doesn't exist.
+    Parent dependency of the `/patients/{patient_id}/...` resources.
+    """
+    owned = await run_controller(
+        read_account_patient_id,
+        account_id,
+        patient_id,
+        db=db_session,
+    )
+
+    if not owned:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "content": {
+                    "msg": f"Patient with ID: {patient_id} is not found.",
+                    "loc": "patient_id",
+                },
+            },
+        )
+
+    return patient_id
 
 
 def get_host(
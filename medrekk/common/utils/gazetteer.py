@@ -0,0 +1,547 @@
+"""
+Compact, lazily loaded index of `PH_ADDRESS` (region > province >
+municipality > barangay).
+
+`ph_address.py` is a 2 MB dict literal; importing it takes most of a second
+and keeps ~60k small objects alive. Instead, `build` flattens it once into a
+binary file of flat arrays, which `gazetteer()` memory-maps on first use:
+
+    codes{L}        'I'  PSGC-style codes of level L, ascending
+    children{L}     'I'  offsets into level L + 1, so the children of node i
+                         are positions children[i]:children[i + 1]
+    names{L}        'B'  UTF-8 names, sliced by name_offsets{L}
+    keys{L}         'B'  normalize_name() of each name, sliced by key_offsets{L}
+    order{L}        'I'  positions of level L sorted by key, for prefix search
+
+Every level is sorted by (parent, code), so codes ascend and the children of
+a node are contiguous. Lookups by code and prefix searches are binary
+searches over these arrays.
+
+Codes are RRPPMMBBB: the PSGC region number, then the ordinal of the
+province, municipality and barangay among its siblings, with zeros below the
+node's level. Patient addresses store them, so they must never change: they
+are kept in `ph_address_codes.tsv`, one line per area, and only ever appended
+to. An area added to `ph_address.py` gets the next ordinal among its
+siblings; a removed one keeps its line, so its code is not handed out again.
+
+`resolve` matches free-text province/city/barangay names through a hash
+index of normalised names (plus a few common aliases, such as "Las Piñas"
+for "CITY OF LAS PIÑAS", or "Manila" for the districts of the province
+"NATIONAL CAPITAL REGION - MANILA"), built in memory on first use.
+
+After changing `ph_address.py`, assign the codes of the new areas and build
+the index with
+
+    python -m medrekk.common.utils.gazetteer
+
+and commit `ph_address_codes.tsv`. Otherwise the index is built (and written
+next to `ph_address.py`, if writable) the first time it is needed, and
+fails if an area has no code.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from .text import normalize_name
+
+SOURCE = os.path.join(os.path.dirname(__file__), "ph_address.py")
+CODES = os.path.join(os.path.dirname(__file__), "ph_address_codes.tsv")
+INDEX = os.path.join(os.path.dirname(__file__), "ph_address.idx")
+
+MAGIC = b"PHGZ1\n"
+LEVELS = ("region", "province", "municipality", "barangay")
+# Weight of each level's ordinal within a code.
+SCALES = (10_000_000, 100_000, 1_000, 1)
+# PSGC region numbers of the PH_ADDRESS region keys.
+REGION_CODES = {
+    "01": 1, "02": 2, "03": 3, "4A": 4, "05": 5, "06": 6, "07": 7, "08": 8,
+    "09": 9, "10": 10, "11": 11, "12": 12, "NCR": 13, "CAR": 14, "13": 16,
+    "4B": 17, "BARMM": 19,
+}
+
+
+# Other names for the provinces of NCR, which PH_ADDRESS splits into districts.
+NCR_ALIASES = ("metro manila", "ncr", "national capital region")
+# PH_ADDRESS has the City of Manila as a province, and its districts (Tondo,
+# Sampaloc, ...) as municipalities. Its barangay numbers are unique across the
+# city, so "Manila" as the city resolves through any of its districts.
+MANILA = 130200000
+MANILA_ALIASES = ("manila", "city of manila")
+
+
+class Area(NamedTuple):
+    code: str
+    name: str
+    level: str
+
+
+def _paths() -> list:
+    """
+    (region key, province[, municipality[, barangay]]) of every area below
+    the regions, parents first and siblings by name.
+    """
+    from .ph_address import PH_ADDRESS
+
+    paths = []
+    for key in sorted(PH_ADDRESS, key=REGION_CODES.__getitem__):
+        province_list = PH_ADDRESS[key]["province_list"]
+        for province in sorted(province_list):
+            paths.append((key, province))
+            municipality_list = province_list[province]["municipality_list"]
+            for municipality in sorted(municipality_list):
+                paths.append((key, province, municipality))
+                barangay_list = municipality_list[municipality]["barangay_list"]
+                for barangay in sorted(set(barangay_list)):
+                    paths.append((key, province, municipality, barangay))
+    return paths
+
+
+def read_codes(path: str = CODES) -> dict:
+    """
+    Area path -> code, from the append-only code table.
+    """
+    codes = {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                code, *names = line.rstrip("\n").split("\t")
+                codes[tuple(name for name in names if name)] = int(code)
+    except FileNotFoundError:
+        pass
+    return codes
+
+
+def assign_codes(codes: dict) -> list:
+    """
+    Gives the areas of PH_ADDRESS without a code the next ordinal among their
+    siblings, including removed ones. Adds them to `codes` and returns the
+    new (path, code) pairs, to be appended to the code table.
+    """
+    # Parent path -> highest ordinal in use under it.
+    last: dict = {}
+    for path, code in codes.items():
+        level = len(path) - 1
+        ordinal = code // SCALES[level] % (SCALES[level - 1] // SCALES[level])
+        last[path[:-1]] = max(last.get(path[:-1], 0), ordinal)
+
+    added = []
+    for path in _paths():
+        if path in codes:
+            continue
+        level = len(path) - 1
+        parent = REGION_CODES[path[0]] * SCALES[0] if level == 1 else codes[path[:-1]]
+        ordinal = last.get(path[:-1], 0) + 1
+        if ordinal >= SCALES[level - 1] // SCALES[level]:
+            raise ValueError(f"No code left under {path[:-1]}.")
+        last[path[:-1]] = ordinal
+        codes[path] = parent + ordinal * SCALES[level]
+        added.append((path, codes[path]))
+    return added
+
+
+def append_codes(added: list, path: str = CODES) -> None:
+    with open(path, "a", encoding="utf-8") as file:
+        for names, code in added:
+            file.write("\t".join([f"{code:09d}", *names]) + "\n")
+
+
+def _tree(codes: dict) -> list:
+    """
+    PH_ADDRESS as nested (code, name, children) tuples, siblings by code.
+    """
+    from .ph_address import PH_ADDRESS
+
+    def number(path: tuple, names) -> list:
+        numbered = []
+        for name in set(names):
+            if path + (name,) not in codes:
+                raise ValueError(
+                    f"{path + (name,)} has no code. "
+                    "Run `python -m medrekk.common.utils.gazetteer`."
+                )
+            numbered.append((codes[path + (name,)], name))
+        return sorted(numbered)
+
+    regions = []
+    for key in sorted(PH_ADDRESS, key=REGION_CODES.__getitem__):
+        province_list = PH_ADDRESS[key]["province_list"]
+        provinces = []
+        for province_code, province in number((key,), province_list):
+            municipality_list = province_list[province]["municipality_list"]
+            municipalities = []
+            for municipality_code, municipality in number(
+                (key, province), municipality_list
+            ):
+                barangay_list = municipality_list[municipality]["barangay_list"]
+                barangays = [
+                    (code, barangay, [])
+                    for code, barangay in number(
+                        (key, province, municipality), barangay_list
+                    )
+                ]
+                municipalities.append((municipality_code, municipality, barangays))
+            provinces.append((province_code, province, municipalities))
+        regions.append(
+            (REGION_CODES[key] * SCALES[0], PH_ADDRESS[key]["region_name"], provinces)
+        )
+    return regions
+
+
+def _blob(strings: list) -> tuple:
+    data = bytearray()
+    offsets = array("I", [0])
+    for string in strings:
+        data += string.encode("utf-8")
+        offsets.append(len(data))
+    return array("B", data), offsets
+
+
+def build(codes: Optional[dict] = None) -> bytes:
+    """
+    Serialises PH_ADDRESS into the index format described above, with the
+    codes of the code table.
+    """
+    sections: dict = {}
+    level_nodes = _tree(read_codes() if codes is None else codes)
+    for level in range(len(LEVELS)):
+        codes = array("I", (code for code, _, _ in level_nodes))
+        names = [name for _, name, _ in level_nodes]
+        keys = [normalize_name(name) for name in names]
+
+        sections[f"codes{level}"] = codes
+        sections[f"names{level}"], sections[f"name_offsets{level}"] = _blob(names)
+        sections[f"keys{level}"], sections[f"key_offsets{level}"] = _blob(keys)
+        sections[f"order{level}"] = array(
+            "I", sorted(range(len(keys)), key=keys.__getitem__)
+        )
+
+        children = array("I", [0])
+        next_nodes = []
+        for _, _, nodes in level_nodes:
+            next_nodes += nodes
+            children.append(len(next_nodes))
+        if level < len(LEVELS) - 1:
+            sections[f"children{level}"] = children
+        level_nodes = next_nodes
+
+    header: dict = {}
+    body = bytearray()
+    for name, values in sections.items():
+        # Keep every section aligned for memoryview.cast().
+        body += b"\0" * (-len(body) % 8)
+        header[name] = [values.typecode, len(body), len(values)]
+        body += values.tobytes()
+
+    encoded = json.dumps(header).encode()
+    prefix = MAGIC + struct.pack("<I", len(encoded)) + encoded
+    prefix += b"\0" * (-len(prefix) % 8)
+    return prefix + bytes(body)
+
+
+def write(data: bytes, path: str = INDEX) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as file:
+        file.write(data)
+    os.replace(tmp, path)
+
+
+class Gazetteer:
+    """
+    Read-only view over an index built by `build`. `buffer` is the file's
+    contents, normally a memory map, so nothing is copied or parsed up front.
+    """
+
+    def __init__(self, buffer) -> None:
+        view = memoryview(buffer)
+        if bytes(view[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a gazetteer index.")
+        (size,) = struct.unpack_from("<I", view, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(bytes(view[start : start + size]))
+        base = start + size + (-(start + size) % 8)
+
+        self._buffer = buffer
+        self._sections = {}
+        for name, (typecode, offset, count) in header.items():
+            end = base + offset + count * array(typecode).itemsize
+            self._sections[name] = view[base + offset : end].cast(typecode)
+
+    def __len__(self) -> int:
+        return sum(len(self._sections[f"codes{level}"]) for level in range(len(LEVELS)))
+
+    def _text(self, blob: str, offsets: str, i: int) -> str:
+        offsets = self._sections[offsets]
+        return bytes(self._sections[blob][offsets[i] : offsets[i + 1]]).decode()
+
+    def _area(self, level: int, i: int) -> Area:
+        return Area(
+            code=f"{self._sections[f'codes{level}'][i]:09d}",
+            name=self._text(f"names{level}", f"name_offsets{level}", i),
+            level=LEVELS[level],
+        )
+
+    def key(self, level: int, i: int) -> str:
+        return self._text(f"keys{level}", f"key_offsets{level}", i)
+
+    def locate(self, code: str) -> Optional[tuple]:
+        """
+        (level, position) of `code`, or None if there is no such area.
+        """
+        if len(code) != 9 or not code.isdigit():
+            return None
+        value = int(code)
+        if value % 1000:
+            level = 3
+        elif value // SCALES[2] % 100:
+            level = 2
+        elif value // SCALES[1] % 100:
+            level = 1
+        else:
+            level = 0
+        codes = self._sections[f"codes{level}"]
+        i = bisect_left(codes, value)
+        if i < len(codes) and codes[i] == value:
+            return level, i
+        return None
+
+    def children_range(self, level: int, i: int) -> range:
+        if level == len(LEVELS) - 1:
+            return range(0)
+        children = self._sections[f"children{level}"]
+        return range(children[i], children[i + 1])
+
+    def get(self, code: str) -> Optional[Area]:
+        found = self.locate(code)
+        return self._area(*found) if found else None
+
+    def parent(self, code: str) -> Optional[Area]:
+        found = self.locate(code)
+        if not found or not found[0]:
+            return None
+        level, i = found
+        return self._area(
+            level - 1, bisect_right(self._sections[f"children{level - 1}"], i) - 1
+        )
+
+    def children(self, code: Optional[str] = None) -> Optional[list[Area]]:
+        """
+        Areas directly under `code`; regions if `code` is None. None if `code`
+        does not exist.
+        """
+        if code is None:
+            return [self._area(0, i) for i in range(len(self._sections["codes0"]))]
+        found = self.locate(code)
+        if not found:
+            return None
+        level, i = found
+        children = [self._area(level + 1, j) for j in self.children_range(level, i)]
+        return sorted(children, key=lambda area: area.name)
+
+    def search(
+        self,
+        prefix: str,
+        level: str = "municipality",
+        parent: Optional[str] = None,
+        limit: int = 10,
+    ) -> list[Area]:
+        """
+        Areas of `level` whose normalised name, or one of the aliases
+        `resolve` accepts, starts with `prefix`, by name. With `parent`, only
+        its direct children are considered (at most a few hundred); otherwise
+        the sorted key index and `_alias_order` are binary searched.
+        """
+        term = normalize_name(prefix)
+        depth = LEVELS.index(level)
+
+        if parent is not None:
+            found = self.locate(parent)
+            if not found or found[0] != depth - 1:
+                return []
+            codes = self._sections[f"codes{depth}"]
+            matches = [
+                j
+                for j in self.children_range(*found)
+                if any(
+                    alias.startswith(term)
+                    for alias in self._aliases(
+                        depth,
+                        codes[j],
+                        self._text(f"names{depth}", f"name_offsets{depth}", j),
+                        self.key(depth, j),
+                    )
+                )
+            ]
+            matches.sort(key=lambda j: self.key(depth, j))
+            return [self._area(depth, j) for j in matches[:limit]]
+
+        # position -> the key or alias it matched on, for the order.
+        matches = {}
+        order = self._sections[f"order{depth}"]
+        start = bisect_left(order, term, key=lambda j: self.key(depth, j))
+        for j in order[start : start + limit]:
+            key = self.key(depth, j)
+            if not key.startswith(term):
+                break
+            matches[j] = key
+        aliases = self._alias_order[depth]
+        start = bisect_left(aliases, (term,))
+        for alias, j in aliases[start : start + limit]:
+            if not alias.startswith(term):
+                break
+            matches.setdefault(j, alias)
+
+        ordered = sorted(matches, key=matches.__getitem__)
+        return [self._area(depth, j) for j in ordered[:limit]]
+
+    def _strings(self, blob: str, offsets: str) -> list:
+        data = bytes(self._sections[blob])
+        offsets = self._sections[offsets].tolist()
+        return [data[start:end].decode() for start, end in zip(offsets, offsets[1:])]
+
+    @staticmethod
+    def _aliases(level: int, code: int, name: str, key: str) -> set:
+        aliases = {key}
+        if "(" in name:
+            aliases.add(normalize_name(re.sub(r"\(.*?\)", " ", name)))
+        if key.startswith("city of "):
+            aliases |= {key[8:], f"{key[8:]} city"}
+        if level == 1 and code // SCALES[0] == 13:
+            aliases |= set(NCR_ALIASES)
+        if level in (1, 2) and code // SCALES[1] * SCALES[1] == MANILA:
+            aliases |= set(MANILA_ALIASES)
+        return aliases
+
+    @cached_property
+    def _names(self) -> list:
+        """
+        Per level below regions: (parent position, name or alias) -> positions.
+        Provinces are keyed on a parent of None, since forms do not ask for the
+        region.
+        """
+        names = [{} for _ in LEVELS]
+        for level in range(1, len(LEVELS)):
+            parents = self._sections[f"children{level - 1}"].tolist()
+            codes = self._sections[f"codes{level}"].tolist()
+            rows = zip(
+                codes,
+                self._strings(f"names{level}", f"name_offsets{level}"),
+                self._strings(f"keys{level}", f"key_offsets{level}"),
+            )
+            parent = 0
+            for i, (code, name, key) in enumerate(rows):
+                while parents[parent + 1] <= i:
+                    parent += 1
+                for alias in self._aliases(level, code, name, key):
+                    key = (parent if level > 1 else None, alias)
+                    names[level].setdefault(key, []).append(i)
+        return names
+
+    @cached_property
+    def _alias_order(self) -> list:
+        """
+        Per level: (alias, position) of the aliases that differ from the
+        normalised name, sorted, so `search` finds "las p" as `resolve` finds
+        "Las Piñas". A few thousand entries next to `order{L}`.
+        """
+        aliases = [[] for _ in LEVELS]
+        for level in range(1, len(LEVELS)):
+            rows = zip(
+                self._sections[f"codes{level}"].tolist(),
+                self._strings(f"names{level}", f"name_offsets{level}"),
+                self._strings(f"keys{level}", f"key_offsets{level}"),
+            )
+            for i, (code, name, key) in enumerate(rows):
+                for alias in self._aliases(level, code, name, key) - {key}:
+                    aliases[level].append((alias, i))
+            aliases[level].sort()
+        return aliases
+
+    def prepare(self) -> "Gazetteer":
+        """
+        Builds the in-memory name and alias indexes now rather than on the
+        first `resolve` or `search`.
+        """
+        self._names
+        self._alias_order
+        return self
+
+    def resolve(self, province: str, city: str, barangay: str) -> list[Area]:
+        """
+        Matches a province, city/municipality and barangay by name, each within
+        the one before, with one dict lookup per candidate. Returns the region
+        and as many of the three as were found, in order, so a short result
+        tells which one did not match.
+        """
+        # Candidate chains of positions; an alias can match several areas.
+        chains: list = [()]
+        for level, name in enumerate((province, city, barangay), start=1):
+            key = normalize_name(name)
+            matches = [
+                chain + (i,)
+                for chain in chains
+                for i in self._names[level].get((chain[-1] if chain else None, key), ())
+            ]
+            if not matches:
+                break
+            chains = matches
+
+        chain = chains[0]
+        if not chain:
+            return []
+        region = bisect_right(self._sections["children0"], chain[0]) - 1
+        return [self._area(0, region)] + [
+            self._area(level, i) for level, i in enumerate(chain, start=1)
+        ]
+
+
+_gazetteer: Optional[Gazetteer] = None
+_lock = Lock()
+
+
+def _load() -> Gazetteer:
+    try:
+        if os.path.getmtime(INDEX) >= max(
+            os.path.getmtime(SOURCE), os.path.getmtime(CODES)
+        ):
+            with open(INDEX, "rb") as file:
+                return Gazetteer(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError):
+        pass
+
+    data = build()
+    try:
+        write(data)
+    except OSError:
+        # Read-only install: keep the index in memory for this process.
+        pass
+    return Gazetteer(data)
+
+
+def gazetteer() -> Gazetteer:
+    """
+    The shared index, loaded on first use.
+    """
+    global _gazetteer
+    if _gazetteer is None:
+        with _lock:
+            if _gazetteer is None:
+                _gazetteer = _load()
+    return _gazetteer
+
+
+if __name__ == "__main__":
+    codes = read_codes()
+    added = assign_codes(codes)
+    if added:
+        append_codes(added)
+        print(f"{CODES}: {len(added)} new codes")
+    write(build(codes))
+    print(f"{INDEX}: {len(gazetteer())} areas, {os.path.getsize(INDEX)} bytes")
@@ -0,0 +1,114 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+from fastapi import HTTPException, status
+
+T = TypeVar("T")
+
+# bcrypt cost factor: every +1 doubles the time per hash. Existing hashes keep
+# the cost they were created with.
+BCRYPT_ROUNDS = int(os.getenv("MEDREKK_BCRYPT_ROUNDS", "12"))
+# Threads that run bcrypt. bcrypt releases the GIL, so each one can keep a core
+# busy; the rest of the worker keeps serving requests on the event loop.
+HASH_WORKERS = int(os.getenv("MEDREKK_HASH_WORKERS", str(os.cpu_count() or 1)))
+# Hashes queued or running before new ones are rejected with 503.
+HASH_MAX_PENDING = int(os.getenv("MEDREKK_HASH_MAX_PENDING", str(HASH_WORKERS * 4)))
+
+
+def hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode()
+
+
+def verify_password(hashed: str, input: str) -> bool:
+    return bcrypt.checkpw(input.encode("utf-8"), hashed.encode())
+
+
+class PasswordHasher:
+    """
+    Runs `hash_password`/`verify_password` on a dedicated, size-limited thread
+    pool. When `max_pending` calls are already queued or running, further
+    calls fail fast with 503 instead of piling up, so a login storm cannot
+    take every thread (or the event loop) away from other requests.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self.pending = 0
+        # Runs that returned, that raised, and that were abandoned by a
+        # cancelled request (the thread still finishes the hash).
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="medrekk-bcrypt",
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        # Only touched from the event loop, so no lock is needed.
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status_code": status.HTTP_503_SERVICE_UNAVAILABLE,
+                    "content": {
+                        "msg": "Too many sign-in requests. Please try again shortly.",
+                        "loc": "password",
+                    },
+                },
+                headers={"Retry-After": "1"},
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, func, *args)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, hashed: str, input: str) -> bool:
+        return await self._run(verify_password, hashed, input)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def metrics(self) -> dict:
+        return {
+            "rounds": BCRYPT_ROUNDS,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher(workers=HASH_WORKERS, max_pending=HASH_MAX_PENDING)
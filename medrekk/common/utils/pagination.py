@@ -0,0 +1,113 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Annotated, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query as ORMQuery
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageParams(BaseModel):
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+
+
+def page_params(
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        Optional[str],
+        Query(description="`next_cursor` of the previous page."),
+    ] = None,
+) -> PageParams:
+    """
+    Dependency for the `limit` and `cursor` query parameters of list routes.
+    """
+    return PageParams(limit=limit, cursor=cursor)
+
+
+class TimeRange(BaseModel):
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+
+def time_range(
+    start: Annotated[
+        Optional[datetime],
+        Query(alias="from", description="Measured at or after this time."),
+    ] = None,
+    end: Annotated[
+        Optional[datetime],
+        Query(alias="to", description="Measured before this time."),
+    ] = None,
+) -> TimeRange:
+    """
+    Dependency for the `from` and `to` query parameters of time series routes.
+    """
+    if start and end and start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "content": {
+                    "msg": "`from` must be earlier than `to`.",
+                    "loc": "from",
+                },
+            },
+        )
+    return TimeRange(start=start, end=end)
+
+
+def encode_cursor(created: datetime, item_id: str) -> str:
+    raw = json.dumps([created.isoformat(), item_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created, item_id = json.loads(raw)
+        return datetime.fromisoformat(created), str(item_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "content": {
+                    "msg": "Invalid cursor.",
+                    "loc": "cursor",
+                },
+            },
+        )
+
+
+def keyset_paginate(
+    query: ORMQuery, model, page: PageParams, key: str = "created"
+) -> dict:
+    """
+    Returns one page of `query`, newest first, as `{"items", "next_cursor"}`.
+
+    Rows are ordered by `(<key>, id)` and the cursor is the key of the last
+    row of the previous page, so every page is a range scan on an index
+    ending in `(<key>, id)` no matter how deep the client has paged. `key` is
+    a datetime column, `created` unless the rows are listed by another time.
+    """
+    column = getattr(model, key)
+    if page.cursor:
+        value, item_id = decode_cursor(page.cursor)
+        query = query.filter(tuple_(column, model.id) < tuple_(value, item_id))
+
+    # One extra row tells whether there is a next page.
+    rows = query.order_by(column.desc(), model.id.desc()).limit(page.limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(getattr(rows[-1], key), rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
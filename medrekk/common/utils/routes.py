@@ -24,3 +24,5 @@ OBHISTROY: Final = "obhistory"
 SURGICALHISTORY: Final = "surgicalhistory"
 ALLERGY: Final = "allergies"
 IMMUNIZATION: Final = "immunizations"
+EXPORTS: Final = "exports"
+ADDRESSES: Final = "addresses"
@@ -1,21 +1,138 @@
-from string import ascii_letters, digits
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits
+from threading import Lock
 from time import time_ns
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Layout of an ID, most significant bit first:
+#
+#    1 bit   always 1, so IDs never collide with the older time_ns() IDs
+#   41 bits  milliseconds since EPOCH (good until 2093)
+#   10 bits  worker: MEDREKK_NODE_ID (4 bits) and a per-host slot (6 bits)
+#   12 bits  sequence within the millisecond
+#
+# IDs from one worker increase, and IDs from all workers sort by time to the
+# millisecond, so new rows land next to each other in primary key indexes.
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+EPOCH_MS = int(EPOCH.timestamp() * 1000)
+TIMESTAMP_BITS = 41
+NODE_BITS = 4
+SLOT_BITS = 6
+SEQUENCE_BITS = 12
+WORKER_BITS = NODE_BITS + SLOT_BITS
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+VERSION = 1 << (TIMESTAMP_BITS + WORKER_BITS + SEQUENCE_BITS)
+
+# Digits, then letters in ASCII order, so IDs of the same length sort as
+# strings (in the "C" collation, see ShortIDType) as they sort as numbers.
+ALPHA = digits + ascii_uppercase + ascii_lowercase
+# Alphabet of the IDs generated before ALPHA. Lowercase letters come first,
+# so those IDs don't sort in the order they were generated. Their first
+# character is never uppercase, while that of every ID from ALPHA is.
+LEGACY_ALPHA = digits + ascii_letters
+
+# Hosts sharing a database need distinct node ids (0-15).
+NODE_ID = int(os.getenv("MEDREKK_NODE_ID", "0"))
+# Directory of the lock files through which processes on a host claim a slot.
+SLOT_DIR = os.getenv(
+    "MEDREKK_ID_SLOT_DIR", os.path.join(tempfile.gettempdir(), "medrekk-id-slots")
+)
+
 
 class ShortID:
-    def __init__(self, alpha = None):
-        self._last_ts = time_ns()
+    def __init__(self, alpha=None, node_id: int = NODE_ID, slot_dir: str = SLOT_DIR):
         if alpha:
-            self._alpha = alpha    
+            self._alpha = alpha
         else:
-            self._alpha = digits + ascii_letters
+            self._alpha = ALPHA
+        if not 0 <= node_id < 1 << NODE_BITS:
+            raise ValueError(f"node_id must be between 0 and {(1 << NODE_BITS) - 1}.")
+        self._node_id = node_id
+        self._slot_dir = slot_dir
+        # Width of the largest ID, so every ID has the same length.
+        self._width = len(self._int_to_alpha(VERSION * 2 - 1))
+        self._lock = Lock()
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._worker = None
+        self._slot_file = None
+        self._last_ms = -1
+        self._sequence = 0
+
+    def _claim_slot(self) -> int:
+        """
+        Takes the first free slot of this host by holding an exclusive lock on
+        its file for the life of the process. A forked child shares its
+        parent's lock, so it moves on to another slot.
+        """
+        if fcntl is None:
+            return os.getpid() % (1 << SLOT_BITS)
+
+        os.makedirs(self._slot_dir, exist_ok=True)
+        for slot in range(1 << SLOT_BITS):
+            file = open(os.path.join(self._slot_dir, f"{self._node_id}-{slot}"), "a")
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                file.close()
+                continue
+            self._slot_file = file
+            return slot
+        raise RuntimeError(
+            f"All {1 << SLOT_BITS} ID slots of node {self._node_id} are taken."
+        )
+
+    @property
+    def worker(self) -> int:
+        if self._worker is None:
+            self._worker = self._node_id << SLOT_BITS | self._claim_slot()
+        return self._worker
 
     def shortid(self) -> str:
-        _now = time_ns()
-        while _now <= self._last_ts:
-            _now = time_ns()
-        self._last_ts = _now
-        return self._int_to_alpha(_now)
+        with self._lock:
+            worker = self.worker
+            now = time_ns() // 1_000_000 - EPOCH_MS
+            if now > self._last_ms:
+                self._last_ms = now
+                self._sequence = 0
+            elif self._sequence < MAX_SEQUENCE:
+                # Same millisecond, or the clock went back: stay on the last one.
+                self._sequence += 1
+            else:
+                # Sequence used up: borrow the next millisecond instead of
+                # waiting for it. The clock catches up within a few ms.
+                self._last_ms += 1
+                self._sequence = 0
+
+            value = (
+                VERSION
+                | self._last_ms << (WORKER_BITS + SEQUENCE_BITS)
+                | worker << SEQUENCE_BITS
+                | self._sequence
+            )
+        return self._int_to_alpha(value).rjust(self._width, self._alpha[0])
+
+    def timestamp(self, s: str) -> datetime:
+        """
+        Time an ID was generated, to the millisecond.
+        """
+        if self._alpha == ALPHA and not s[0].isupper():
+            value = self._alpha_to_int(s, LEGACY_ALPHA)
+        else:
+            value = self._alpha_to_int(s)
+        if not value & VERSION:
+            # IDs from before the worker/sequence layout were time_ns().
+            return datetime.fromtimestamp(value / 1e9, tz=timezone.utc)
+        ms = (value ^ VERSION) >> (WORKER_BITS + SEQUENCE_BITS)
+        return EPOCH + timedelta(milliseconds=ms)
 
     def _int_to_alpha(self, t):
         base = len(self._alpha)
@@ -27,11 +144,12 @@ class ShortID:
 
         return alpha[::-1]
 
-    def _alpha_to_int(self, s):
+    def _alpha_to_int(self, s, alpha=None):
+        alpha = alpha or self._alpha
         num = 0
-        base = len(self._alpha)
+        base = len(alpha)
         for c in s:
-            num = num * base + self._alpha.index(c)
+            num = num * base + alpha.index(c)
         return num
 
 
@@ -0,0 +1,18 @@
+import re
+import unicodedata
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_name(*parts: str | None) -> str:
+    """
+    Search form of a name: accents stripped, case folded and whitespace
+    collapsed, so "Peña, José" and "pena jose" compare equal. Empty parts are
+    skipped.
+    """
+    text = " ".join(part for part in parts if part)
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r"[^\w\s]", " ", text.casefold())
+
+    return _SPACES.sub(" ", text).strip()
@@ -1,15 +1,25 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import Annotated
 
 from fastapi import Depends, FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
 from medrekk.admin.routes.accounts import account_routes, account_routes_verified
 from medrekk.admin.routes.users import user_routes
 from medrekk.admin.routes.auth import auth_routes
-from medrekk.common.database.connection import get_session
+from medrekk.admin.db.token import token_store
+from medrekk.admin.routes.metrics import metrics_routes
+from medrekk.common.database.connection import async_engine, engine, get_session
+from medrekk.common.database.partitions import run_maintenance
+from medrekk.common.database.pool import close_psycopg_pools
 from medrekk.common.controllers.init import init_db
+from medrekk.common.utils.gazetteer import gazetteer
+from medrekk.common.utils.hashing import password_hasher
 from medrekk.mrs.routes import (
+    address_routes,
     allergy_routes,
     bloodpressure_routes,
     bmi_routes,
@@ -17,6 +27,7 @@ from medrekk.mrs.routes import (
     bodytemp_routes,
     bodyweight_routes,
     diagnosis_routes,
+    export_routes,
     family_history_routes,
     heartrate_routes,
     hospitalization_history_routes,
@@ -35,12 +46,34 @@ VERSION = "202403"
 VERSION_SUFFIX = "pre-alpha"
 # DOCS_URL = f"/api/{VERSION}-{VERSION_SUFFIX}/docs"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await token_store.open()
+    # Loads (or builds) the address index off the event loop, before the
+    # address routes and patient forms need it.
+    await run_in_threadpool(lambda: gazetteer().prepare())
+    # Creates the coming months' partitions of the vitals tables.
+    partition_maintenance = asyncio.create_task(run_maintenance())
+    yield
+    partition_maintenance.cancel()
+    # Lets the task finish cancelling before the pools it uses are closed.
+    with suppress(asyncio.CancelledError):
+        await partition_maintenance
+    await token_store.close()
+    password_hasher.shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+    await close_psycopg_pools()
+
+
 medrekk_app = FastAPI(
     title="MedRekk",
     version=f"{VERSION}-{VERSION_SUFFIX}",
     # docs_url=DOCS_URL,
     root_path=f"/api/{VERSION}-{VERSION_SUFFIX}",
     debug=True,
+    lifespan=lifespan,
     responses={
         500: {
             "description": "HTTP_500_INTERNAL_SERVER_ERROR. The server encountered an unexpected condition that prevented it from fulfilling the request. If the error occurs after several retries, please contact the administrator at: ...",
@@ -64,6 +97,7 @@ def root(init: bool, db_session: Annotated[Session, Depends(get_session)]):
 
 
 medrekk_app.include_router(auth_routes)
+medrekk_app.include_router(metrics_routes)
 
 medrekk_app.include_router(account_routes)
 medrekk_app.include_router(account_routes_verified)
@@ -90,3 +124,6 @@ medrekk_app.include_router(bloodpressure_routes)
 medrekk_app.include_router(heartrate_routes)
 medrekk_app.include_router(respiratory_routes)
 medrekk_app.include_router(bodytemp_routes)
+
+medrekk_app.include_router(export_routes)
+medrekk_app.include_router(address_routes)
@@ -1,116 +1,21 @@
-from typing import List
-
-from fastapi import HTTPException, status
-from psycopg.errors import UniqueViolation
-from sqlalchemy.exc import DBAPIError
-from sqlalchemy.orm import Session
-
+from medrekk.common.controllers.repository import CRUDRepository
 from medrekk.common.models.patient import PatientBodyMassIndex
 from medrekk.mrs.schemas.patients import (
     PatientBodyMassIndexCreate,
     PatientBodyMassIndexUpdate,
 )
-from medrekk.common.utils import shortid
-
-
-def create_bmi(
-    patient_id: str,
-    bmi: PatientBodyMassIndexCreate,
-    db: Session,
-) -> PatientBodyMassIndex:
-    try:
-        new_bmi = PatientBodyMassIndex(**bmi.model_dump())
-        new_bmi.id = shortid()
-        new_bmi.patient_id = patient_id
-
-        db.add(new_bmi)
-        db.commit()
-        db.refresh(new_bmi)
-
-        return new_bmi
-    except DBAPIError as e:
-        args: str = e.orig.args[0] if e.orig.args else ""
-        has_uc_bmi_patient_date = args.find("uc_bmi_patient_date") >= 0
-
-        if isinstance(e.orig, UniqueViolation) and has_uc_bmi_patient_date:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={
-                    "status_code": status.HTTP_409_CONFLICT,
-                    "content": {
-                        "msg": "Patient cannot have multiple measurements "
-                        "for the same date. Date/Time: "
-                        f"{new_bmi.date_measured}",
-                        "loc": "date_measured",
-                    },
-                },
-            )
-        raise e
-
-def read_bmi(
-    patient_id: str,
-    bmi_id: str,
-    db: Session,
-) -> PatientBodyMassIndex:
-    bmi_db = (
-        db.query(PatientBodyMassIndex)
-        .filter(PatientBodyMassIndex.patient_id == patient_id)
-        .filter(PatientBodyMassIndex.id == bmi_id)
-        .one_or_none()
-    )
-
-    if not bmi_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "status_code": status.HTTP_404_NOT_FOUND,
-                "content": {"msg": "Patient bmi data NOT FOUND."},
-            },
-        )
-
-    return bmi_db
-
 
-def read_bmis(
-    patient_id: str,
-    db: Session,
-) -> List[PatientBodyMassIndex]:
-    bmis = (
-        db.query(PatientBodyMassIndex)
-        .filter(PatientBodyMassIndex.patient_id == patient_id)
-        .order_by(PatientBodyMassIndex.created.desc())
-        .all()
-    )
-
-    return bmis
-
-
-def update_bmi(
-    patient_id: str,
-    bmi_id: str,
-    bmi: PatientBodyMassIndexUpdate,
-    db: Session,
-) -> PatientBodyMassIndex:
-    bmi_db = read_bmi(patient_id, bmi_id, db)
-
-    for field, value in bmi.model_dump(exclude_unset=True).items():
-        setattr(bmi_db, field, value)
-
-    db.add(bmi_db)
-    db.commit()
-    db.refresh(bmi_db)
-
-    return bmi_db
-
-
-def delete_bmi(
-    patient_id: str,
-    bmi_id: str,
-    db: Session,
-) -> None:
-    bmi_db = read_bmi(patient_id, bmi_id, db)
-
-    db.delete(bmi_db)
-    db.commit()
-
-    return None
+bmi_repository = CRUDRepository(
+    PatientBodyMassIndex,
+    create_schema=PatientBodyMassIndexCreate,
+    update_schema=PatientBodyMassIndexUpdate,
+    parent_key="patient_id",
+    item_loc="bmi_id",
+    not_found_msg="Patient bmi data NOT FOUND.",
+    unique_constraint="uc_bmi_patient_date",
+    conflict_msg=(
+        "Patient cannot have multiple measurements for the same date. "
+        "Date/Time: {date_measured}"
+    ),
+    conflict_loc="date_measured",
+)
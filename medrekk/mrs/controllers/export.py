@@ -0,0 +1,140 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Iterator, List, Literal, Optional
+
+from sqlalchemy import select
+
+from medrekk.common.database.connection import AsyncSessionLocal, SessionLocal
+from medrekk.common.models.patient import (
+    PatientBloodPressure,
+    PatientBodyTemperature,
+    PatientHeartRate,
+    PatientRecord,
+    PatientRespiratoryRate,
+)
+
+# Rows fetched from the server-side cursor per round trip; also the number of
+# rows per chunk written to the response.
+EXPORT_BATCH_SIZE = 1000
+
+Vital = Literal["bloodpressure", "heartrate", "respiratoryrate", "bodytemperature"]
+
+# vital -> (model, value columns)
+VITALS = {
+    "bloodpressure": (PatientBloodPressure, ("systolic", "diastolic")),
+    "heartrate": (PatientHeartRate, ("heart_rate",)),
+    "respiratoryrate": (PatientRespiratoryRate, ("respiratory_rate",)),
+    "bodytemperature": (PatientBodyTemperature, ("body_temperature",)),
+}
+
+EXPORT_COLUMNS = (
+    "vital",
+    "id",
+    "patient_id",
+    "record_id",
+    "dt_measured",
+    "systolic",
+    "diastolic",
+    "heart_rate",
+    "respiratory_rate",
+    "body_temperature",
+)
+
+
+def _vital_select(account_id: str, vital: str, record_id: Optional[str] = None):
+    model, value_columns = VITALS[vital]
+    query = (
+        select(
+            model.id,
+            PatientRecord.patient_id,
+            model.record_id,
+            model.dt_measured,
+            *(getattr(model, column) for column in value_columns),
+        )
+        .join(PatientRecord, PatientRecord.id == model.record_id)
+        .where(PatientRecord.account_id == account_id)
+        .order_by(model.dt_measured)
+    )
+    if record_id is not None:
+        query = query.where(model.record_id == record_id)
+    return query
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_header() -> str:
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS).writeheader()
+    return buffer.getvalue()
+
+
+def _encode_rows(vital: str, rows: Iterable[dict], fmt: str) -> str:
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+        writer.writerows({"vital": vital, **row} for row in rows)
+        return buffer.getvalue()
+    return "".join(
+        json.dumps({"vital": vital, **{k: _encode_value(v) for k, v in row.items()}})
+        + "\n"
+        for row in rows
+    )
+
+
+def export_vitals(
+    account_id: str,
+    vitals: List[Vital],
+    fmt: str,
+    record_id: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Yields the vitals of every record of the account, or of `record_id` only,
+    as NDJSON lines or CSV.
+
+    Rows come from a server-side cursor (`yield_per` implies `stream_results`)
+    and are written out one batch at a time, so memory use does not depend on
+    the number of rows exported.
+
+    The generator opens its own session: it is consumed by the
+    `StreamingResponse` after the request's `get_db` session has been closed.
+    """
+    with SessionLocal() as db:
+        if fmt == "csv":
+            yield _csv_header()
+
+        for vital in vitals:
+            result = db.execute(
+                _vital_select(account_id, vital, record_id),
+                execution_options={"yield_per": EXPORT_BATCH_SIZE},
+            )
+            for rows in result.mappings().partitions():
+                yield _encode_rows(vital, rows, fmt)
+
+
+async def export_vitals_async(
+    account_id: str,
+    vitals: List[Vital],
+    fmt: str,
+    record_id: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """
+    `export_vitals` on an `AsyncSession`, for MEDREKK_DB_MODE=async: the
+    batches are fetched on the event loop instead of in the threadpool.
+    """
+    async with AsyncSessionLocal() as db:
+        if fmt == "csv":
+            yield _csv_header()
+
+        for vital in vitals:
+            result = await db.stream(
+                _vital_select(account_id, vital, record_id),
+                execution_options={"yield_per": EXPORT_BATCH_SIZE},
+            )
+            async for rows in result.mappings().partitions():
+                yield _encode_rows(vital, rows, fmt)
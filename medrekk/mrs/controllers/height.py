@@ -1,118 +1,21 @@
-from typing import List
-
-from fastapi import HTTPException, status
-from psycopg.errors import UniqueViolation
-from sqlalchemy.exc import DBAPIError
-from sqlalchemy.orm import Session
-
+from medrekk.common.controllers.repository import CRUDRepository
 from medrekk.common.models.patient import PatientHeight
-from medrekk.mrs.schemas.patients import PatientHeightCreate, PatientHeightUpdate
-from medrekk.common.utils import shortid
-
-
-def create_height(
-    patient_id: str,
-    height: PatientHeightCreate,
-    db: Session,
-) -> PatientHeight:
-    try:
-        new_height = PatientHeight(**height.model_dump())
-        new_height.id = shortid()
-        new_height.patient_id = patient_id
-
-        db.add(new_height)
-        db.commit()
-        db.refresh(new_height)
-
-        return new_height
-    except DBAPIError as e:
-        args: str = e.orig.args[0] if e.orig.args else ""
-        has_uc_height_patient_date = args.find("uc_height_patient_date") >= 0
-
-        if isinstance(e.orig, UniqueViolation) and has_uc_height_patient_date:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={
-                    "status_code": status.HTTP_409_CONFLICT,
-                    "content": {
-                        "msg": "Patient cannot have multiple measurements "
-                        "for the same date. Date/Time: "
-                        f"{new_height.date_measured}",
-                        "loc": "date_measured",
-                    },
-                },
-            )
-
-        raise e
-
-
-def read_height(
-    patient_id: str,
-    height_id: str,
-    db: Session,
-) -> PatientHeight:
-    height_db = (
-        db.query(PatientHeight)
-        .filter(PatientHeight.patient_id == patient_id)
-        .filter(PatientHeight.id == height_id)
-        .one_or_none()
-    )
-
-    if not height_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "status_code": status.HTTP_404_NOT_FOUND,
-                "content": {
-                    "msg": "Patient height data NOT FOUND.",
-                    "loc": "height_id",
-                },
-            },
-        )
-
-    return height_db
-
-
-def read_heights(
-    patient_id: str,
-    db: Session,
-) -> List[PatientHeight]:
-    heights = (
-        db.query(PatientHeight)
-        .filter(PatientHeight.patient_id == patient_id)
-        .order_by(PatientHeight.created.desc())
-        .all()
-    )
-
-    return heights
-
-
-def update_height(
-    patient_id: str,
-    height_id: str,
-    height: PatientHeightUpdate,
-    db: Session,
-) -> PatientHeight:
-    height_db = read_height(patient_id, height_id, db)
-
-    for field, value in height.model_dump(exclude_unset=True).items():
-        setattr(height_db, field, value)
-
-    db.add(height_db)
-    db.commit()
-    db.refresh(height_db)
-
-    return height_db
-
-
-def delete_height(
-    patient_id: str,
-    height_id: str,
-    db: Session,
-) -> None:
-    height_db = read_height(patient_id, height_id, db)
-
-    db.delete(height_db)
-    db.commit()
-
-    return None
+from medrekk.mrs.schemas.patients import (
+    PatientHeightCreate,
+    PatientHeightUpdate,
+)
+
+height_repository = CRUDRepository(
+    PatientHeight,
+    create_schema=PatientHeightCreate,
+    update_schema=PatientHeightUpdate,
+    parent_key="patient_id",
+    item_loc="height_id",
+    not_found_msg="Patient height data NOT FOUND.",
+    unique_constraint="uc_height_patient_date",
+    conflict_msg=(
+        "Patient cannot have multiple measurements for the same date. "
+        "Date/Time: {date_measured}"
+    ),
+    conflict_loc="date_measured",
+)
@@ -1,51 +1,150 @@
-from typing import List
-
 from fastapi import HTTPException, status
+from sqlalchemy import func, insert, literal, or_, select
 from sqlalchemy.orm import Session
 
 from medrekk.common.models.patient import PatientProfile
 from medrekk.mrs.schemas.patients import PatientProfileCreate
-from medrekk.common.utils import shortid
+from medrekk.common.utils.gazetteer import gazetteer
+from medrekk.common.utils.pagination import PageParams, keyset_paginate
+from medrekk.common.utils.text import normalize_name
+
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+
+
+ADDRESS_FIELDS = ("address_province", "address_city", "address_barangay")
+
+
+def normalize_address(patient: PatientProfileCreate) -> dict:
+    """
+    Address columns of a Philippine address: canonical province, city and
+    barangay names and their codes. Raises HTTPException 422 naming the first
+    field that does not match the gazetteer. Other countries are kept as given.
+    """
+    if normalize_name(patient.address_country) != "philippines":
+        return {}
+
+    areas = gazetteer().resolve(
+        *(getattr(patient, field) for field in ADDRESS_FIELDS)
+    )
+
+    if len(areas) < 4:
+        field = ADDRESS_FIELDS[max(len(areas) - 1, 0)]
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                "content": {
+                    "msg": f"{getattr(patient, field)} is not a known "
+                    f"{field.removeprefix('address_')} in the Philippines.",
+                    "loc": field,
+                },
+            },
+        )
+
+    region, province, city, barangay = areas
+    return {
+        "address_country": "Philippines",
+        "address_province": province.name,
+        "address_city": city.name,
+        "address_barangay": barangay.name,
+        "address_region_code": region.code,
+        "address_province_code": province.code,
+        "address_city_code": city.code,
+        "address_barangay_code": barangay.code,
+    }
+
+
+def patient_not_found(patient_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "status_code": status.HTTP_404_NOT_FOUND,
+            "content": {
+                "msg": f"Patient with ID: {patient_id} is not found. Please",
+                "loc": "patient_id",
+            },
+        },
+    )
 
 
 def create_patient(
+    account_id: str,
     patient: PatientProfileCreate,
     db: Session,
 ):
-    new_patient = PatientProfile(**patient.model_dump())
-    new_patient.id = shortid()
-    db.add(new_patient)
+    new_patient = db.scalar(
+        insert(PatientProfile)
+        .values(
+            account_id=account_id,
+            search_name=normalize_name(
+                patient.lastname, patient.firstname, patient.middlename
+            ),
+            **{**patient.model_dump(), **normalize_address(patient)},
+        )
+        .returning(PatientProfile)
+    )
     db.commit()
-    db.refresh(new_patient)
 
     return new_patient
 
 
 def read_patients(
+    account_id: str,
+    page: PageParams,
+    db: Session,
+) -> dict:
+    query = db.query(PatientProfile).filter(PatientProfile.account_id == account_id)
+
+    return keyset_paginate(query, PatientProfile, page)
+
+
+def search_patients(
+    account_id: str,
+    q: str,
+    limit: int,
     db: Session,
-) -> List[PatientProfile]:
-    patients = db.query(PatientProfile).all()
+) -> list[PatientProfile]:
+    """
+    Patients of the account whose name contains `q` or has a word close to it
+    (pg_trgm `<%`), best match first. Both conditions are answered by
+    idx_patient_profile_search.
+    """
+    term = normalize_name(q)
+    if not term:
+        return []
 
-    return patients
+    return db.scalars(
+        select(PatientProfile)
+        .where(
+            PatientProfile.account_id == account_id,
+            or_(
+                PatientProfile.search_name.contains(term, autoescape=True),
+                literal(term).op("<%")(PatientProfile.search_name),
+            ),
+        )
+        .order_by(
+            func.word_similarity(term, PatientProfile.search_name).desc(),
+            PatientProfile.search_name,
+            PatientProfile.id,
+        )
+        .limit(limit)
+    ).all()
 
 
 def read_patient(
+    account_id: str,
     patient_id: str,
     db: Session,
 ) -> PatientProfile:
     patient = db.get(PatientProfile, patient_id)
 
+    # Another account's patient is reported as not found.
+    if patient and patient.account_id != account_id:
+        patient = None
+
     if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "status_code": status.HTTP_404_NOT_FOUND,
-                "content": {
-                    "msg": f"Patient with ID: {patient_id} is not found. Please",
-                    "loc": "patient_id",
-                },
-            },
-        )
+        raise patient_not_found(patient_id)
     return patient
 
 
@@ -1,9 +1,9 @@
-from typing import List
+from sqlalchemy import delete, insert, update
 from sqlalchemy.orm import Session
 
 from medrekk.common.models.patient import PatientRecord
 from medrekk.mrs.schemas.patients import PatientRecordCreate, PatientRecordUpdate
-from medrekk.common.utils import shortid
+from medrekk.common.utils.pagination import PageParams, keyset_paginate
 
 
 def create_record(
@@ -12,14 +12,16 @@ def create_record(
     record: PatientRecordCreate,
     db: Session,
 ) -> PatientRecord:
-    new_record = PatientRecord(**record.model_dump())
-    new_record.account_id = account_id
-    new_record.patient_id = patient_id
-    new_record.id = shortid()
-
-    db.add(new_record)
+    new_record = db.scalar(
+        insert(PatientRecord)
+        .values(
+            account_id=account_id,
+            patient_id=patient_id,
+            **record.model_dump(),
+        )
+        .returning(PatientRecord)
+    )
     db.commit()
-    db.refresh(new_record)
 
     return new_record
 
@@ -27,16 +29,16 @@ def create_record(
 def read_records(
     account_id: str,
     patient_id: str,
+    page: PageParams,
     db: Session,
-) -> List[PatientRecord]:
-    records = (
+) -> dict:
+    return keyset_paginate(
         db.query(PatientRecord)
         .filter(PatientRecord.account_id == account_id)
-        .filter(PatientRecord.patient_id == patient_id)
-        .order_by(PatientRecord.updated.desc())
-        .all()
+        .filter(PatientRecord.patient_id == patient_id),
+        PatientRecord,
+        page,
     )
-    return records
 
 
 def read_record(
@@ -63,14 +65,15 @@ def update_record(
     record: PatientRecordUpdate,
     db: Session,
 ) -> PatientRecord:
-    record_db = read_record(account_id, patient_id, record_id, db)
-
-    for field, value in record.model_dump(exclude_unset=True).items():
-        setattr(record_db, field, value)
-
-    db.add(record_db)
+    record_db = db.scalar(
+        update(PatientRecord)
+        .where(PatientRecord.account_id == account_id)
+        .where(PatientRecord.patient_id == patient_id)
+        .where(PatientRecord.id == record_id)
+        .values(**record.model_dump(exclude_unset=True))
+        .returning(PatientRecord)
+    )
     db.commit()
-    db.refresh(record_db)
 
     return record_db
 
@@ -80,9 +83,12 @@ def delete_record(
     record_id: str,
     db: Session,
 ) -> None:
-    record = read_record(account_id, patient_id, record_id, db)
-
-    db.delete(record)
+    db.execute(
+        delete(PatientRecord)
+        .where(PatientRecord.account_id == account_id)
+        .where(PatientRecord.patient_id == patient_id)
+        .where(PatientRecord.id == record_id)
+    )
     db.commit()
 
     return None
\ No newline at end of file
@@ -0,0 +1,131 @@
+from typing import Dict, List, Literal, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from medrekk.common.models.patient import (
+    PatientAllergy,
+    PatientBodyMassIndex,
+    PatientBodyWeight,
+    PatientFamilyHistory,
+    PatientHeight,
+    PatientHospitalizationHistory,
+    PatientImmunization,
+    PatientMedicalHistory,
+    PatientMedication,
+    PatientOBHistory,
+    PatientProfile,
+    PatientRecord,
+    PatientSurgicalHistory,
+)
+from medrekk.mrs.controllers.profile import patient_not_found
+
+Section = Literal[
+    "family_history",
+    "medical_history",
+    "ob_history",
+    "hospitalizations",
+    "surgical_history",
+    "medications",
+    "allergies",
+    "immunizations",
+    "body_weights",
+    "heights",
+    "bmi",
+    "records",
+]
+
+# At most one row per patient, returned as an object (or null).
+SINGLETONS = {
+    "family_history": PatientFamilyHistory,
+    "medical_history": PatientMedicalHistory,
+    "ob_history": PatientOBHistory,
+}
+# Histories, returned in full, newest first.
+HISTORIES = {
+    "hospitalizations": (PatientHospitalizationHistory, "admission_date"),
+    "surgical_history": (PatientSurgicalHistory, "surgery_date"),
+    "medications": (PatientMedication, "start_date"),
+    "allergies": (PatientAllergy, "created"),
+    "immunizations": (PatientImmunization, "date_administered"),
+}
+# Time series, returned as the latest `limit` rows.
+SERIES = {
+    "body_weights": (PatientBodyWeight, "date_measured"),
+    "heights": (PatientHeight, "date_measured"),
+    "bmi": (PatientBodyMassIndex, "date_measured"),
+    "records": (PatientRecord, "created"),
+}
+SECTIONS = [*SINGLETONS, *HISTORIES, *SERIES]
+
+SUMMARY_LIMIT = 5
+MAX_SUMMARY_LIMIT = 100
+
+
+def _rows(model, patient_id: str, order_by: str, limit: Optional[int]):
+    """
+    `model` rows of the patient as one JSON array, newest first.
+    """
+    rows = (
+        select(model)
+        .where(model.patient_id == patient_id)
+        .order_by(getattr(model, order_by).desc(), model.id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    # The subquery's order is not guaranteed to reach the aggregate.
+    ordered = aggregate_order_by(
+        rows.table_valued(), rows.c[order_by].desc(), rows.c.id.desc()
+    )
+    return (
+        select(func.coalesce(func.json_agg(ordered), text("'[]'::json")))
+        .select_from(rows)
+        .scalar_subquery()
+    )
+
+
+def _row(model, patient_id: str):
+    rows = select(model).where(model.patient_id == patient_id).subquery()
+    return select(func.to_json(rows.table_valued())).select_from(rows).scalar_subquery()
+
+
+def read_patient_summary(
+    account_id: str,
+    patient_id: str,
+    include: Optional[List[Section]],
+    limit: int,
+    db: Session,
+) -> Dict:
+    """
+    The profile and the requested sections (all by default) of a patient, in
+    one query: every section is a subquery aggregated to JSON with json_agg,
+    so the cost is one round trip however many sections are included.
+    """
+    sections = list(dict.fromkeys(include)) if include else SECTIONS
+    columns = []
+    for section in sections:
+        if section in SINGLETONS:
+            column = _row(SINGLETONS[section], patient_id)
+        elif section in HISTORIES:
+            model, order_by = HISTORIES[section]
+            column = _rows(model, patient_id, order_by, None)
+        else:
+            model, order_by = SERIES[section]
+            column = _rows(model, patient_id, order_by, limit)
+        columns.append(column.label(section))
+
+    row = db.execute(
+        select(PatientProfile, *columns).where(
+            PatientProfile.id == patient_id,
+            PatientProfile.account_id == account_id,
+        )
+    ).one_or_none()
+
+    if not row:
+        raise patient_not_found(patient_id)
+
+    return {
+        "profile": row[0],
+        **{section: row._mapping[section] for section in sections},
+    }
@@ -1,9 +1,11 @@
+from .address import address_routes
 from .allergy import allergy_routes
 from .bloodpressures import bloodpressure_routes
 from .bmi import bmi_routes
 from .body_temperature import bodytemp_routes
 from .body_weight import bodyweight_routes
 from .diagnosis import diagnosis_routes
+from .export import export_routes
 from .family_history import family_history_routes
 from .heart_rate import heartrate_routes
 from .height import bodyheight_routes
@@ -18,6 +20,7 @@ from .respiratory_rate import respiratory_routes
 from .surgical_history import surgical_history_routes
 
 __all__ = [
+    "address_routes",
     "allergy_routes",
     "bloodpressure_routes",
     "bmi_routes",
@@ -25,6 +28,7 @@ __all__ = [
     "bodytemp_routes",
     "bodyweight_routes",
     "diagnosis_routes",
+    "export_routes",
     "family_history_routes",
     "heartrate_routes",
     "hospitalization_history_routes",
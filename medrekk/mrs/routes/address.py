@@ -0,0 +1,102 @@
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from medrekk.common.utils import routes
+from medrekk.common.utils.auth import verify_jwt_token
+from medrekk.common.utils.gazetteer import gazetteer
+from medrekk.mrs.schemas.addresses import AddressArea, AddressLevel
+from medrekk.schemas.responses import HTTP_EXCEPTION
+
+address_routes = APIRouter(
+    prefix=f"/{routes.ADDRESSES}",
+    dependencies=[Depends(verify_jwt_token)],
+    tags=["Addresses"],
+)
+
+NOT_FOUND = {
+    status.HTTP_404_NOT_FOUND: {
+        "model": HTTP_EXCEPTION,
+        "description": "No area has the given code.",
+    },
+}
+
+
+def area_not_found(code: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "status_code": status.HTTP_404_NOT_FOUND,
+            "content": {
+                "msg": f"Address code: {code} is not found.",
+                "loc": "code",
+            },
+        },
+    )
+
+
+@address_routes.get(
+    "/regions",
+    response_model=List[AddressArea],
+    name="List regions",
+)
+async def list_regions():
+    return [area._asdict() for area in gazetteer().children()]
+
+
+@address_routes.get(
+    "/search",
+    response_model=List[AddressArea],
+    name="Autocomplete address areas",
+)
+async def search_areas(
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    level: AddressLevel = "municipality",
+    parent: Annotated[
+        Optional[str],
+        Query(description="Only return direct children of this area."),
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """
+    Areas of `level` whose name starts with `q`, ignoring case, accents and
+    punctuation.
+    """
+    return [
+        area._asdict()
+        for area in gazetteer().search(q, level=level, parent=parent, limit=limit)
+    ]
+
+
+@address_routes.get(
+    "/{code}",
+    response_model=AddressArea,
+    name="Get address area",
+    responses=NOT_FOUND,
+)
+async def get_area(code: str):
+    area = gazetteer().get(code)
+
+    if not area:
+        raise area_not_found(code)
+
+    return area._asdict()
+
+
+@address_routes.get(
+    "/{code}/children",
+    response_model=List[AddressArea],
+    name="List areas under an address area",
+    responses=NOT_FOUND,
+)
+async def list_children(code: str):
+    """
+    Provinces of a region, municipalities of a province or barangays of a
+    municipality.
+    """
+    children = gazetteer().children(code)
+
+    if children is None:
+        raise area_not_found(code)
+
+    return [area._asdict() for area in children]
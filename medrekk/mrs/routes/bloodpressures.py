@@ -1,107 +1,16 @@
-from typing import Annotated, List
-
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from medrekk.mrs.controllers.bloodpressure import (
-    create_patient_bloodpressure,
-    delete_patient_bloodpressure,
-    read_patient_bloodpressure,
-    read_patient_bloodpressures,
-    update_patient_bloodpressure,
-)
-from medrekk.common.database.connection import get_session
-from medrekk.mrs.schemas.patients import (
-    PatientBloodPressureCreate,
-    PatientBloodPressureRead,
-    PatientBloodPressureUpdate,
-)
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import account_record_id_validate, verify_jwt_token
+from medrekk.common.utils.auth import account_record_id_validate
+from medrekk.mrs.controllers.bloodpressure import bloodpressure_repository
+from medrekk.mrs.routes.crud import crud_routes
+from medrekk.mrs.schemas.patients import PatientBloodPressureRead
 
-bloodpressure_routes = APIRouter(
+bloodpressure_routes = crud_routes(
+    bloodpressure_repository,
     prefix=f"/{routes.RECORDS}" + "/{record_id}" + f"/{routes.BLOODPRESSURES}",
-    dependencies=[Depends(verify_jwt_token)],
-    tags=["Patient Blood Pressure"],
-)
-
-# START: Blood Pressure
-
-
-@bloodpressure_routes.post(
-    "/",
-    response_model=PatientBloodPressureRead,
-    name="Add Patient Blood Pressure",
+    tag="Patient Blood Pressure",
+    name="Patient Blood Pressure",
+    name_plural="Patient Blood Pressures",
+    read_schema=PatientBloodPressureRead,
+    parent=account_record_id_validate,
+    batch=True,
 )
-async def add_bloodpressure(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    patient_bp: PatientBloodPressureCreate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    new_bp = create_patient_bloodpressure(record_id, patient_bp, db_session)
-
-    return PatientBloodPressureRead.model_validate(new_bp)
-
-
-@bloodpressure_routes.get(
-    "/",
-    response_model=List[PatientBloodPressureRead],
-    name="Get Patient Blood Pressures",
-)
-async def get_bloodpressures(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    patient_bps = read_patient_bloodpressures(record_id, db_session)
-
-    validated = []
-    for bp in patient_bps:
-        validated.append(PatientBloodPressureRead.model_validate(bp))
-
-    return validated
-
-
-@bloodpressure_routes.get(
-    "/{bp_id}/",
-    response_model=PatientBloodPressureRead,
-    name="Get Patient Blood Pressure",
-)
-async def get_bloodpressure(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    bp_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    patient_bp = read_patient_bloodpressure(record_id, bp_id, db_session)
-
-    return PatientBloodPressureRead.model_validate(patient_bp)
-
-
-@bloodpressure_routes.put(
-    "/{bp_id}",
-    response_model=PatientBloodPressureRead,
-    name="Update Blood Pressure Record",
-)
-async def put_bloodpressure(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    bp_id: str,
-    bp: PatientBloodPressureUpdate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    patient_bp = update_patient_bloodpressure(record_id, bp_id, bp, db_session)
-
-    return PatientBloodPressureRead.model_validate(patient_bp)
-
-
-@bloodpressure_routes.delete(
-    "/{bp_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
-)
-async def delete_bloodpressure(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    bp_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    return delete_patient_bloodpressure(record_id, bp_id, db_session)
-
-
-# END : Blood Pressure
@@ -1,94 +1,13 @@
-from typing import Annotated, List
-
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from medrekk.common.database.connection import get_session
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import verify_jwt_token
-from medrekk.mrs.controllers.body_weight import (
-    create_bodyweight,
-    delete_bodyweight,
-    read_bodyweight,
-    read_bodyweights,
-    update_bodyweight,
-)
-from medrekk.mrs.schemas.patients import (
-    PatientBodyWeightCreate,
-    PatientBodyWeightRead,
-    PatientBodyWeightUpdate,
-)
+from medrekk.mrs.controllers.body_weight import bodyweight_repository
+from medrekk.mrs.routes.crud import crud_routes
+from medrekk.mrs.schemas.patients import PatientBodyWeightRead
 
-bodyweight_routes = APIRouter(
+bodyweight_routes = crud_routes(
+    bodyweight_repository,
     prefix=f"/{routes.PATIENTS}" + "/{patient_id}" + f"/{routes.BODYWEIGHTS}",
-    dependencies=[Depends(verify_jwt_token)],
-    tags=["Patient Bodyweight"],
-)
-
-
-@bodyweight_routes.post(
-    "/",
-    response_model=PatientBodyWeightRead,
-    status_code=status.HTTP_201_CREATED,
-)
-async def add_patient_bodyweight(
-    patient_id: str,
-    bodyweight: PatientBodyWeightCreate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    new_bodyweight = create_bodyweight(patient_id, bodyweight, db_session)
-
-    return new_bodyweight
-
-
-@bodyweight_routes.get(
-    "/",
-    response_model=List[PatientBodyWeightRead],
-)
-async def get_patient_bodyweights(
-    patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    bodyweights = read_bodyweights(patient_id, db_session)
-
-    return bodyweights
-
-
-@bodyweight_routes.get(
-    "/{bodyweight_id}",
-    response_model=PatientBodyWeightRead,
-)
-async def get_patient_bodyweight(
-    patient_id: str,
-    bodyweight_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    bodyweight = read_bodyweight(patient_id, bodyweight_id, db_session)
-
-    return bodyweight
-
-
-@bodyweight_routes.put("/{bodyweight_id}", response_model=PatientBodyWeightUpdate)
-async def update_patient_bodyweight(
-    patient_id: str,
-    bodyweight_id: str,
-    bodyweight: PatientBodyWeightUpdate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    updated_bodyweight = update_bodyweight(
-        patient_id, bodyweight_id, bodyweight, db_session
-    )
-
-    return updated_bodyweight
-
-
-@bodyweight_routes.delete(
-    "/{bodyweight_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    tag="Patient Bodyweight",
+    name="Patient Bodyweight",
+    name_plural="Patient Bodyweights",
+    read_schema=PatientBodyWeightRead,
 )
-async def delete_patient_bodyweight(
-    patient_id: str,
-    bodyweight_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    return delete_bodyweight(patient_id, bodyweight_id, db_session)
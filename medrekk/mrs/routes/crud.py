@@ -0,0 +1,318 @@
+from typing import Annotated, Callable, List, Type
+
+from fastapi import APIRouter, Depends, Path, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from medrekk.common.controllers.repository import (
+    Bucket,
+    CRUDRepository,
+    SingletonRepository,
+    VitalsRepository,
+)
+from medrekk.common.database.connection import get_db, run_controller
+from medrekk.common.utils.auth import account_patient_id_validate, verify_jwt_token
+from medrekk.common.utils.pagination import (
+    PageParams,
+    TimeRange,
+    page_params,
+    time_range,
+)
+from medrekk.schemas.responses import BatchResult, Page, TrendBucket
+
+# Most items accepted by one `:batch` request.
+MAX_BATCH_SIZE = 1000
+
+
+def crud_routes(
+    repository: CRUDRepository,
+    *,
+    prefix: str,
+    tag: str,
+    name: str,
+    name_plural: str,
+    read_schema: Type[BaseModel],
+    parent: Callable[..., str] = account_patient_id_validate,
+    batch: bool = False,
+) -> APIRouter:
+    """
+    Builds the create/list/read/update/delete routes of a resource.
+
+    `parent` is the dependency that resolves (and authorizes) the parent id from
+    the path, e.g. `account_patient_id_validate` or `account_record_id_validate`.
+    Items are addressed by `/{<repository.item_loc>}`, e.g. `/{bp_id}`.
+
+    `batch` adds `POST <prefix>:batch`, which creates an array of items with
+    one INSERT (see `CRUDRepository.create_many`).
+
+    For a `VitalsRepository`, the list takes `from`/`to` and `GET <prefix>/trend`
+    returns bucketed aggregates.
+    """
+    item_path = "/{" + repository.item_loc + "}"
+    ItemID = Annotated[str, Path(alias=repository.item_loc)]
+
+    create_schema = repository.create_schema
+    update_schema = repository.update_schema
+
+    router = APIRouter(
+        prefix=prefix,
+        dependencies=[Depends(verify_jwt_token)],
+        tags=[tag],
+    )
+
+    @router.post(
+        "/",
+        response_model=read_schema,
+        status_code=status.HTTP_201_CREATED,
+        name=f"Add {name}",
+    )
+    async def create_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item: create_schema,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.create, parent_id, item, db=db_session)
+
+    if batch:
+        batch_adapter = TypeAdapter(
+            Annotated[
+                List[create_schema],
+                Field(min_length=1, max_length=MAX_BATCH_SIZE),
+            ]
+        )
+        batch_schema = batch_adapter.json_schema(
+            ref_template="#/components/schemas/{model}"
+        )
+        batch_schema.pop("$defs", None)
+
+        @router.post(
+            ":batch",
+            response_model=BatchResult[read_schema],
+            status_code=status.HTTP_201_CREATED,
+            name=f"Add {name_plural}",
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": batch_schema}},
+                },
+            },
+        )
+        async def create_items(
+            parent_id: Annotated[str, Depends(parent)],
+            request: Request,
+            db_session: Annotated[Session, Depends(get_db)],
+        ):
+            # Parse and validate the raw body in one pass instead of building
+            # the JSON document first and validating it item by item.
+            try:
+                items = batch_adapter.validate_json(await request.body())
+            except ValidationError as e:
+                raise RequestValidationError(
+                    [
+                        {**error, "loc": ("body", *error["loc"])}
+                        for error in e.errors(include_url=False)
+                    ]
+                )
+
+            return await run_controller(
+                repository.create_many,
+                parent_id,
+                items,
+                db=db_session,
+            )
+
+    if isinstance(repository, VitalsRepository):
+
+        @router.get(
+            "/trend",
+            response_model=List[TrendBucket],
+            name=f"Get {name} trend",
+        )
+        async def read_trend(
+            parent_id: Annotated[str, Depends(parent)],
+            period: Annotated[TimeRange, Depends(time_range)],
+            db_session: Annotated[Session, Depends(get_db)],
+            bucket: Bucket = "1h",
+        ):
+            """
+            Count, min, max and average per hour or day of the readings
+            measured between `from` and `to`, oldest first.
+            """
+            return await run_controller(
+                repository.read_trend,
+                parent_id,
+                period,
+                bucket,
+                db=db_session,
+            )
+
+        @router.get(
+            "/",
+            response_model=Page[read_schema],
+            name=f"Get {name_plural}",
+        )
+        async def read_readings(
+            parent_id: Annotated[str, Depends(parent)],
+            page: Annotated[PageParams, Depends(page_params)],
+            period: Annotated[TimeRange, Depends(time_range)],
+            db_session: Annotated[Session, Depends(get_db)],
+        ):
+            """
+            Latest measurement first. With `from` or `to`, only the readings
+            measured in that range.
+            """
+            if period.start or period.end:
+                return await run_controller(
+                    repository.read_range,
+                    parent_id,
+                    period,
+                    page,
+                    db=db_session,
+                )
+            return await run_controller(
+                repository.read_all,
+                parent_id,
+                page,
+                db=db_session,
+            )
+
+    else:
+
+        @router.get(
+            "/",
+            response_model=Page[read_schema],
+            name=f"Get {name_plural}",
+        )
+        async def read_items(
+            parent_id: Annotated[str, Depends(parent)],
+            page: Annotated[PageParams, Depends(page_params)],
+            db_session: Annotated[Session, Depends(get_db)],
+        ):
+            return await run_controller(
+                repository.read_all,
+                parent_id,
+                page,
+                db=db_session,
+            )
+
+    @router.get(
+        item_path,
+        response_model=read_schema,
+        name=f"Get {name}",
+    )
+    async def read_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item_id: ItemID,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.read, parent_id, item_id, db=db_session)
+
+    @router.put(
+        item_path,
+        response_model=read_schema,
+        name=f"Update {name}",
+    )
+    async def update_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item_id: ItemID,
+        item: update_schema,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(
+            repository.update,
+            parent_id,
+            item_id,
+            item,
+            db=db_session,
+        )
+
+    @router.delete(
+        item_path,
+        status_code=status.HTTP_204_NO_CONTENT,
+        name=f"Delete {name}",
+    )
+    async def delete_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item_id: ItemID,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(
+            repository.delete,
+            parent_id,
+            item_id,
+            db=db_session,
+        )
+
+    return router
+
+
+def singleton_routes(
+    repository: SingletonRepository,
+    *,
+    prefix: str,
+    tag: str,
+    name: str,
+    read_schema: Type[BaseModel],
+    parent: Callable[..., str] = account_patient_id_validate,
+) -> APIRouter:
+    """
+    Builds the create/read/update/delete routes of a one-per-parent resource.
+    """
+    create_schema = repository.create_schema
+    update_schema = repository.update_schema
+
+    router = APIRouter(
+        prefix=prefix,
+        dependencies=[Depends(verify_jwt_token)],
+        tags=[tag],
+    )
+
+    @router.post(
+        "/",
+        response_model=read_schema,
+        status_code=status.HTTP_201_CREATED,
+        name=f"Add {name}",
+    )
+    async def create_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item: create_schema,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.create, parent_id, item, db=db_session)
+
+    @router.get(
+        "/",
+        response_model=read_schema,
+        name=f"Get {name}",
+    )
+    async def read_item(
+        parent_id: Annotated[str, Depends(parent)],
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.read, parent_id, db=db_session)
+
+    @router.put(
+        "/",
+        response_model=read_schema,
+        name=f"Update {name}",
+    )
+    async def update_item(
+        parent_id: Annotated[str, Depends(parent)],
+        item: update_schema,
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.update, parent_id, item, db=db_session)
+
+    @router.delete(
+        "/",
+        status_code=status.HTTP_204_NO_CONTENT,
+        name=f"Delete {name}",
+    )
+    async def delete_item(
+        parent_id: Annotated[str, Depends(parent)],
+        db_session: Annotated[Session, Depends(get_db)],
+    ):
+        return await run_controller(repository.delete, parent_id, db=db_session)
+
+    return router
@@ -0,0 +1,83 @@
+from typing import Annotated, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from medrekk.common.database.connection import get_db, run_controller
+from medrekk.common.database.settings import DB_ASYNC
+from medrekk.common.utils import routes
+from medrekk.common.utils.auth import (
+    get_account_id,
+    read_account_record_id,
+    verify_jwt_token,
+)
+from medrekk.mrs.controllers.export import (
+    VITALS,
+    Vital,
+    export_vitals,
+    export_vitals_async,
+)
+
+export_routes = APIRouter(
+    prefix=f"/{routes.EXPORTS}",
+    dependencies=[Depends(verify_jwt_token)],
+    tags=["Exports"],
+)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+@export_routes.get(
+    "/vitals",
+    name="Export patient vitals",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+            "description": "Vitals of every record of the account, streamed.",
+        },
+    },
+)
+async def get_vitals_export(
+    account_id: Annotated[str, Depends(get_account_id)],
+    db_session: Annotated[Session, Depends(get_db)],
+    format: Literal["ndjson", "csv"] = "ndjson",
+    vital: Annotated[
+        Optional[List[Vital]],
+        Query(description="Vitals to export. Defaults to all."),
+    ] = None,
+    record_id: Annotated[
+        Optional[str],
+        Query(description="Export this record only. Defaults to every record."),
+    ] = None,
+):
+    """
+    Streams the blood pressure, heart rate, respiratory rate and body
+    temperature rows of the account as NDJSON (one object per line) or CSV.
+    """
+    if record_id is not None and not await run_controller(
+        read_account_record_id, account_id, record_id, db=db_session
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "content": {
+                    "msg": f"Record with ID: {record_id} is not found.",
+                    "loc": "record_id",
+                },
+            },
+        )
+
+    export = export_vitals_async if DB_ASYNC else export_vitals
+    return StreamingResponse(
+        export(account_id, vital or list(VITALS), format, record_id),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="vitals.{format}"',
+        },
+    )
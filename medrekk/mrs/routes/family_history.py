@@ -1,80 +1,12 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from medrekk.common.database.connection import get_session
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import verify_jwt_token
-from medrekk.mrs.controllers.family_history import (
-    create_family_history,
-    delete_family_history,
-    read_family_history,
-    update_family_history,
-)
-from medrekk.mrs.schemas.patients import (
-    PatientFamilyHistoryCreate,
-    PatientFamilyHistoryRead,
-    PatientFamilyHistoryUpdate,
-)
+from medrekk.mrs.controllers.family_history import family_history_repository
+from medrekk.mrs.routes.crud import singleton_routes
+from medrekk.mrs.schemas.patients import PatientFamilyHistoryRead
 
-family_history_routes = APIRouter(
+family_history_routes = singleton_routes(
+    family_history_repository,
     prefix=f"/{routes.PATIENTS}" + "/{patient_id}" + f"/{routes.FAMILYHISTORY}",
-    dependencies=[Depends(verify_jwt_token)],
-    tags=["Patient Family History"],
-)
-
-
-@family_history_routes.post(
-    "/",
-    response_model=PatientFamilyHistoryRead,
-    status_code=status.HTTP_201_CREATED,
-)
-async def add_patient_family_history(
-    patient_id: str,
-    family_history: PatientFamilyHistoryCreate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    new_family_history = create_family_history(patient_id, family_history, db_session)
-
-    return new_family_history
-
-
-@family_history_routes.get(
-    "/",
-    response_model=PatientFamilyHistoryRead,
-)
-async def get_patient_family_history(
-    patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    family_history = read_family_history(patient_id, db_session)
-
-    return family_history
-
-
-@family_history_routes.put(
-    "/",
-    response_model=PatientFamilyHistoryRead,
-)
-async def update_patient_family_history(
-    patient_id: str,
-    family_history: PatientFamilyHistoryUpdate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    updated_family_history = update_family_history(
-        patient_id, family_history, db_session
-    )
-
-    return updated_family_history
-
-
-@family_history_routes.delete(
-    "/",
-    status_code=status.HTTP_204_NO_CONTENT,
+    tag="Patient Family History",
+    name="Patient Family History",
+    read_schema=PatientFamilyHistoryRead,
 )
-async def delete_patient_family_history(
-    patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    return delete_family_history(patient_id, db_session)
@@ -1,107 +1,16 @@
-from typing import Annotated, List
-
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from medrekk.common.database.connection import get_session
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import account_record_id_validate, verify_jwt_token
-from medrekk.mrs.controllers.heart_rate import (
-    create_patient_heartrate,
-    delete_patient_heartrate,
-    read_patient_heartrate,
-    read_patient_heartrates,
-    update_patient_heartrate,
-)
-from medrekk.mrs.schemas.patients import (
-    PatientHeartRateCreate,
-    PatientHeartRateRead,
-    PatientHeartRateUpdate,
-)
+from medrekk.common.utils.auth import account_record_id_validate
+from medrekk.mrs.controllers.heart_rate import heartrate_repository
+from medrekk.mrs.routes.crud import crud_routes
+from medrekk.mrs.schemas.patients import PatientHeartRateRead
 
-heartrate_routes = APIRouter(
+heartrate_routes = crud_routes(
+    heartrate_repository,
     prefix=f"/{routes.RECORDS}" + "/{record_id}" + f"/{routes.HEARTRATES}",
-    dependencies=[Depends(verify_jwt_token)],
-    tags=["Patient Heart Rate"],
-)
-
-# START: Heart Rate
-
-
-@heartrate_routes.post(
-    "/",
-    response_model=PatientHeartRateRead,
-    status_code=status.HTTP_201_CREATED,
-    name="Add Patient Heart Rate",
-)
-async def add_patient_heartrate(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    heartrate: PatientHeartRateCreate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    new_heartrate = create_patient_heartrate(record_id, heartrate, db_session)
-
-    return PatientHeartRateRead.model_validate(new_heartrate)
-
-
-@heartrate_routes.get(
-    "/",
-    response_model=List[PatientHeartRateRead],
-    name="Get Patient Heart Rates",
-)
-async def get_patient_heartrates(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    patient_heartrates = read_patient_heartrates(record_id, db_session)
-
-    return [
-        PatientHeartRateRead.model_validate(heartrate)
-        for heartrate in patient_heartrates
-    ]
-
-
-@heartrate_routes.get(
-    "/{heartrate_id}/",
-    response_model=PatientHeartRateRead,
-    name="Get Patient Heart Rate",
-)
-async def get_patient_heartrate(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    heartrate_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    patient_heartrate = read_patient_heartrate(record_id, heartrate_id, db_session)
-
-    return PatientHeartRateRead.model_validate(patient_heartrate)
-
-
-@heartrate_routes.put(
-    "/{heartrate_id}/",
-    response_model=PatientHeartRateRead,
-    name="Update Patient Heart Rate",
-)
-async def put_patient_heartrate(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    heartrate_id: str,
-    heartrate: PatientHeartRateUpdate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    updated_heartrate = update_patient_heartrate(
-        record_id, heartrate_id, heartrate, db_session
-    )
-
-    return PatientHeartRateRead.model_validate(updated_heartrate)
-
-
-@heartrate_routes.delete(
-    "/{heartrate_id}/",
-    status_code=status.HTTP_204_NO_CONTENT,
-    name="Delete Patient Heart Rate",
+    tag="Patient Heart Rate",
+    name="Patient Heart Rate",
+    name_plural="Patient Heart Rates",
+    read_schema=PatientHeartRateRead,
+    parent=account_record_id_validate,
+    batch=True,
 )
-async def delete_heartrate(
-    record_id: Annotated[str, Depends(account_record_id_validate)],
-    heartrate_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    return delete_patient_heartrate(record_id, heartrate_id, db_session)
@@ -1,91 +1,13 @@
-from typing import Annotated, List
-
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-
-from medrekk.mrs.controllers.medication import (
-    create_medication,
-    delete_medication,
-    read_medication,
-    read_medications,
-    update_medication,
-)
-from medrekk.common.database.connection import get_session
-from medrekk.mrs.schemas.patients import (
-    PatientMedicationCreate,
-    PatientMedicationRead,
-    PatientMedicationUpdate,
-)
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import verify_jwt_token
+from medrekk.mrs.controllers.medication import medication_repository
+from medrekk.mrs.routes.crud import crud_routes
+from medrekk.mrs.schemas.patients import PatientMedicationRead
 
-medication_routes = APIRouter(
+medication_routes = crud_routes(
+    medication_repository,
     prefix=f"/{routes.PATIENTS}" + "/{patient_id}" + f"/{routes.MEDICATIONS}",
-    dependencies=[Depends(verify_jwt_token)],
-    tags=["Patient Medication"],
-)
-
-
-@medication_routes.post(
-    "/",
-    response_model=PatientMedicationRead,
-    status_code=status.HTTP_201_CREATED,
-)
-async def add_patient_medication(
-    patient_id: str,
-    medication: PatientMedicationCreate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    new_medication = create_medication(patient_id, medication, db_session)
-
-    return new_medication
-
-@medication_routes.get(
-    "/",
-    response_model=List[PatientMedicationRead],
-)
-async def get_patient_medications(
-    patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)]
-):
-    medications = read_medications(patient_id, db_session)
-
-    return medications
-
-@medication_routes.get(
-    "/{medication_id}",
-    response_model=PatientMedicationRead,
-)
-async def get_patient_medication(
-    patient_id: str,
-    medication_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    medication = read_medication(patient_id, medication_id, db_session)
-
-    return medication
-
-@medication_routes.put(
-    "/{medication_id}",
-    response_model=PatientMedicationRead,
-)
-async def update_patient_medication(
-    patient_id: str,
-    medication_id: str,
-    medication: PatientMedicationUpdate,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    updated_medication = update_medication(patient_id, medication_id, medication, db_session)
-
-    return updated_medication
-
-@medication_routes.delete(
-    "/{medication_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    tag="Patient Medication",
+    name="Patient Medication",
+    name_plural="Patient Medications",
+    read_schema=PatientMedicationRead,
 )
-async def delete_patient_medication(
-    patient_id: str,
-    medication_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
-):
-    return delete_medication(patient_id, medication_id, db_session)
\ No newline at end of file
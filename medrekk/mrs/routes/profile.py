@@ -1,12 +1,31 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from medrekk.common.database.connection import get_session
-from medrekk.common.utils.auth import verify_jwt_token
-from medrekk.mrs.controllers.profile import create_patient, read_patient, read_patients
-from medrekk.mrs.schemas.patients import PatientProfileCreate, PatientProfileRead
+from medrekk.common.database.connection import get_db, run_controller
+from medrekk.common.utils.auth import get_account_id, verify_jwt_token
+from medrekk.common.utils.pagination import PageParams, page_params
+from medrekk.mrs.controllers.profile import (
+    MAX_SEARCH_LIMIT,
+    SEARCH_LIMIT,
+    create_patient,
+    read_patient,
+    read_patients,
+    search_patients,
+)
+from medrekk.mrs.controllers.summary import (
+    MAX_SUMMARY_LIMIT,
+    SUMMARY_LIMIT,
+    Section,
+    read_patient_summary,
+)
+from medrekk.mrs.schemas.patients import (
+    PatientProfileCreate,
+    PatientProfileRead,
+    PatientSummary,
+)
+from medrekk.schemas.responses import Page
 
 patient_routes = APIRouter(
     prefix="/patients", dependencies=[Depends(verify_jwt_token)], tags=["Patients"]
@@ -21,26 +40,51 @@ patient_routes = APIRouter(
     responses={},
 )
 async def add_patient(
+    account_id: Annotated[str, Depends(get_account_id)],
     patient: PatientProfileCreate,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    new_patient = create_patient(patient, db_session)
+    new_patient = await run_controller(
+        create_patient, account_id, patient, db=db_session
+    )
 
     return PatientProfileRead.model_validate(new_patient)
 
 
 @patient_routes.get(
     "/",
-    response_model=List[PatientProfileRead],
+    response_model=Page[PatientProfileRead],
     name="Patient profiles list",
     responses={},
 )
 async def list_patients(
-    db_session: Annotated[Session, Depends(get_session)],
+    account_id: Annotated[str, Depends(get_account_id)],
+    page: Annotated[PageParams, Depends(page_params)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    patients = read_patients(db_session)
+    """
+    Patients of the caller's account, newest first.
+    """
+    return await run_controller(read_patients, account_id, page, db=db_session)
+
 
-    return [PatientProfileRead.model_validate(patient) for patient in patients]
+# Declared before "/{patient_id}", which would otherwise match "search".
+@patient_routes.get(
+    "/search",
+    response_model=list[PatientProfileRead],
+    name="Search patients by name",
+)
+async def find_patients(
+    account_id: Annotated[str, Depends(get_account_id)],
+    db_session: Annotated[Session, Depends(get_db)],
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=MAX_SEARCH_LIMIT)] = SEARCH_LIMIT,
+):
+    """
+    Patients of the caller's account matching a partial name, best match
+    first. Case and accents are ignored and small typos are tolerated.
+    """
+    return await run_controller(search_patients, account_id, q, limit, db=db_session)
 
 
 @patient_routes.get(
@@ -49,13 +93,49 @@ async def list_patients(
 )
 async def get_patient(
     patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
+    account_id: Annotated[str, Depends(get_account_id)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    patient = read_patient(patient_id, db_session)
+    patient = await run_controller(read_patient, account_id, patient_id, db=db_session)
 
     return PatientProfileRead.model_validate(patient)
 
 
+@patient_routes.get(
+    "/{patient_id}/summary",
+    response_model=PatientSummary,
+    name="Patient chart summary",
+)
+async def get_patient_summary(
+    patient_id: str,
+    account_id: Annotated[str, Depends(get_account_id)],
+    db_session: Annotated[Session, Depends(get_db)],
+    include: Annotated[
+        Optional[List[Section]],
+        Query(description="Sections to return. Defaults to all."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=MAX_SUMMARY_LIMIT,
+            description="Latest entries per time series.",
+        ),
+    ] = SUMMARY_LIMIT,
+):
+    """
+    The profile and chart sections of a patient in one request and one query.
+    """
+    return await run_controller(
+        read_patient_summary,
+        account_id,
+        patient_id,
+        include,
+        limit,
+        db=db_session,
+    )
+
+
 # @patient_routes.put(
 #     "/{patient_id}",
 #     name="Update patient profile",
@@ -63,7 +143,7 @@ async def get_patient(
 # )
 async def put_patient(
     patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
     pass
 
@@ -75,6 +155,6 @@ async def put_patient(
 # )
 async def delete_patient(
     patient_id: str,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
     pass
@@ -1,11 +1,17 @@
-from typing import Annotated, List
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
-from medrekk.common.database.connection import get_session
+from medrekk.common.database.connection import get_db, run_controller
 from medrekk.common.utils import routes
-from medrekk.common.utils.auth import get_account_id, verify_jwt_token
+from medrekk.common.utils.auth import (
+    account_patient_id_validate,
+    announce_ownership_change,
+    get_account_id,
+    verify_jwt_token,
+)
+from medrekk.common.utils.pagination import PageParams, page_params
 from medrekk.mrs.controllers.record import (
     create_record,
     delete_record,
@@ -18,10 +24,12 @@ from medrekk.mrs.schemas.patients import (
     PatientRecordRead,
     PatientRecordUpdate,
 )
+from medrekk.schemas.responses import Page
 
 record_routes = APIRouter(
     prefix=f"/{routes.PATIENTS}" + "/{patient_id}" + f"/{routes.RECORDS}",
-    dependencies=[Depends(verify_jwt_token)],
+    # Records of another account's patient can be neither read nor added.
+    dependencies=[Depends(verify_jwt_token), Depends(account_patient_id_validate)],
     tags=["Patient Records"],
 )
 
@@ -36,26 +44,39 @@ async def add_record(
     patient_id: str,
     account_id: Annotated[str, Depends(get_account_id)],
     record: PatientRecordCreate,
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    new_record = create_record(account_id, patient_id, record, db_session)
+    new_record = await run_controller(
+        create_record,
+        account_id,
+        patient_id,
+        record,
+        db=db_session,
+    )
+    # Drops a negative entry left on any worker by a request that raced it.
+    await announce_ownership_change(account_id, new_record.id)
 
     return new_record
 
 
 @record_routes.get(
     "/",
-    response_model=List[PatientRecordRead | None],
+    response_model=Page[PatientRecordRead],
     name="Get Patient Records",
 )
 async def get_records(
     patient_id: str,
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    page: Annotated[PageParams, Depends(page_params)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    records = read_records(account_id, patient_id, db_session)
-
-    return [PatientRecordRead.model_validate(record) for record in records]
+    return await run_controller(
+        read_records,
+        account_id,
+        patient_id,
+        page,
+        db=db_session,
+    )
 
 
 @record_routes.get(
@@ -67,9 +88,15 @@ async def get_record(
     patient_id: str,
     record_id: str,
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    record = read_record(account_id, patient_id, record_id, db_session)
+    record = await run_controller(
+        read_record,
+        account_id,
+        patient_id,
+        record_id,
+        db=db_session,
+    )
 
     return PatientRecordRead.model_validate(record)
 
@@ -84,10 +111,15 @@ async def put_record(
     record_id: str,
     record: PatientRecordUpdate,
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    updated_record = update_record(
-        account_id, patient_id, record_id, record, db_session
+    updated_record = await run_controller(
+        update_record,
+        account_id,
+        patient_id,
+        record_id,
+        record,
+        db=db_session,
     )
 
     return PatientRecordRead.model_validate(updated_record)
@@ -101,6 +133,13 @@ async def put_record(
     patient_id: str,
     record_id: str,
     account_id: Annotated[str, Depends(get_account_id)],
-    db_session: Annotated[Session, Depends(get_session)],
+    db_session: Annotated[Session, Depends(get_db)],
 ):
-    return delete_record(account_id, patient_id, record_id, db_session)
+    await run_controller(
+        delete_record,
+        account_id,
+        patient_id,
+        record_id,
+        db=db_session,
+    )
+    await announce_ownership_change(account_id, record_id)
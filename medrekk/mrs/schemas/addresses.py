@@ -0,0 +1,11 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+AddressLevel = Literal["region", "province", "municipality", "barangay"]
+
+
+class AddressArea(BaseModel):
+    code: str
+    name: str
+    level: AddressLevel
@@ -7,8 +7,8 @@ from sqlalchemy import String
 
 class PatientBase(BaseModel):
     id: str
-    created: datetime = datetime.now()
-    updated: datetime = datetime.now()
+    created: datetime = Field(default_factory=datetime.now)
+    updated: datetime = Field(default_factory=datetime.now)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -37,12 +37,16 @@ class PatientProfileCreate(BaseModel):
 
 
 class PatientProfileRead(PatientProfileCreate, PatientBase):
+    address_region_code: Optional[str] = None
+    address_province_code: Optional[str] = None
+    address_city_code: Optional[str] = None
+    address_barangay_code: Optional[str] = None
     url: str = ""
     pass
 
 
 class PatientProfileUpdate(PatientProfileCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientProfileDelete(BaseModel):
@@ -60,7 +64,7 @@ class PatientBloodPressureRead(PatientBloodPressureCreate, PatientBase):
 
 
 class PatientBloodPressureUpdate(PatientBloodPressureCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientBloodPressureDelete(BaseModel):
@@ -77,7 +81,7 @@ class PatientHeartRateRead(PatientHeartRateCreate, PatientBase):
 
 
 class PatientHeartRateUpdate(PatientHeartRateCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientHeartRateDelete(BaseModel):
@@ -94,7 +98,7 @@ class PatientRespiratoryRateRead(PatientRespiratoryRateCreate, PatientBase):
 
 
 class PatientRespiratoryRateUpdate(PatientRespiratoryRateCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientRespiratoryRateDelete(BaseModel):
@@ -111,7 +115,7 @@ class PatientBodyTemperatureRead(PatientBodyTemperatureCreate, PatientBase):
 
 
 class PatientBodyTemperatureUpdate(PatientBodyTemperatureCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientBodyTemperatureDelete(BaseModel):
@@ -128,7 +132,7 @@ class PatientBodyWeightRead(PatientBodyWeightCreate, PatientBase):
 
 
 class PatientBodyWeightUpdate(PatientBodyWeightCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientBodyWeightDelete(BaseModel):
@@ -145,7 +149,7 @@ class PatientHeightRead(PatientHeightCreate, PatientBase):
 
 
 class PatientHeightUpdate(PatientHeightCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientHeightDelete(BaseModel):
@@ -162,7 +166,7 @@ class PatientBodyMassIndexRead(PatientBodyMassIndexCreate, PatientBase):
 
 
 class PatientBodyMassIndexUpdate(PatientBodyMassIndexCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientBodyMassIndexDelete(BaseModel):
@@ -183,7 +187,7 @@ class PatientFamilyHistoryRead(PatientFamilyHistoryCreate, PatientBase):
 
 
 class PatientFamilyHistoryUpdate(PatientFamilyHistoryCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientFamilyHistoryDelete(BaseModel):
@@ -204,7 +208,7 @@ class PatientHospitalizationHistoryRead(
 
 
 class PatientHospitalizationHistoryUpdate(PatientHospitalizationHistoryCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientHospitalizationHistoryDelete(BaseModel):
@@ -225,7 +229,7 @@ class PatientMedicalHistoryRead(PatientMedicalHistoryCreate, PatientBase):
 
 
 class PatientMedicalHistoryUpdate(PatientMedicalHistoryCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientMedicalHistoryDelete(BaseModel):
@@ -244,7 +248,7 @@ class PatientMedicationRead(PatientMedicationCreate, PatientBase):
 
 
 class PatientMedicationUpdate(PatientMedicationCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientMedicationDelete(BaseModel):
@@ -267,7 +271,7 @@ class PatientOBHistoryRead(PatientOBHistoryCreate, PatientBase):
 
 
 class PatientOBHistoryUpdate(PatientOBHistoryCreate):
-    updated: datetime = datetime.now()
+    updated: datetime = Field(default_factory=datetime.now)
 
 
 class PatientOBHistoryDelete(BaseModel):
@@ -358,4 +362,25 @@ class PatientRecordRead(PatientRecordCreate, PatientBase):
     patient_id: str
 
 class PatientRecordUpdate(PatientRecordCreate):
-    pass
\ No newline at end of file
+    pass
+
+
+class PatientSummary(BaseModel):
+    """
+    A patient's chart. Sections left out by `include` are null; the time series
+    (body_weights, heights, bmi, records) hold the latest `limit` entries.
+    """
+
+    profile: PatientProfileRead
+    family_history: Optional[PatientFamilyHistoryRead] = None
+    medical_history: Optional[PatientMedicalHistoryRead] = None
+    ob_history: Optional[PatientOBHistoryRead] = None
+    hospitalizations: Optional[List[PatientHospitalizationHistoryRead]] = None
+    surgical_history: Optional[List[PatientSurgicalHistoryRead]] = None
+    medications: Optional[List[PatientMedicationRead]] = None
+    allergies: Optional[List[PatientAllergyRead]] = None
+    immunizations: Optional[List[PatientImmunizationRead]] = None
+    body_weights: Optional[List[PatientBodyWeightRead]] = None
+    heights: Optional[List[PatientHeightRead]] = None
+    bmi: Optional[List[PatientBodyMassIndexRead]] = None
+    records: Optional[List[PatientRecordRead]] = None
@@ -1,5 +1,10 @@
+from datetime import datetime
+from typing import Dict, Generic, List, Optional, TypeVar
+
 from pydantic import BaseModel
 
+T = TypeVar("T")
+
 
 class RESPONSE_CONTENT(BaseModel):
     msg: str
@@ -9,3 +14,48 @@ class RESPONSE_CONTENT(BaseModel):
 class HTTP_EXCEPTION(BaseModel):
     status_code: int
     content: RESPONSE_CONTENT
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    One page of a list endpoint. Pass `next_cursor` as `cursor` to get the
+    next page; it is null on the last page.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class BATCH_CONFLICT(RESPONSE_CONTENT):
+    index: int
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """
+    Result of a batch create. `conflicts` refers to the request items by
+    their position in the submitted array.
+    """
+
+    created: List[T]
+    conflicts: List[BATCH_CONFLICT]
+
+
+class Aggregate(BaseModel):
+    """
+    Of the readings that have the value: None when none of them do.
+    """
+
+    min: Optional[float]
+    max: Optional[float]
+    avg: Optional[float]
+
+
+class TrendBucket(BaseModel):
+    """
+    Readings measured in `[start, start + bucket)`, aggregated per value,
+    e.g. `{"systolic": {...}, "diastolic": {...}}`.
+    """
+
+    start: datetime
+    count: int
+    values: Dict[str, Aggregate]
@@ -6,13 +6,16 @@ from fastapi.testclient import TestClient
 from medrekk.common.utils.shortid import shortid
 from medrekk.main import medrekk_app
 
-client = TestClient(app=medrekk_app, base_url="http://medrekk.com:8000")
-
 def clientmaker(app: FastAPI, base_url: str):
     return TestClient(app=app, base_url=base_url)
 
 
-client_admin = clientmaker(app=medrekk_app, base_url="http://medrekk.com:8000")
+client = clientmaker(app=medrekk_app, base_url="http://medrekk.com:8000")
+# Run the lifespan once for the whole session. The async token store must be
+# used from the event loop it was opened on, so the tests share one client.
+client.__enter__()
+
+client_admin = client
 
 
 def login(username: str, password: str, client: TestClient) -> dict | None:
@@ -94,7 +97,24 @@ test_account = TestAccount(
     root_path=medrekk_app.root_path,
 )
 
+
+def new_account() -> TestAccount:
+    """
+    A new account, logged in. For checks that one account can't reach the
+    rows of another.
+    """
+    account = TestAccount(
+        client=client,
+        account_name=shortid(),
+        root_path=medrekk_app.root_path,
+    )
+    client.post(account.root_path + "/accounts", json=account.data)
+    account.login()
+    return account
+
+
 __all__ = [
     "test_account",
     "test_new_account",
+    "new_account",
 ]
@@ -24,3 +24,16 @@ def test_logout():
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == None
+
+
+def test_metrics_require_token():
+    response = client.get(url="/metrics/db")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    token = login(username=username, password=password, client=client_admin)[
+        "access_token"
+    ]
+    response = client.get(
+        url="/metrics/db", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+
+from fastapi import status
+
+from medrekk.common.utils import routes
+from medrekk.tests.main import client, new_account, test_account
+
+
+def add_record(account) -> str:
+    headers = {"Authorization": f"Bearer {account.token}"}
+    patients = account.root_path + f"/{routes.PATIENTS}"
+    patient_id = client.post(
+        url=patients,
+        headers=headers,
+        json={
+            "lastname": "garcia",
+            "firstname": "ana",
+            "birthdate": "1985-01-01",
+            "gender": "female",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    ).json()["id"]
+    return client.post(
+        url=f"{patients}/{patient_id}/{routes.RECORDS}",
+        headers=headers,
+        json={"chief_complaint": ["checkup"]},
+    ).json()["id"]
+
+
+def test_export_vitals():
+    test_account.login()
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+    record_id = add_record(test_account)
+    url = test_account.root_path + f"/{routes.RECORDS}/{record_id}/{routes.HEARTRATES}"
+    # Posted out of order.
+    for dt_measured, heart_rate in [
+        ("2024-05-01T10:00:00", 80),
+        ("2024-05-01T08:00:00", 70),
+        ("2024-05-01T09:00:00", 75),
+    ]:
+        client.post(
+            url=f"{url}/",
+            headers=headers,
+            json={"dt_measured": dt_measured, "heart_rate": heart_rate},
+        )
+    export = test_account.root_path + f"/{routes.EXPORTS}/vitals"
+    params = {"vital": "heartrate", "record_id": record_id}
+
+    response = client.get(url=export, headers=headers, params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["heart_rate"] for row in rows] == [70, 75, 80]
+    assert rows[0]["vital"] == "heartrate"
+    assert rows[0]["record_id"] == record_id
+    assert rows[0]["dt_measured"] == "2024-05-01T08:00:00"
+
+    response = client.get(
+        url=export, headers=headers, params={**params, "format": "csv"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["heart_rate"] for row in rows] == ["70", "75", "80"]
+    assert rows[0]["systolic"] == ""
+
+
+def test_export_is_account_scoped():
+    test_account.login()
+    record_id = add_record(test_account)
+    other = new_account()
+    headers = {"Authorization": f"Bearer {other.token}"}
+    export = other.root_path + f"/{routes.EXPORTS}/vitals"
+
+    response = client.get(url=export, headers=headers, params={"record_id": record_id})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.get(url=export, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert record_id not in response.text
@@ -0,0 +1,138 @@
+from fastapi import status
+
+from medrekk.common.utils import routes
+import pytest
+
+from medrekk.common.utils.gazetteer import (
+    Gazetteer,
+    assign_codes,
+    build,
+    gazetteer,
+    read_codes,
+)
+from medrekk.tests.main import client, test_account
+
+
+def test_index_round_trip():
+    index = Gazetteer(build())
+    region = index.children()[0]
+    province = index.children(region.code)[0]
+    municipality = index.children(province.code)[0]
+    barangay = index.children(municipality.code)[0]
+
+    assert [area.level for area in (region, province, municipality, barangay)] == [
+        "region",
+        "province",
+        "municipality",
+        "barangay",
+    ]
+    assert index.get(barangay.code) == barangay
+    assert index.parent(barangay.code) == municipality
+    assert index.parent(region.code) is None
+    assert index.get("999999999") is None
+    assert index.children("not-a-code") is None
+
+
+def test_codes_are_append_only():
+    codes = read_codes()
+    assert assign_codes(dict(codes)) == []
+
+    # An area added to PH_ADDRESS takes the next ordinal among its siblings;
+    # no other code moves.
+    path = ("NCR", "NATIONAL CAPITAL REGION - MANILA", "BINONDO", "BARANGAY 287")
+    code = codes.pop(path)
+    siblings = [c for p, c in codes.items() if p[:-1] == path[:-1]]
+    [(added_path, added_code)] = assign_codes(codes)
+
+    assert added_path == path
+    assert added_code == max(siblings) + 1
+    assert added_code != code
+
+    with pytest.raises(ValueError):
+        build({})
+
+
+def test_resolve_manila():
+    # PH_ADDRESS has Manila as a province, and its districts as municipalities.
+    region, province, city, barangay = gazetteer().resolve(
+        "Metro Manila", "City of Manila", "Barangay 287"
+    )
+
+    assert province.name == "NATIONAL CAPITAL REGION - MANILA"
+    assert city.name == "BINONDO"
+    assert barangay.name == "BARANGAY 287"
+    assert len(gazetteer().resolve("Manila", "Manila", "Barangay 1")) == 4
+
+
+def test_search_prefix():
+    areas = gazetteer().search("city of las pinas", level="municipality")
+
+    assert [area.name for area in areas] == ["CITY OF LAS PIÑAS"]
+    municipality = areas[0]
+
+    # Aliases match as prefixes too, as they do in resolve().
+    areas = gazetteer().search("las p", level="municipality")
+    assert municipality in areas
+
+    barangays = gazetteer().search("a", level="barangay", parent=municipality.code)
+    assert barangays
+    assert all(gazetteer().parent(area.code) == municipality for area in barangays)
+
+
+def test_address_routes():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.ADDRESSES}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+
+    regions = client.get(url=f"{url}/regions", headers=headers).json()
+    assert len(regions) == 17
+
+    response = client.get(url=f"{url}/{regions[0]['code']}/children", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert all(area["level"] == "province" for area in response.json())
+
+    response = client.get(url=f"{url}/000000001", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_patient_address_normalized():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.PATIENTS}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+    patient = {
+        "lastname": "santos",
+        "firstname": "maria",
+        "birthdate": "1990-01-01",
+        "gender": "female",
+        "address_province": "metro manila",
+        "address_city": "Las Pinas",
+        "address_barangay": "almanza uno",
+        "address_line1": "string",
+    }
+
+    response = client.post(url=url, headers=headers, json=patient)
+    body = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert body["address_city"] == "CITY OF LAS PIÑAS"
+    assert body["address_barangay_code"].startswith(body["address_city_code"][:6])
+
+    response = client.post(
+        url=url,
+        headers=headers,
+        json={
+            **patient,
+            "address_city": "Manila",
+            "address_barangay": "Barangay 287",
+        },
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["address_city"] == "BINONDO"
+
+    response = client.post(
+        url=url, headers=headers, json={**patient, "address_barangay": "nowhere"}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"]["content"]["loc"] == "address_barangay"
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from medrekk.common.utils.hashing import PasswordHasher
+
+
+def test_hasher_counts():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+
+    async def run():
+        hashed = await hasher.hash("aaaa")
+        assert await hasher.verify(hashed, "aaaa")
+        with pytest.raises(ValueError):
+            await hasher.verify("not a bcrypt hash", "aaaa")
+
+        hasher.pending = hasher.max_pending
+        with pytest.raises(HTTPException):
+            await hasher.hash("aaaa")
+        hasher.pending = 0
+
+    try:
+        asyncio.run(run())
+    finally:
+        hasher.shutdown()
+
+    metrics = hasher.metrics()
+    assert metrics["completed"] == 2
+    assert metrics["failed"] == 1
+    assert metrics["rejected"] == 1
+    assert metrics["pending"] == 0
@@ -0,0 +1,209 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from alembic.script import ScriptDirectory
+from fastapi import HTTPException
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    event,
+    text,
+)
+
+from medrekk.tests.main import client  # noqa: F401  (imports the app first)
+from medrekk.common.controllers.repository import SingletonRepository
+from medrekk.common.database.connection import Base, SessionLocal
+from medrekk.common.database.index_audit import (
+    _Key,
+    _serves,
+    audit,
+    repositories,
+    unserved_access_paths,
+)
+from medrekk.common.database.migrate import alembic_config
+from medrekk.common.utils.pagination import PageParams, encode_cursor
+
+
+def test_audit_findings():
+    metadata = MetaData()
+    Table("parent", metadata, Column("id", String, primary_key=True))
+    Table(
+        "child",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("parent_id", ForeignKey("parent.id")),
+        Column("code", String),
+        Index("idx_child_code", "code"),
+        Index("idx_child_code_parent", "code", "parent_id"),
+    )
+
+    findings = audit(metadata)
+
+    assert [finding.operation for finding in findings] == [
+        "create_index_concurrently('idx_child_parent_id', 'child', ['parent_id'])",
+        "drop_index_concurrently('idx_child_code', 'child')",
+    ]
+    findings = {(f.kind, f.name): f.statement for f in findings}
+
+    assert findings == {
+        ("foreign_key", "idx_child_parent_id"): (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_child_parent_id "
+            "ON child (parent_id);"
+        ),
+        ("redundant", "idx_child_code"): (
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_child_code;"
+        ),
+    }
+
+
+def test_unique_key_serves_access_path():
+    metadata = MetaData()
+    table = Table(
+        "reading",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("record_id", String),
+        Column("dt_measured", DateTime),
+        UniqueConstraint("record_id", "dt_measured"),
+        Index("brin_reading_dt", "dt_measured", postgresql_using="brin"),
+    )
+
+    def repository(*index_key):
+        return SimpleNamespace(
+            model=SimpleNamespace(__table__=table), index_key=index_key
+        )
+
+    # Unique on (record_id, dt_measured): ties on id can't happen.
+    assert unserved_access_paths([repository("record_id", "dt_measured", "id")]) == []
+    # A BRIN index serves no keyset order.
+    findings = unserved_access_paths([repository("dt_measured", "id")])
+    assert [finding.name for finding in findings] == ["idx_reading_dt_measured_id"]
+
+
+def test_models_are_indexed():
+    assert audit(Base.metadata, repositories()) == []
+
+
+def plan_nodes(plan: dict):
+    yield plan["Node Type"]
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def statements(db, controller, *args) -> list:
+    """
+    The statements, with their parameters, that `controller(*args, db)` runs.
+    """
+    executed = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        controller(*args, db)
+    except HTTPException:
+        pass
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+    return executed
+
+
+def create_brin_indexes(db) -> None:
+    """
+    Creates, in the transaction of `db`, the indexes that
+    `alembic -x vitals_index=brin upgrade` adds (migration 0004).
+    """
+    script = ScriptDirectory.from_config(alembic_config())
+    migration = script.get_revision("0004").module
+    storage = ", ".join(
+        f"{key} = {value}" for key, value in migration.BRIN_WITH.items()
+    )
+    for table, short in migration.VITALS.items():
+        db.execute(
+            text(
+                f"CREATE INDEX {migration.brin_index(short)} ON {table} "
+                f"USING brin ({', '.join(migration.BRIN_COLUMNS)}) WITH ({storage})"
+            )
+        )
+
+
+def plan_indexes(plan: dict):
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from plan_indexes(child)
+
+
+def catalog_key(db, name: str) -> _Key:
+    """
+    Columns, in order, and uniqueness of the index `name`, from the catalog.
+    Partitions' indexes are named by Postgres, not by the models.
+    """
+    columns, unique = db.execute(
+        text(
+            "SELECT array_agg(a.attname ORDER BY k.n), i.indisunique "
+            "FROM pg_index i "
+            "CROSS JOIN unnest(i.indkey::int2[]) WITH ORDINALITY k(attnum, n) "
+            "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum "
+            "WHERE i.indexrelid = to_regclass(:name) "
+            "GROUP BY i.indisunique"
+        ),
+        {"name": name},
+    ).one()
+    return _Key(name, tuple(columns), unique)
+
+
+@pytest.mark.parametrize("vitals_index", ["btree", "brin"])
+def test_list_query_plans(vitals_index):
+    """
+    Every repository's list query, as the controller runs it, is read
+    through an index that serves its `index_key`, in keyset order: no sort
+    of the parent's rows. On the first page and past a cursor, with either
+    option of migration 0004.
+    """
+    cursor = encode_cursor(datetime(2024, 1, 1), "0")
+    with SessionLocal() as db:
+        # Near-empty test tables are cheapest to scan whole, or through a
+        # bitmap of whatever index matches the parent, then sorted. Leave
+        # the planner plain index scans only: an index that serves the
+        # order needs no Sort on top, any other one does.
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        db.execute(text("SET LOCAL enable_bitmapscan = off"))
+        if vitals_index == "brin":
+            create_brin_indexes(db)
+        for repository in repositories():
+            if isinstance(repository, SingletonRepository):
+                calls = [(repository.read, "0")]
+            else:
+                calls = [
+                    (repository.read_all, "0", PageParams()),
+                    (repository.read_all, "0", PageParams(cursor=cursor)),
+                ]
+            for controller, *args in calls:
+                for statement, parameters in statements(db, controller, *args):
+                    plan = (
+                        db.connection()
+                        .exec_driver_sql(
+                            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                        )
+                        .scalar()
+                    )
+                    nodes = list(plan_nodes(plan[0]["Plan"]))
+                    indexes = list(plan_indexes(plan[0]["Plan"]))
+                    table = repository.model.__tablename__
+
+                    assert "Sort" not in nodes, (table, nodes)
+                    assert indexes, (table, nodes)
+                    for name in indexes:
+                        key = catalog_key(db, name)
+                        assert _serves(key, repository.index_key), (table, key)
+        db.rollback()
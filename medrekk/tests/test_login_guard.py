@@ -0,0 +1,71 @@
+import asyncio
+
+import fakeredis
+import pytest
+from fastapi import HTTPException, status
+
+from medrekk.admin.db import login
+from medrekk.admin.db.login import LoginGuard
+from medrekk.admin.db.token import TokenStorage
+
+
+async def make_guard() -> LoginGuard:
+    store = TokenStorage()
+    await store.open(fakeredis.FakeAsyncRedis(decode_responses=True))
+    return LoginGuard(store)
+
+
+def test_username_bucket_runs_out(monkeypatch):
+    monkeypatch.setattr(login, "LOGIN_USER_BURST", 3)
+    monkeypatch.setattr(login, "LOGIN_USER_PER_MINUTE", 1)
+
+    async def scenario():
+        guard = await make_guard()
+        for _ in range(3):
+            await guard.take("a@a.com", "10.0.0.1")
+
+        # Same username from another IP is still limited.
+        with pytest.raises(HTTPException) as e:
+            await guard.take("A@a.com", "10.0.0.2")
+        assert e.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(e.value.headers["Retry-After"]) >= 1
+
+        # Another username from the first IP is not.
+        await guard.take("b@a.com", "10.0.0.1")
+
+    asyncio.run(scenario())
+
+
+def test_ip_bucket_runs_out(monkeypatch):
+    monkeypatch.setattr(login, "LOGIN_IP_BURST", 2)
+    monkeypatch.setattr(login, "LOGIN_IP_PER_MINUTE", 1)
+
+    async def scenario():
+        guard = await make_guard()
+        await guard.take("a@a.com", "10.0.0.1")
+        await guard.take("b@a.com", "10.0.0.1")
+
+        with pytest.raises(HTTPException):
+            await guard.take("c@a.com", "10.0.0.1")
+
+        # The rejected attempt did not use up c@a.com's own bucket.
+        bucket = await guard.store.db.hgetall("medrekk:login:bucket:user:c@a.com")
+        assert bucket == {}
+
+    asyncio.run(scenario())
+
+
+def test_unknown_usernames_are_remembered_until_created():
+    async def scenario():
+        guard = await make_guard()
+        assert not await guard.is_unknown("x@a.com")
+
+        await guard.remember_unknown("X@a.com")
+        assert await guard.is_unknown("X@a.com")
+        # Usernames are case-sensitive: another spelling may be a real user.
+        assert not await guard.is_unknown("x@a.com")
+
+        await guard.forget_unknown("X@a.com")
+        assert not await guard.is_unknown("X@a.com")
+
+    asyncio.run(scenario())
@@ -0,0 +1,25 @@
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from medrekk.tests.main import client  # noqa: F401  (imports the app first)
+from medrekk.common.database.connection import Base, engine
+from medrekk.common.database.migrate import alembic_config, include_name, upgrade
+
+
+def test_single_head():
+    assert len(ScriptDirectory.from_config(alembic_config()).get_heads()) == 1
+
+
+def test_migrations_match_models():
+    """
+    The schema the migrations build is the one the models describe, i.e.
+    every model change shipped with its revision.
+    """
+    # A fresh test database: nothing to lock out of 0005.
+    upgrade(x=["rebuild_id_indexes=yes"])
+    with engine.connect() as connection:
+        context = MigrationContext.configure(
+            connection, opts={"include_name": include_name}
+        )
+        assert compare_metadata(context, Base.metadata) == []
@@ -0,0 +1,107 @@
+from fastapi import status
+
+from medrekk.common.utils import routes, shortid
+from medrekk.tests.main import client, new_account, test_account
+
+
+def test_users_keyset_pagination():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.MEMBERS}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+
+    for _ in range(3):
+        client.post(
+            url=url,
+            headers=headers,
+            json={"username": f"{shortid()}@a.com", "password": "aaaa"},
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url=url, headers=headers, params=params)
+        body = response.json()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(body["items"]) <= 2
+        seen += [user["id"] for user in body["items"]]
+
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) >= 4
+    assert len(seen) == len(set(seen))
+
+
+def test_invalid_cursor():
+    test_account.login()
+    response = client.get(
+        url=test_account.root_path + f"/{routes.MEMBERS}",
+        headers={"Authorization": f"Bearer {test_account.token}"},
+        params={"cursor": "not-a-cursor"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_patients_listed_per_account():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.PATIENTS}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+
+    response = client.post(
+        url=url,
+        headers=headers,
+        json={
+            "lastname": "dela cruz",
+            "firstname": "juan",
+            "birthdate": "1990-01-01",
+            "gender": "male",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    patient_id = response.json()["id"]
+
+    response = client.get(url=url, headers=headers, params={"limit": 200})
+    body = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert patient_id in [patient["id"] for patient in body["items"]]
+
+    response = client.get(url=f"{url}/{patient_id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    # Another account neither lists the patient nor reaches its resources.
+    other = new_account()
+    other_url = other.root_path + f"/{routes.PATIENTS}"
+    other_headers = {"Authorization": f"Bearer {other.token}"}
+
+    response = client.get(url=other_url, headers=other_headers, params={"limit": 200})
+    assert response.status_code == status.HTTP_200_OK
+    assert patient_id not in [patient["id"] for patient in response.json()["items"]]
+
+    response = client.get(url=f"{other_url}/{patient_id}", headers=other_headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    for resource in (routes.BODYWEIGHTS, routes.MEDICATIONS, routes.ALLERGY):
+        response = client.get(
+            url=f"{other_url}/{patient_id}/{resource}/", headers=other_headers
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response = client.get(url=f"{url}/{patient_id}/{resource}/", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    response = client.post(
+        url=f"{other_url}/{patient_id}/{routes.RECORDS}/",
+        headers=other_headers,
+        json={"chief_complaint": ["fever"]},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
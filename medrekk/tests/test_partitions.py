@@ -0,0 +1,95 @@
+from datetime import date
+
+from fastapi import status
+from sqlalchemy import text
+
+from medrekk.common.database.connection import SessionLocal
+from medrekk.common.database.partitions import (
+    add_months,
+    is_partition,
+    partition_name,
+)
+from medrekk.common.utils import routes
+from medrekk.tests.main import client, test_account
+
+
+def relations(plan: dict):
+    if "Relation Name" in plan:
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from relations(child)
+
+
+def test_partition_names():
+    assert add_months(date(2024, 11, 1), 3) == date(2025, 2, 1)
+    assert add_months(date(2024, 1, 1), -1) == date(2023, 12, 1)
+    name = partition_name("patient_heart_rate", date(2024, 3, 1))
+    assert name == "patient_heart_rate_p202403"
+    assert is_partition(name)
+    assert not is_partition("patient_heart_rate")
+
+
+def test_backdated_reading_and_pruning():
+    test_account.login()
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+    patients = test_account.root_path + f"/{routes.PATIENTS}"
+
+    patient_id = client.post(
+        url=patients,
+        headers=headers,
+        json={
+            "lastname": "ramos",
+            "firstname": "liza",
+            "birthdate": "1950-01-01",
+            "gender": "female",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    ).json()["id"]
+    record_id = client.post(
+        url=f"{patients}/{patient_id}/{routes.RECORDS}",
+        headers=headers,
+        json={"chief_complaint": ["fever"]},
+    ).json()["id"]
+    url = test_account.root_path + f"/{routes.RECORDS}/{record_id}/{routes.HEARTRATES}"
+
+    # From a paper chart: no partition is created this far back ahead of time.
+    response = client.post(
+        url=f"{url}/",
+        headers=headers,
+        json={"dt_measured": "1999-05-04T08:00:00", "heart_rate": 72},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    with SessionLocal() as db:
+        plan = db.execute(
+            text(
+                "EXPLAIN (FORMAT JSON) SELECT * FROM patient_heart_rate "
+                "WHERE record_id = :record_id "
+                "AND dt_measured >= '1999-05-01' AND dt_measured < '1999-05-08'"
+            ),
+            {"record_id": record_id},
+        ).scalar()
+
+    # Only the partition of May 1999 is scanned.
+    assert set(relations(plan[0]["Plan"])) == {"patient_heart_rate_p199905"}
+
+    # Another worker, or the CLI, archives the month this worker has cached.
+    with SessionLocal() as db:
+        db.execute(
+            text(
+                "ALTER TABLE patient_heart_rate "
+                "DETACH PARTITION patient_heart_rate_p199905"
+            )
+        )
+        db.execute(text("DROP TABLE patient_heart_rate_p199905"))
+        db.commit()
+
+    response = client.post(
+        url=f"{url}/",
+        headers=headers,
+        json={"dt_measured": "1999-05-11T08:00:00", "heart_rate": 70},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
@@ -0,0 +1,38 @@
+from fastapi import status
+
+from medrekk.common.utils import routes
+from medrekk.common.utils.text import normalize_name
+from medrekk.tests.main import client, test_account
+
+
+def test_normalize_name():
+    assert normalize_name("Peña,  José", None, "Dela-Cruz") == "pena jose dela cruz"
+    assert normalize_name("ÑIÑO") == normalize_name("nino")
+
+
+def test_search_patients():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.PATIENTS}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+
+    response = client.post(
+        url=url,
+        headers=headers,
+        json={
+            "lastname": "Peñaflorida",
+            "firstname": "José",
+            "birthdate": "1990-01-01",
+            "gender": "male",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    )
+    patient_id = response.json()["id"]
+
+    for q in ("penaflor", "PEÑAFLORIDA jose", "penaflorda"):
+        response = client.get(url=f"{url}/search", headers=headers, params={"q": q})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert patient_id in [patient["id"] for patient in response.json()]
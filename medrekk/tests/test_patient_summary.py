@@ -0,0 +1,49 @@
+from fastapi import status
+
+from medrekk.common.utils import routes
+from medrekk.tests.main import client, test_account
+
+
+def test_patient_summary():
+    test_account.login()
+    url = test_account.root_path + f"/{routes.PATIENTS}"
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+
+    response = client.post(
+        url=url,
+        headers=headers,
+        json={
+            "lastname": "reyes",
+            "firstname": "ana",
+            "birthdate": "1990-01-01",
+            "gender": "female",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    )
+    patient_id = response.json()["id"]
+
+    for day in range(1, 4):
+        client.post(
+            url=f"{url}/{patient_id}/{routes.BODYWEIGHTS}",
+            headers=headers,
+            json={"date_measured": f"2024-01-0{day}", "body_weight": 60 + day},
+        )
+
+    response = client.get(
+        url=f"{url}/{patient_id}/summary",
+        headers=headers,
+        params={"include": ["body_weights", "allergies"], "limit": 2},
+    )
+    body = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert body["profile"]["id"] == patient_id
+    assert [item["body_weight"] for item in body["body_weights"]] == [63, 62]
+    assert body["allergies"] == []
+    assert body["family_history"] is None
+
+    response = client.get(url=f"{url}/not-a-patient/summary", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
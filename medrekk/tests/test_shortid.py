@@ -0,0 +1,46 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from medrekk.common.utils.shortid import LEGACY_ALPHA, ShortID, id_gen, shortid
+
+PROCESSES = 16
+THREADS = 4
+IDS_PER_THREAD = 5000
+
+
+def generate(_) -> list:
+    with ThreadPoolExecutor(THREADS) as pool:
+        batches = pool.map(
+            lambda _: [shortid() for _ in range(IDS_PER_THREAD)], range(THREADS)
+        )
+    return [i for batch in batches for i in batch]
+
+
+def test_ids_unique_across_processes():
+    for method in ("spawn", "fork"):
+        context = multiprocessing.get_context(method)
+        with context.Pool(PROCESSES) as pool:
+            ids = [i for batch in pool.map(generate, range(PROCESSES)) for i in batch]
+
+        assert len(ids) == PROCESSES * THREADS * IDS_PER_THREAD
+        assert len(set(ids)) == len(ids)
+        assert len({len(i) for i in ids}) == 1
+
+
+def test_ids_increase_and_decode_to_timestamp():
+    ids = [shortid() for _ in range(10000)]
+    values = [id_gen._alpha_to_int(i) for i in ids]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    # As strings too, byte by byte like the "C" collation of the ID columns.
+    assert sorted(ids) == ids
+
+    now = datetime.now(timezone.utc)
+    assert now - id_gen.timestamp(ids[-1]) < timedelta(seconds=5)
+    # IDs from the time_ns() generator, and of the legacy alphabet, still decode.
+    legacy = ShortID(alpha=LEGACY_ALPHA)
+    old = legacy._int_to_alpha(1_700_000_000 * 10**9)
+    assert id_gen.timestamp(old).year == 2023
+    assert now - id_gen.timestamp(legacy.shortid()) < timedelta(seconds=5)
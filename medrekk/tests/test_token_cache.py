@@ -0,0 +1,98 @@
+import asyncio
+from time import sleep
+
+import fakeredis
+
+from medrekk.admin.db.token import TokenStorage
+from medrekk.common.utils.cache import TTLCache
+
+
+async def make_worker(server: fakeredis.FakeServer) -> TokenStorage:
+    store = TokenStorage(cache=TTLCache(maxsize=100, ttl=60))
+    await store.open(fakeredis.FakeAsyncRedis(server=server, decode_responses=True))
+    return store
+
+
+async def wait_for(condition, timeout: float = 5) -> bool:
+    for _ in range(int(timeout / 0.05)):
+        if condition():
+            return True
+        await asyncio.sleep(0.05)
+    return condition()
+
+
+def test_revocation_propagates_across_workers():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        worker_a = await make_worker(server)
+        worker_b = await make_worker(server)
+
+        try:
+            # Let both listeners subscribe before anything is published.
+            await asyncio.sleep(0.1)
+            await worker_a.set_token(jti="jti-1", aud="aud-1")
+
+            # First lookup on B goes to Redis, the second one is served locally.
+            assert await worker_b.get_token(jti="jti-1") == "aud-1"
+            assert await worker_b.get_token(jti="jti-1") == "aud-1"
+            assert worker_b.cache.hits == 1
+            assert worker_b.cache.misses == 1
+
+            # Logout on A must evict the token from B's cache, not only Redis.
+            await worker_a.remove_token(jti="jti-1")
+
+            assert await wait_for(lambda: worker_b.cache.invalidations == 1)
+            assert await worker_b.get_token(jti="jti-1") is None
+            assert await worker_a.get_token(jti="jti-1") is None
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    asyncio.run(scenario())
+
+
+def test_subscribed_cache_is_evicted_across_workers():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        ownership_a = TTLCache(maxsize=100, ttl=60)
+        ownership_b = TTLCache(maxsize=100, ttl=60)
+        worker_a = TokenStorage()
+        worker_b = TokenStorage()
+        for worker, cache in ((worker_a, ownership_a), (worker_b, ownership_b)):
+            worker.subscribe(
+                "ownership", cache, key=lambda data: tuple(data.split(","))
+            )
+            await worker.open(
+                fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+            )
+
+        try:
+            await asyncio.sleep(0.1)
+            ownership_b.set(("account-1", "record-1"), True)
+
+            # A record deleted on A is no longer owned on B.
+            await worker_a.db.publish("ownership", "account-1,record-1")
+
+            assert await wait_for(lambda: ownership_b.invalidations == 1)
+            assert ownership_b.get(("account-1", "record-1")) is None
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    asyncio.run(scenario())
+
+
+def test_cache_is_bounded_and_expires():
+    cache = TTLCache(maxsize=2, ttl=0.1)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    # "b" was the least recently used entry.
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.evictions == 1
+
+    sleep(0.15)
+    assert cache.get("a") is None
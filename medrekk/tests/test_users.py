@@ -1,5 +1,9 @@
-from fastapi import status
+import pytest
+from fastapi import HTTPException, status
 
+from medrekk.admin.controllers.users import update_user
+from medrekk.admin.schemas.accounts import UserUpdate
+from medrekk.common.database.connection import SessionLocal
 from medrekk.common.utils import routes, shortid
 from medrekk.tests.main import client, test_account, login
 
@@ -26,3 +30,24 @@ def test_create_user():
 
     assert body['access_token'] != None
     assert body['token_type'] == 'bearer'
+
+
+def test_update_user_without_fields():
+    data = {"username": f"{shortid()}@a.com", "password": "aaaa"}
+    test_account.login()
+    new_user = client.post(
+        url=test_account.root_path + f"/{routes.MEMBERS}",
+        headers={"Authorization": f"Bearer {test_account.token}"},
+        json=data,
+    ).json()
+
+    # No field set: the user is returned as is, no UPDATE is run.
+    with SessionLocal() as db:
+        user = update_user(
+            new_user["account_id"], new_user["id"], UserUpdate.model_construct(), db
+        )
+        assert user.username == data["username"]
+
+        with pytest.raises(HTTPException) as error:
+            update_user(new_user["account_id"], "0", UserUpdate.model_construct(), db)
+        assert error.value.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,87 @@
+from fastapi import status
+from sqlalchemy import text
+
+from medrekk.common.database.connection import SessionLocal
+from medrekk.common.utils import routes, shortid
+from medrekk.tests.main import client, test_account
+
+
+def test_bloodpressure_range_and_trend():
+    test_account.login()
+    headers = {"Authorization": f"Bearer {test_account.token}"}
+    patients = test_account.root_path + f"/{routes.PATIENTS}"
+
+    patient_id = client.post(
+        url=patients,
+        headers=headers,
+        json={
+            "lastname": "bautista",
+            "firstname": "mark",
+            "birthdate": "1990-01-01",
+            "gender": "male",
+            "address_province": "Cebu",
+            "address_city": "Cebu City",
+            "address_barangay": "Apas",
+            "address_line1": "string",
+        },
+    ).json()["id"]
+    record_id = client.post(
+        url=f"{patients}/{patient_id}/{routes.RECORDS}",
+        headers=headers,
+        json={"chief_complaint": ["hypertension"]},
+    ).json()["id"]
+
+    url = test_account.root_path + (
+        f"/{routes.RECORDS}/{record_id}/{routes.BLOODPRESSURES}"
+    )
+    # Every 30 minutes from 00:00 to 05:30.
+    readings = [
+        {
+            "dt_measured": f"2024-03-01T{i // 2:02d}:{i % 2 * 30:02d}:00",
+            "systolic": 110 + i,
+            "diastolic": 70,
+        }
+        for i in range(12)
+    ]
+    client.post(url=f"{url}:batch", headers=headers, json=readings)
+
+    response = client.get(
+        url=f"{url}/",
+        headers=headers,
+        params={"from": "2024-03-01T01:00:00", "to": "2024-03-01T02:00:00"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["systolic"] for item in response.json()["items"]] == [113, 112]
+
+    response = client.get(url=f"{url}/trend", headers=headers, params={"bucket": "1h"})
+    buckets = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(buckets) == 6
+    assert buckets[0]["count"] == 2
+    assert buckets[0]["values"]["systolic"] == {"min": 110, "max": 111, "avg": 110.5}
+
+    # The columns are nullable: a bucket of readings without values still
+    # aggregates, to nulls.
+    with SessionLocal() as db:
+        db.execute(
+            text(
+                "INSERT INTO patient_blood_pressure (id, record_id, dt_measured) "
+                "VALUES (:id, :record_id, '2024-03-01T08:00:00')"
+            ),
+            {"id": shortid(), "record_id": record_id},
+        )
+        db.commit()
+    response = client.get(url=f"{url}/trend", headers=headers, params={"bucket": "1h"})
+    buckets = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert buckets[-1]["count"] == 1
+    assert buckets[-1]["values"]["systolic"] == {"min": None, "max": None, "avg": None}
+
+    response = client.get(
+        url=f"{url}/trend",
+        headers=headers,
+        params={"from": "2024-03-02T00:00:00", "to": "2024-03-01T00:00:00"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST